@@ -0,0 +1,85 @@
+"""
+Measures how forecasting scales with the number of worker processes the players are sharded on.
+
+Usage:
+    python -m benchmarks.forecaster_scaling_benchmark --scale medium --workers 1 2 4 8
+    python -m benchmarks.forecaster_scaling_benchmark --output benchmarks/results/forecaster_scaling.json
+
+Every worker count forecasts the same synthetic league, and its projections are checked to be identical to
+the serial ones, in the same order.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from benchmarks.run_benchmarks import SCALES, build_league, measure
+
+
+def run(scale_name: str, worker_counts: list[int]) -> dict:
+    """
+    Forecasts the league with every worker count and summarizes the timings.
+    """
+
+    from src.infra.projections_model import PlayerWeeklyProjectionsForecasterService
+
+    scale = SCALES[scale_name]
+    league = build_league(scale)
+    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    week_matchups = [matchup for matchup in league["matchups"] if matchup.dateTimeUTC >= now]
+
+    serial_projections = None
+    results: dict[str, dict] = {}
+    for workers in worker_counts:
+        forecaster_service = PlayerWeeklyProjectionsForecasterService(workers=workers)
+        projections = [
+            dict(projection)
+            for projection in forecaster_service.execute(league["gamelogs"], week_matchups, league["players"])
+        ]
+        serial_projections = serial_projections or projections
+        result = measure(
+            lambda: forecaster_service.execute(league["gamelogs"], week_matchups, league["players"]),
+            scale["repeats"],
+        )
+        result["identical_to_serial"] = projections == serial_projections
+        result["speedup"] = results["workers=1"]["median"] / result["median"] if "workers=1" in results else 1.0
+        results[f"workers={workers}"] = result
+
+    return {
+        "metadata": {
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "scale": scale_name,
+            "cpus": os.cpu_count(),
+            "players": len(league["players"]),
+            "gamelogs": len(league["gamelogs"]),
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    # The serial run comes first, as the reference the others are checked and compared against
+    worker_counts = [1] + [workers for workers in args.workers if workers != 1]
+    results = run(args.scale, worker_counts)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    for name, result in results["results"].items():
+        print(
+            f"{name:<12} median {result['median']:.4f}s  speedup {result['speedup']:.2f}x"
+            + f"  identical {result['identical_to_serial']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Compares the flat and bucketed gamelog layouts on storage size, upserts and range scans.
+
+Usage:
+    python -m benchmarks.gamelog_storage_benchmark --scale medium --output benchmarks/results/gamelog_storage.json
+    python -m benchmarks.gamelog_storage_benchmark --mongo-url mongodb://localhost:27017
+
+Both layouts are loaded with the same synthetic league. Against a MongoDB server the sizes are the
+collections' collStats, i.e. the compressed storage and index sizes, otherwise the summed BSON size of the
+documents.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+import bson
+from benchmarks.mongo_stand_in import create_database, bind_repository
+from benchmarks.run_benchmarks import SCALES, build_league, measure
+
+
+def collection_size(database, name: str, is_mongodb: bool) -> dict:
+    """
+    Measures the size of a collection.
+    """
+
+    if is_mongodb:
+        stats = database.command("collStats", name)
+        return {
+            "documents": stats["count"],
+            "data_bytes": stats["size"],
+            "storage_bytes": stats["storageSize"],
+            "index_bytes": stats["totalIndexSize"],
+        }
+    documents = list(database[name].find())
+    return {"documents": len(documents), "data_bytes": sum(len(bson.encode(document)) for document in documents)}
+
+
+def run(scale_name: str, mongo_url: str = None) -> dict:
+    """
+    Loads the league in both layouts and measures them.
+    """
+
+    from src.infra.persistence.repositories import GamelogRepository, BucketedGamelogRepository
+
+    scale = SCALES[scale_name]
+    repeats = scale["repeats"]
+    league = build_league(scale)
+    database = create_database(mongo_url)
+    now = datetime.utcnow()
+    sample_player_id = league["players"][0].playerId
+
+    results: dict[str, dict] = {}
+    for storage, repository in (
+        ("flat", bind_repository(GamelogRepository(), database)),
+        ("bucketed", bind_repository(BucketedGamelogRepository(), database)),
+    ):
+        # Timed once, as mongomock upserts scan the collection and a flat upsert of a season takes minutes
+        results[f"{storage}.upsert_many"] = measure(lambda: repository.upsert_many(league["gamelogs"]), 1)
+        results[f"{storage}.get_all_between_dates(30 days)"] = measure(
+            lambda: repository.get_all_between_dates(now - timedelta(days=30), now, limit=None), repeats
+        )
+        results[f"{storage}.get_all_between_dates(365 days)"] = measure(
+            lambda: repository.get_all_between_dates(now - timedelta(days=365), now, limit=None), repeats
+        )
+        results[f"{storage}.get_all_by_player_id_and_season"] = measure(
+            lambda: repository.get_all_by_player_id_and_season(sample_player_id, league["season"]), repeats
+        )
+
+    sizes = {
+        "flat": collection_size(database, "gamelogs", mongo_url is not None),
+        "bucketed": collection_size(database, "gamelog_buckets", mongo_url is not None),
+    }
+    return {
+        "metadata": {
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "scale": scale_name,
+            "backend": "mongodb" if mongo_url else "mongomock",
+            "gamelogs": len(league["gamelogs"]),
+        },
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--mongo-url", default=None, help="Run against a MongoDB server instead of mongomock.")
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    results = run(args.scale, args.mongo_url)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    for storage, size in results["sizes"].items():
+        print(f"{storage:<10} {size['documents']:>8} documents {size['data_bytes'] / 1024:>10.1f} KiB")
+    for name, result in results["results"].items():
+        print(f"{name:<55} median {result['median']:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+"""
+Load tests the API with a mix of its production read traffic, and reports the throughput and latency
+percentiles of every route, so that capacity changes can be measured.
+
+Usage:
+    python -m benchmarks.load_test --scale medium --users 50 --duration 30
+    python -m benchmarks.load_test --mix players=1,gamelogs=6,schedules=3 --projections-job
+    python -m benchmarks.load_test --mongo-url mongodb://localhost:27017 --output benchmarks/results/load.json
+    python -m benchmarks.load_test --url http://localhost:8000 --users 200
+
+By default the app is served by uvicorn on a background thread, over the synthetic league seeded into mongomock
+or, with --mongo-url, into a MongoDB server, as the other benchmarks do. With --url an instance already running
+is load tested instead, over its own data, i.e. to measure several uvicorn workers.
+
+Every user sends requests one after the other, each to a route picked at random with the weights of --mix, so
+that once the app is saturated its latency grows rather than requests piling up in the load generator. The
+routes, their parameters and the league are drawn from --seed, so two runs send the same requests. With
+--projections-job the weekly projections job runs again and again during the test, as the write load the reads
+compete with in production.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+import httpx
+from benchmarks.run_benchmarks import SCALES, build_league, seed_database, bind_app
+from benchmarks.mongo_stand_in import create_database
+
+# Maps the names used in --mix to the route they request, and how the request's url is drawn
+TRAFFIC_ROUTES: dict[str, tuple[str, Callable[[random.Random, dict], str]]] = {
+    "players": ("GET /api/v1/players", lambda rng, targets: "/api/v1/players"),
+    "gamelogs": (
+        "GET /api/v1/players/{player_id}/gamelogs",
+        lambda rng, targets: f"/api/v1/players/{rng.choice(targets['player_ids'])}/gamelogs"
+        + (f"?season={targets['season']}" if targets["season"] is not None else ""),
+    ),
+    "schedules": (
+        "GET /api/v1/matchups/schedules?is_current_week",
+        lambda rng, targets: "/api/v1/matchups/schedules?is_current_week=true",
+    ),
+    "splits": (
+        "GET /api/v1/players/splits?last_games",
+        lambda rng, targets: "/api/v1/players/splits"
+        + f"?player_id={','.join(rng.sample(targets['player_ids'], min(13, len(targets['player_ids']))))}"
+        + "&last_games=10",
+    ),
+}
+DEFAULT_MIX = "players=2,gamelogs=5,schedules=3"
+PROJECTIONS_JOB = "POST /api/v1/players/projections"
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """
+    Parses a traffic mix, i.e. players=2,gamelogs=5,schedules=3, into the weight of every route.
+
+    :param mix str: The comma separated name=weight pairs, the names being keys of TRAFFIC_ROUTES.
+    :return: The weights by route name.
+    :rtype: dict[str, float]
+    """
+
+    weights: dict[str, float] = {}
+    for pair in mix.split(","):
+        name, _, weight = pair.partition("=")
+        if name.strip() not in TRAFFIC_ROUTES:
+            raise ValueError(f"Unknown route {name.strip()!r}, expected one of {', '.join(TRAFFIC_ROUTES)}")
+        weights[name.strip()] = float(weight or 1)
+    if not any(weight > 0 for weight in weights.values()):
+        raise ValueError("The traffic mix needs a route with a positive weight")
+    return weights
+
+
+@contextmanager
+def serve_app(database) -> Iterator[str]:
+    """
+    Serves the app bound to a database with uvicorn on a background thread, on a free local port.
+
+    :return: The base url of the app.
+    """
+
+    import uvicorn
+    from main import app
+
+    bind_app(app, database)
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port = free_socket.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="load-test-server", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("The app failed to start")
+        time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+async def _run_user(
+    client: httpx.AsyncClient,
+    rng: random.Random,
+    weights: dict[str, float],
+    targets: dict,
+    deadline: float,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+) -> None:
+    names = list(weights)
+    route_weights = list(weights.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, route_weights)[0]
+        url = TRAFFIC_ROUTES[name][1](rng, targets)
+        start = time.perf_counter()
+        try:
+            response = await client.get(url)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        latencies[name].append(time.perf_counter() - start)
+        if failed:
+            errors[name] += 1
+
+
+async def _run_projections_job(client: httpx.AsyncClient, deadline: float, durations: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            (await client.post("/api/v1/players/projections")).raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"Error running the projections job: {e}")
+            await asyncio.sleep(1)
+            continue
+        durations.append(time.perf_counter() - start)
+
+
+async def load_test(
+    base_url: str,
+    targets: dict,
+    weights: dict[str, float],
+    users: int,
+    duration: float,
+    seed: int,
+    projections_job: bool,
+) -> dict:
+    """
+    Sends the traffic mix from every user for the duration of the test.
+
+    :param base_url str: The base url of the app.
+    :param targets dict: The player ids and season requests are drawn from.
+    :param weights dict[str, float]: The weight of every route in the traffic mix.
+    :param users int: The number of concurrent users.
+    :param duration float: The seconds the test lasts.
+    :param seed int: The seed the users draw their requests from.
+    :param projections_job bool: Whether the projections job runs during the test.
+    :return: The throughput and latency percentiles of every route.
+    :rtype: dict
+    """
+
+    latencies: dict[str, list[float]] = {name: [] for name in weights}
+    errors: dict[str, int] = {name: 0 for name in weights}
+    job_durations: list[float] = []
+    limits = httpx.Limits(max_connections=users + 1, max_keepalive_connections=users + 1)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        # Untimed, so that the caches and indexes built on first use aren't in the percentiles
+        for name in weights:
+            await client.get(TRAFFIC_ROUTES[name][1](random.Random(seed), targets))
+
+        start = time.perf_counter()
+        deadline = start + duration
+        tasks = [
+            _run_user(client, random.Random(seed * 100_003 + user), weights, targets, deadline, latencies, errors)
+            for user in range(users)
+        ]
+        if projections_job:
+            tasks.append(_run_projections_job(client, deadline, job_durations))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    results = {TRAFFIC_ROUTES[name][0]: summarize(latencies[name], errors[name], elapsed) for name in weights}
+    results["all"] = summarize(
+        [latency for route_latencies in latencies.values() for latency in route_latencies],
+        sum(errors.values()),
+        elapsed,
+    )
+    if projections_job:
+        results[PROJECTIONS_JOB] = summarize(job_durations, 0, elapsed)
+    return results
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """
+    Summarizes the latencies of a route's requests, in seconds.
+
+    :param latencies list[float]: The latency of every request.
+    :param errors int: The number of failed requests.
+    :param elapsed float: The seconds the requests were sent over.
+    :return: The number of requests and errors, the requests per second, and the latency percentiles.
+    :rtype: dict
+    """
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput": len(ordered) / elapsed,
+        "p50": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1] if ordered else None,
+    }
+
+
+def percentile(ordered: list[float], percent: float) -> Optional[float]:
+    """
+    Gets a percentile of sorted values with the nearest-rank method, None if there are none.
+    """
+
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def _get_remote_targets(base_url: str) -> dict:
+    players = httpx.get(f"{base_url}/api/v1/players", timeout=120).raise_for_status().json()
+    return {"player_ids": [player["playerId"] for player in players], "season": None}
+
+
+def run(
+    scale_name: str,
+    weights: dict[str, float],
+    users: int,
+    duration: float,
+    seed: int,
+    projections_job: bool,
+    mongo_url: str = None,
+    url: str = None,
+) -> dict:
+    """
+    Seeds the league and load tests the app, or load tests an instance already running.
+    """
+
+    metadata = {
+        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "scale": scale_name,
+        "users": users,
+        "duration": duration,
+        "seed": seed,
+        "mix": weights,
+        "projections_job": projections_job,
+    }
+    if url is not None:
+        targets = _get_remote_targets(url)
+        results = asyncio.run(load_test(url, targets, weights, users, duration, seed, projections_job))
+        return {"metadata": {**metadata, "target": url}, "results": results}
+
+    league = build_league(SCALES[scale_name], seed)
+    database = create_database(mongo_url)
+    seed_database(database, league)
+    targets = {"player_ids": [player.playerId for player in league["players"]], "season": league["season"]}
+    with serve_app(database) as base_url:
+        results = asyncio.run(load_test(base_url, targets, weights, users, duration, seed, projections_job))
+    metadata.update(
+        {
+            "target": "mongodb" if mongo_url else "mongomock",
+            "players": len(league["players"]),
+            "gamelogs": len(league["gamelogs"]),
+        }
+    )
+    return {"metadata": metadata, "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--users", type=int, default=20, help="The number of concurrent users.")
+    parser.add_argument("--duration", type=float, default=15, help="The seconds the test lasts.")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"The route weights, {', '.join(TRAFFIC_ROUTES)}.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the league and the requests.")
+    parser.add_argument("--projections-job", action="store_true", help="Run the projections job during the test.")
+    parser.add_argument("--mongo-url", default=None, help="Seed a MongoDB server instead of mongomock.")
+    parser.add_argument("--url", default=None, help="Load test an instance already running, over its own data.")
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = run(
+        args.scale,
+        weights,
+        max(args.users, 1),
+        args.duration,
+        args.seed,
+        args.projections_job,
+        args.mongo_url,
+        args.url,
+    )
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    print(f"{'route':<48} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for name, result in results["results"].items():
+        if not result["requests"]:
+            print(f"{name:<48} {0:>8} {result['errors']:>6}")
+            continue
+        print(
+            f"{name:<48} {result['requests']:>8} {result['errors']:>6} {result['throughput']:>8.1f}"
+            + f" {result['p50'] * 1000:>8.1f} {result['p90'] * 1000:>8.1f} {result['p99'] * 1000:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
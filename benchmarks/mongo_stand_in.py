@@ -0,0 +1,51 @@
+from pymongo import MongoClient
+from pymongo.database import Database
+
+# Maps the collection attribute each repository reads from to the collection name in database.py
+REPOSITORY_COLLECTION_ATTRIBUTES: dict[str, str] = {
+    "_gamelogs_collection": "gamelogs",
+    "_gamelog_buckets_collection": "gamelog_buckets",
+    "_players_collection": "players",
+    "_scheduled_matchups_collection": "scheduled_matchups",
+    "_projections_collection": "projections",
+    "_teams_collection": "teams",
+    "_metadata_collection": "metadata",
+}
+
+
+def create_database(mongo_url: str = None, database_name: str = "player_stats_benchmark_db") -> Database:
+    """
+    Creates an empty database to run benchmarks against.
+
+    With no url an in-memory mongomock database is used, otherwise the database is created on the given
+    MongoDB server, i.e. a local mongod, and dropped first so that every run starts from the same state.
+
+    :param mongo_url str: The url of the MongoDB server to use.
+    :param database_name str: The name of the database to create.
+    :return: The database
+    :rtype: Database
+    """
+
+    if mongo_url is None:
+        import mongomock
+
+        return mongomock.MongoClient()[database_name]
+
+    client = MongoClient(mongo_url)
+    client.drop_database(database_name)
+    return client[database_name]
+
+
+def bind_repository(repository, database: Database):
+    """
+    Points a repository at the collections of the given database instead of the production database.
+
+    :param repository: The repository to rebind.
+    :param database Database: The database to bind the repository to.
+    :return: The rebound repository
+    """
+
+    for attribute, collection_name in REPOSITORY_COLLECTION_ATTRIBUTES.items():
+        if hasattr(repository, attribute):
+            setattr(repository, attribute, database[collection_name])
+    return repository
@@ -0,0 +1,388 @@
+"""
+Benchmarks the ingestion, forecasting and read paths of the API against synthetic league data.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scale small --output benchmarks/results/latest.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/baseline.json
+
+Results are written as JSON so that two runs can be compared with --compare, which exits with a non-zero
+status if any benchmark's median regressed by more than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+from benchmarks import synthetic_data
+from benchmarks.mongo_stand_in import create_database, bind_repository
+
+SCALES: dict[str, dict] = {
+    "small": {"players_per_team": 8, "days_played": 45, "repeats": 3, "boxscores": 10},
+    "medium": {"players_per_team": 13, "days_played": 90, "repeats": 3, "boxscores": 30},
+    "full": {"players_per_team": 15, "days_played": 165, "repeats": 5, "boxscores": 60},
+}
+
+
+def measure(function: Callable, repeats: int, setup: Callable = None) -> dict:
+    """
+    Times a function over several runs.
+
+    :param function Callable: The function to time.
+    :param repeats int: The number of timed runs.
+    :param setup Callable: An untimed function run before every timed run.
+    :return: Timing statistics in seconds
+    :rtype: dict
+    """
+
+    timings: list[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "repeats": repeats,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "max": max(timings),
+    }
+
+
+class FakeResponse:
+    """
+    Stands in for a requests.Response replaying a recorded payload.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.status_code = 200
+        self.headers = {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def record_boxscores(directory: Path, league: dict, count: int) -> None:
+    """
+    Records boxscore payloads of played games to disk in the NBA live boxscore format.
+    """
+
+    gamelogs_by_game: dict[str, list] = {}
+    for gamelog in league["gamelogs"]:
+        gamelogs_by_game.setdefault(gamelog.gameId, []).append(gamelog)
+
+    for matchup in league["played_matchups"][:count]:
+        boxscore = synthetic_data.generate_boxscore(gamelogs_by_game[matchup.gameId], matchup, league["players"])
+        (directory / f"boxscore_{matchup.gameId}.json").write_text(json.dumps(boxscore))
+
+
+def build_league(scale: dict, seed: int = 0) -> dict:
+    """
+    Generates a league whose season started days_played days ago and has a week of games left to forecast.
+    """
+
+    now = datetime.utcnow()
+    season_start = now - timedelta(days=scale["days_played"])
+    season = season_start.year if season_start.month >= 10 else season_start.year - 1
+    teams = synthetic_data.generate_teams()
+    players = synthetic_data.generate_players(teams, scale["players_per_team"], seed)
+    matchups = synthetic_data.generate_schedule(teams, season_start, scale["days_played"] + 8, seed)
+    now_string = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    played_matchups = [matchup for matchup in matchups if matchup.dateTimeUTC < now_string]
+    gamelogs = synthetic_data.generate_gamelogs(players, played_matchups, season, seed)
+    return {
+        "season": season,
+        "teams": teams,
+        "players": players,
+        "matchups": matchups,
+        "played_matchups": played_matchups,
+        "gamelogs": gamelogs,
+    }
+
+
+def seed_database(database, league: dict) -> None:
+    """
+    Inserts the synthetic league into the benchmark database.
+    """
+
+    database["teams"].insert_many([dict(team) for team in league["teams"]])
+    database["players"].insert_many([dict(player) for player in league["players"]])
+    database["scheduled_matchups"].insert_many([dict(matchup) for matchup in league["matchups"]])
+    database["gamelogs"].insert_many([dict(gamelog) for gamelog in league["gamelogs"]])
+
+
+def bind_app(app, database) -> None:
+    """
+    Overrides the repository providers of the app with repositories bound to the benchmark database.
+    """
+
+    from src.presentation import dependencies
+    from src.app.caching import ScheduleIndex
+    from src.app.caching.splits_index import SplitsIndex
+
+    for provider in (
+        dependencies.get_player_repository,
+        dependencies.get_team_repository,
+        dependencies.get_gamelog_repository,
+        dependencies.get_scheduled_matchup_repository,
+        dependencies.get_projection_repository,
+    ):
+        app.dependency_overrides[provider] = _provide(bind_repository(provider(), database))
+
+    scheduled_matchup_repository = app.dependency_overrides[dependencies.get_scheduled_matchup_repository]()
+    app.dependency_overrides[dependencies.get_schedule_index] = _provide(
+        ScheduleIndex(scheduled_matchup_repository.get_scheduled_matchups)
+    )
+    gamelog_repository = app.dependency_overrides[dependencies.get_gamelog_repository]()
+    app.dependency_overrides[dependencies.get_splits_index] = _provide(
+        SplitsIndex(
+            lambda: gamelog_repository.get_all_between_dates(
+                datetime.utcnow() - timedelta(days=365), datetime.utcnow(), limit=None
+            )
+        )
+    )
+
+
+def _provide(repository):
+    return lambda: repository
+
+
+def run(scale_name: str, mongo_url: str = None, boxscore_dir: str = None) -> dict:
+    """
+    Runs every benchmark and returns the results.
+    """
+
+    from src.infra.persistence.repositories import GamelogRepository, PlayerRepository, ScheduledMatchupRepository
+    from src.infra.projections_model import PlayerWeeklyProjectionsForecasterService, ProjectionsBacktester
+    from src.infra.external import GamelogsFetcher, SleeperPlayerIndex
+
+    scale = SCALES[scale_name]
+    repeats = scale["repeats"]
+    league = build_league(scale)
+    database = create_database(mongo_url)
+    seed_database(database, league)
+
+    results: dict[str, dict] = {}
+    now = datetime.utcnow()
+
+    # Gamelog range reads, as done by the projections job
+    gamelog_repository = bind_repository(GamelogRepository(), database)
+    results["gamelog_repository.get_all_between_dates"] = measure(
+        lambda: gamelog_repository.get_all_between_dates(now - timedelta(days=365), now), repeats
+    )
+
+    # Forecasting the upcoming week's games
+    gamelogs = gamelog_repository.get_all_between_dates(now - timedelta(days=365), now)
+    week_matchups = [
+        matchup for matchup in league["matchups"] if matchup.dateTimeUTC >= now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    ]
+    player_repository = bind_repository(PlayerRepository(), database)
+    players = player_repository.get_all()
+    forecaster_service = PlayerWeeklyProjectionsForecasterService()
+    results["forecaster_service.execute"] = measure(
+        lambda: forecaster_service.execute(gamelogs, week_matchups, players), repeats
+    )
+
+    # Incrementally forecasting after a single player's injury status changed
+    injured_players = [players[0].model_copy(update={"injuryStatus": "Out"})] + players[1:]
+    results["forecaster_service.execute_incremental"] = measure(
+        lambda: forecaster_service.execute_incremental(gamelogs, week_matchups, injured_players),
+        repeats,
+        setup=lambda: forecaster_service.commit_input_signatures(
+            forecaster_service.execute_incremental(gamelogs, week_matchups, players)[1]
+        ),
+    )
+
+    # Writing the forecasted projections to the players
+    projections = forecaster_service.execute(gamelogs, week_matchups, players)
+    results["player_repository.upsert_many_projections"] = measure(
+        lambda: player_repository.upsert_many_projections(projections),
+        repeats,
+        setup=lambda: database["players"].update_many({}, {"$set": {"currentWeekProjections": []}}),
+    )
+
+    # Syncing an unchanged schedule, as done by every scheduled matchups job between schedule changes
+    scheduled_matchup_repository = bind_repository(ScheduledMatchupRepository(), database)
+    scheduled_matchup_repository.sync_many(league["matchups"])
+    results["scheduled_matchup_repository.sync_many"] = measure(
+        lambda: scheduled_matchup_repository.sync_many(league["matchups"]), repeats
+    )
+
+    # Backtesting the projection model over every played game
+    projections_backtester = ProjectionsBacktester()
+    season_start = now - timedelta(days=scale["days_played"])
+    results["projections_backtester.execute"] = measure(
+        lambda: projections_backtester.execute(league["gamelogs"], season_start, now), repeats
+    )
+
+    # Parsing recorded boxscores into gamelog entities
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = Path(boxscore_dir) if boxscore_dir else Path(temporary_directory)
+        if boxscore_dir is None:
+            record_boxscores(directory, league, scale["boxscores"])
+        recorded_boxscores: dict[str, bytes] = {
+            path.stem.split("_", 1)[1]: path.read_bytes() for path in sorted(directory.glob("boxscore_*.json"))
+        }
+        sleeper_payload = json.dumps(synthetic_data.generate_sleeper_players(league["players"])).encode()
+
+        def _replay(url, *args, **kwargs):
+            if "sleeper" in url:
+                return FakeResponse(sleeper_payload)
+            game_id = url.rsplit("_", 1)[1].split(".")[0]
+            return FakeResponse(recorded_boxscores[game_id])
+
+        game_ids = {game_id: True for game_id in recorded_boxscores}
+        sleeper_player_index = bind_repository(
+            SleeperPlayerIndex(path=str(Path(temporary_directory) / "sleeper_player_index.json")), database
+        )
+        gamelogs_fetcher = GamelogsFetcher(sleeper_player_index)
+        with mock.patch("requests.get", side_effect=_replay), mock.patch("time.sleep"):
+            # Downloading and indexing Sleeper's players dump, as done once per max age rather than per job
+            results["sleeper_player_index.refresh"] = measure(sleeper_player_index.refresh, repeats)
+            results["gamelogs_fetcher.get_new_gamelogs"] = measure(
+                lambda: gamelogs_fetcher.get_new_gamelogs(game_ids), repeats
+            )
+        results["gamelogs_fetcher.get_new_gamelogs"]["games"] = len(game_ids)
+
+    # Read routes served through the ASGI app
+    from fastapi.testclient import TestClient
+    from main import app
+
+    bind_app(app, database)
+    client = TestClient(app)
+    sample_player_id = league["players"][0].playerId
+    roster_player_ids = [player.playerId for player in league["players"][:13]]
+    routes: dict[str, str] = {
+        "GET /api/v1/players": "/api/v1/players",
+        "GET /api/v1/players/{player_id}/gamelogs": f"/api/v1/players/{sample_player_id}/gamelogs"
+        + f"?season={league['season']}",
+        "GET /api/v1/players/gamelogs/batch": "/api/v1/players/gamelogs/batch"
+        + f"?player_id={','.join(roster_player_ids)}&season={league['season']}&last_n=10",
+        "GET /api/v1/players/splits?last_days": "/api/v1/players/splits?last_days=14",
+        "GET /api/v1/players/splits?last_games": "/api/v1/players/splits"
+        + f"?player_id={','.join(roster_player_ids)}&last_games=10",
+        "GET /api/v1/matchups/schedules": "/api/v1/matchups/schedules",
+        "GET /api/v1/matchups/schedules?is_current_week": "/api/v1/matchups/schedules?is_current_week=true",
+        "GET /api/v1/matchups/schedules/team-weeks": "/api/v1/matchups/schedules/team-weeks?weeks=4",
+    }
+    for name, url in routes.items():
+        response = client.get(url)
+        response.raise_for_status()
+        results[name] = measure(lambda: client.get(url), repeats)
+        results[name]["response_bytes"] = len(response.content)
+
+    # The player gamelogs route without its cache, as every request read them before
+    from src.app.caching import BoundedCache
+    from src.presentation import dependencies
+
+    app.dependency_overrides[dependencies.get_player_gamelogs_cache] = _provide(BoundedCache(max_entries=0))
+    name = "GET /api/v1/players/{player_id}/gamelogs (uncached)"
+    results[name] = measure(lambda: client.get(routes["GET /api/v1/players/{player_id}/gamelogs"]), repeats)
+    del app.dependency_overrides[dependencies.get_player_gamelogs_cache]
+
+    # Hot read routes served from the snapshots published by the write jobs
+    from src.infra.snapshots import SnapshotStore
+    from src.presentation.snapshots import snapshot_publisher
+
+    snapshot_routes: dict[str, str] = {
+        "GET /api/v1/players (snapshot)": "/api/v1/players",
+        "GET /api/v1/matchups/schedules (snapshot)": "/api/v1/matchups/schedules",
+    }
+    with tempfile.TemporaryDirectory() as snapshots_directory, mock.patch.dict(
+        os.environ, {"SNAPSHOTS_ENABLED": "true"}
+    ), mock.patch.object(snapshot_publisher, "_snapshot_store", SnapshotStore(snapshots_directory)):
+        for name, url in snapshot_routes.items():
+            client.get(url).raise_for_status()  # Publishes the snapshot
+            response = client.get(url, headers={"Accept-Encoding": "br"})
+            results[name] = measure(lambda: client.get(url, headers={"Accept-Encoding": "br"}), repeats)
+            results[name]["response_bytes"] = int(response.headers["content-length"])
+
+    return {
+        "metadata": {
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale_name,
+            "backend": "mongodb" if mongo_url else "mongomock",
+            "players": len(league["players"]),
+            "gamelogs": len(league["gamelogs"]),
+            "matchups": len(league["matchups"]),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compares the medians of two benchmark runs.
+
+    :return: The names of the benchmarks whose median regressed by more than the threshold.
+    :rtype: list[str]
+    """
+
+    regressions: list[str] = []
+    print(f"{'benchmark':<55} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            print(f"{name:<55} {'-':>10} {result['median']:>10.4f} {'new':>7}")
+            continue
+        ratio = result["median"] / baseline_result["median"] if baseline_result["median"] else float("inf")
+        flag = " REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<55} {baseline_result['median']:>10.4f} {result['median']:>10.4f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--mongo-url", default=None, help="Run against a MongoDB server instead of mongomock.")
+    parser.add_argument("--boxscore-dir", default=None, help="A directory of recorded boxscore_<gameId>.json files.")
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    parser.add_argument("--compare", default=None, help="A previous results file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown, i.e. 0.2 for 20%%.")
+    args = parser.parse_args()
+
+    current = run(args.scale, args.mongo_url, args.boxscore_dir)
+
+    output = Path(
+        args.output
+        or os.path.join("benchmarks", "results", f"{current['metadata']['timestamp'].replace(':', '')}.json")
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2))
+    print(f"Wrote {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        return 1 if compare(current, baseline, args.threshold) else 0
+
+    for name, result in current["results"].items():
+        print(f"{name:<55} median {result['median']:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
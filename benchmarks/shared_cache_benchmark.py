@@ -0,0 +1,111 @@
+"""
+Measures the memory the workers of a host hold for the splits index, with and without the shared cache.
+
+Usage:
+    python -m benchmarks.shared_cache_benchmark --scale medium --workers 4
+    python -m benchmarks.shared_cache_benchmark --output benchmarks/results/shared_cache.json
+
+Every worker is forked from a process holding the league's gamelogs and answers a splits query. Without the
+shared cache each worker builds its own index; with it one worker builds and publishes the index and the
+others map it. The memory of a worker is read from /proc/self/smaps_rollup before and after, as its private
+memory, which no other process shares, and its proportional set size, which splits shared pages evenly
+between the processes mapping them.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from benchmarks.run_benchmarks import SCALES, build_league
+
+_league: dict = None  # Set before the workers fork, so they inherit it
+
+
+def read_memory() -> dict:
+    """
+    Reads the private and proportional memory of the process, in bytes.
+    """
+
+    fields: dict[str, int] = {}
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0]) * 1024
+    return {"private_bytes": fields["Private_Clean"] + fields["Private_Dirty"], "pss_bytes": fields["Pss"]}
+
+
+def _run_worker(arguments: tuple) -> dict:
+    from src.app.caching.splits_index import SplitsIndex
+    from src.infra.shared_cache import MappedFileCache
+
+    shared_directory, builds = arguments
+    before = read_memory()
+    shared_cache = MappedFileCache(shared_directory) if shared_directory else None
+    splits_index = SplitsIndex(lambda: _league["gamelogs"], shared_cache=shared_cache)
+    if builds:
+        splits_index.refresh()
+    splits_index.get_splits(last_games=10)
+    after = read_memory()
+    return {name: after[name] - before[name] for name in before}
+
+
+def run(scale_name: str, workers: int) -> dict:
+    """
+    Answers a splits query on every worker, with and without the shared cache.
+    """
+
+    global _league
+    _league = build_league(SCALES[scale_name])
+    context = multiprocessing.get_context("fork")
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as shared_directory:
+        for mode, directory in (("private", None), ("shared", shared_directory)):
+            worker_memory: list[dict] = []
+            # The first worker builds the index, then the others start, as they would after the ingest
+            with context.Pool(1) as pool:
+                worker_memory += pool.map(_run_worker, [(directory, True)])
+            with context.Pool(workers - 1) as pool:
+                worker_memory += pool.map(_run_worker, [(directory, directory is None)] * (workers - 1))
+            results[mode] = {
+                "workers": worker_memory,
+                "total_private_bytes": sum(memory["private_bytes"] for memory in worker_memory),
+                "total_pss_bytes": sum(memory["pss_bytes"] for memory in worker_memory),
+            }
+
+    return {
+        "metadata": {
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "scale": scale_name,
+            "workers": workers,
+            "gamelogs": len(_league["gamelogs"]),
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    results = run(args.scale, max(args.workers, 2))
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    for mode, result in results["results"].items():
+        print(
+            f"{mode:<8} private {result['total_private_bytes'] / 1024:>9.1f} KiB"
+            + f"  pss {result['total_pss_bytes'] / 1024:>9.1f} KiB"
+            + f"  across {results['metadata']['workers']} workers"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
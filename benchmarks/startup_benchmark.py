@@ -0,0 +1,78 @@
+"""
+Measures how long a fresh worker takes to import the app and which heavy modules it loads on the way.
+
+Usage:
+    python -m benchmarks.startup_benchmark --repeats 10 --output benchmarks/results/startup.json
+
+Every run imports main in a new interpreter, as a gunicorn worker does on boot, and reports the import
+time, the peak resident memory and whether pandas, numpy, BeautifulSoup, nba_api or a MongoDB client were
+loaded before the first request.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES: tuple[str, ...] = ("pandas", "numpy", "bs4", "nba_api", "requests")
+
+PROBE = f"""
+import json, resource, sys, time
+start = time.perf_counter()
+import main
+seconds = time.perf_counter() - start
+from src.infra.persistence import database
+print(json.dumps({{
+    "seconds": seconds,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy_modules_loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+    "mongo_client_created": database.get_client.cache_info().currsize > 0,
+}}))
+"""
+
+
+def run(repeats: int) -> dict:
+    """
+    Imports the app in fresh interpreters and summarizes the results.
+    """
+
+    probes: list[dict] = []
+    for _ in range(repeats):
+        output = subprocess.check_output([sys.executable, "-c", PROBE], text=True)
+        probes.append(json.loads(output.strip().splitlines()[-1]))
+
+    seconds = [probe["seconds"] for probe in probes]
+    return {
+        "results": {
+            "import main": {
+                "repeats": repeats,
+                "min": min(seconds),
+                "median": statistics.median(seconds),
+                "mean": statistics.fmean(seconds),
+                "max": max(seconds),
+                "max_rss_kb": max(probe["max_rss_kb"] for probe in probes),
+                "heavy_modules_loaded": probes[-1]["heavy_modules_loaded"],
+                "mongo_client_created": probes[-1]["mongo_client_created"],
+            }
+        }
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    results = run(args.repeats)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
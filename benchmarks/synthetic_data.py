@@ -0,0 +1,322 @@
+import random
+from datetime import datetime, timedelta
+from src.domain.entities import TeamEntity, PlayerEntity, ScheduledMatchupEntity, GamelogEntity
+from src.infra.external.teams_fetcher import TeamsFetcher
+
+POSITIONS: list[str] = ["PG", "SG", "SF", "PF", "C"]
+
+
+def generate_teams() -> list[TeamEntity]:
+    """
+    Generates the 30 NBA teams.
+
+    :return: A list of team entities
+    :rtype: list[TeamEntity]
+    """
+
+    return TeamsFetcher().execute()
+
+
+def generate_players(teams: list[TeamEntity], players_per_team: int, seed: int = 0) -> list[PlayerEntity]:
+    """
+    Generates a synthetic player pool with a depth chart for every team.
+
+    :param teams list[TeamEntity]: The teams to generate rosters for.
+    :param players_per_team int: The number of players on each roster.
+    :param seed int: The seed for the random number generator.
+    :return: A list of player entities sorted by their points league ranking
+    :rtype: list[PlayerEntity]
+    """
+
+    rng = random.Random(seed)
+    players: list[PlayerEntity] = []
+    for team_index, team in enumerate(teams):
+        for roster_index in range(players_per_team):
+            position = POSITIONS[roster_index % len(POSITIONS)]
+            players.append(
+                PlayerEntity(
+                    playerId=str(1_000_000 + team_index * 100 + roster_index),
+                    rotowireId=str(rng.randint(1000, 9999)),
+                    firstName=f"First{team_index}x{roster_index}",
+                    lastName=f"Last{team_index}x{roster_index}",
+                    fantasyPositions=[position],
+                    position=position,
+                    team=team,
+                    height=rng.randint(72, 87),
+                    weight=rng.randint(170, 280),
+                    age=rng.randint(19, 38),
+                    currentWeekProjections=[],
+                    depthChartOrder=roster_index // len(POSITIONS) + 1,
+                    injuryStatus="Out" if rng.random() < 0.05 else None,
+                    recentNews=None,
+                    fantasyOutlook=None,
+                    jerseyNumber=roster_index,
+                    seasonProjections=None,
+                    seasonTotals=None,
+                    dropCount=None,
+                    addCount=None,
+                )
+            )
+
+    rankings = list(range(1, len(players) + 1))
+    rng.shuffle(rankings)
+    for player, ranking in zip(players, rankings):
+        player.seasonProjections = {
+            "pointsLeagueRanking": ranking,
+            "categoryLeagueRanking": ranking,
+            "gamesPlayed": 70,
+            "minutes": 30.0,
+            "fieldGoalPercentage": 0.47,
+            "threesMade": 120,
+            "points": 1200,
+            "steals": 70,
+            "blocks": 40,
+            "assists": 300,
+            "rebounds": 400,
+            "turnovers": 150,
+            "freeThrowPercentage": 0.78,
+        }
+    return players
+
+
+def generate_schedule(
+    teams: list[TeamEntity], season_start: datetime, days: int, seed: int = 0
+) -> list[ScheduledMatchupEntity]:
+    """
+    Generates a schedule where about half the league plays on any given day.
+
+    :param teams list[TeamEntity]: The teams to schedule games for.
+    :param season_start datetime: The date of the first games.
+    :param days int: The number of days the schedule spans.
+    :param seed int: The seed for the random number generator.
+    :return: A list of scheduled matchups sorted by date
+    :rtype: list[ScheduledMatchupEntity]
+    """
+
+    rng = random.Random(seed)
+    matchups: list[ScheduledMatchupEntity] = []
+    game_number = 1
+    for day in range(days):
+        game_datetime = (season_start + timedelta(days=day)).replace(hour=0, minute=30, second=0, microsecond=0)
+        day_teams = rng.sample(teams, k=len(teams) // 2 if day % 2 == 0 else len(teams) // 3 * 2)
+        for home_team, away_team in zip(day_teams[::2], day_teams[1::2]):
+            matchups.append(
+                ScheduledMatchupEntity(
+                    gameId=f"002{season_start.year % 100:02d}{game_number:05d}",
+                    dateTimeUTC=game_datetime.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    homeTeam=home_team,
+                    awayTeam=away_team,
+                )
+            )
+            game_number += 1
+    return matchups
+
+
+def generate_gamelogs(
+    players: list[PlayerEntity], matchups: list[ScheduledMatchupEntity], season: int, seed: int = 0
+) -> list[GamelogEntity]:
+    """
+    Generates a gamelog for every rostered player in every given matchup.
+
+    :param players list[PlayerEntity]: The player pool.
+    :param matchups list[ScheduledMatchupEntity]: The games that have been played.
+    :param season int: The season the games belong to.
+    :param seed int: The seed for the random number generator.
+    :return: A list of gamelog entities
+    :rtype: list[GamelogEntity]
+    """
+
+    rng = random.Random(seed)
+    rosters: dict[str, list[PlayerEntity]] = {}
+    for player in players:
+        rosters.setdefault(player.team.teamId, []).append(player)
+
+    gamelogs: list[GamelogEntity] = []
+    for matchup in matchups:
+        home_score = rng.randint(90, 135)
+        away_score = rng.randint(90, 135)
+        for player_team, opposing_team, is_home_game in (
+            (matchup.homeTeam, matchup.awayTeam, True),
+            (matchup.awayTeam, matchup.homeTeam, False),
+        ):
+            for player in rosters.get(player_team.teamId, []):
+                gamelogs.append(
+                    generate_gamelog(
+                        rng,
+                        player,
+                        matchup,
+                        season,
+                        player_team,
+                        opposing_team,
+                        is_home_game,
+                        home_score if is_home_game else away_score,
+                        away_score if is_home_game else home_score,
+                    )
+                )
+    return gamelogs
+
+
+def generate_gamelog(
+    rng: random.Random,
+    player: PlayerEntity,
+    matchup: ScheduledMatchupEntity,
+    season: int,
+    player_team: TeamEntity,
+    opposing_team: TeamEntity,
+    is_home_game: bool,
+    player_team_score: int,
+    opposing_team_score: int,
+) -> GamelogEntity:
+    """
+    Generates a single plausible box score line for a player.
+    """
+
+    is_starter = player.depthChartOrder == 1
+    minutes = max(0.0, rng.gauss(32 if is_starter else 18, 5))
+    field_goals_attempted = int(minutes * rng.uniform(0.25, 0.6))
+    field_goals_made = int(field_goals_attempted * rng.uniform(0.35, 0.6))
+    threes_attempted = int(field_goals_attempted * rng.uniform(0.1, 0.5))
+    threes_made = min(field_goals_made, int(threes_attempted * rng.uniform(0.25, 0.45)))
+    free_throws_attempted = int(minutes * rng.uniform(0.0, 0.25))
+    free_throws_made = int(free_throws_attempted * rng.uniform(0.6, 0.9))
+    rebounds_offensive = int(minutes * rng.uniform(0.0, 0.1))
+    rebounds_defensive = int(minutes * rng.uniform(0.05, 0.3))
+    return GamelogEntity(
+        gameId=matchup.gameId,
+        season=season,
+        dateUTC=matchup.dateTimeUTC,
+        playerId=player.playerId,
+        playerTeam=player_team,
+        isHomeGame=is_home_game,
+        isActive=rng.random() > 0.05,
+        isRegularSeasonGame=True,
+        opposingTeam=opposing_team,
+        playerTeamScore=player_team_score,
+        opposingTeamScore=opposing_team_score,
+        position=player.position,
+        isStarter=is_starter,
+        minutes=minutes,
+        points=2 * field_goals_made + threes_made + free_throws_made,
+        fieldGoalsMade=field_goals_made,
+        fieldGoalsAttempted=field_goals_attempted,
+        threesMade=threes_made,
+        threesAttempted=threes_attempted,
+        freeThrowsMade=free_throws_made,
+        freeThrowsAttempted=free_throws_attempted,
+        reboundsOffensive=rebounds_offensive,
+        reboundsDefensive=rebounds_defensive,
+        reboundsTotal=rebounds_offensive + rebounds_defensive,
+        assists=int(minutes * rng.uniform(0.0, 0.3)),
+        steals=int(minutes * rng.uniform(0.0, 0.06)),
+        blocks=int(minutes * rng.uniform(0.0, 0.05)),
+        turnovers=int(minutes * rng.uniform(0.0, 0.1)),
+        fouls=rng.randint(0, 6),
+        plusMinus=player_team_score - opposing_team_score,
+    )
+
+
+def generate_sleeper_players(players: list[PlayerEntity]) -> dict[str, dict]:
+    """
+    Generates a payload shaped like Sleeper's https://api.sleeper.app/v1/players/nba response.
+
+    :param players list[PlayerEntity]: The player pool.
+    :return: A dictionary mapping Sleeper player ids to Sleeper player data
+    :rtype: dict[str, dict]
+    """
+
+    return {
+        str(index): {
+            "player_id": str(index),
+            "first_name": player.firstName,
+            "last_name": player.lastName,
+            "full_name": f"{player.firstName} {player.lastName}",
+            "status": "ACT",
+            "position": player.position,
+            "fantasy_positions": player.fantasyPositions,
+            "team": player.team.abbreviation,
+            "depth_chart_order": player.depthChartOrder,
+            "injury_status": player.injuryStatus,
+            "rotowire_id": player.rotowireId,
+            "height": str(player.height),
+            "weight": str(player.weight),
+            "age": player.age,
+            "number": player.jerseyNumber,
+        }
+        for index, player in enumerate(players)
+    }
+
+
+def generate_boxscore(
+    gamelogs: list[GamelogEntity], matchup: ScheduledMatchupEntity, players: list[PlayerEntity]
+) -> dict:
+    """
+    Generates a payload shaped like the NBA's live boxscore feed,
+    https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{game_id}.json, for a played matchup.
+
+    :param gamelogs list[GamelogEntity]: The gamelogs of the matchup.
+    :param matchup ScheduledMatchupEntity: The matchup to build the boxscore for.
+    :param players list[PlayerEntity]: The player pool.
+    :return: The boxscore payload
+    :rtype: dict
+    """
+
+    players_dict: dict[str, PlayerEntity] = {player.playerId: player for player in players}
+
+    def _team(team: TeamEntity, score: int) -> dict:
+        team_players = []
+        for gamelog in gamelogs:
+            if gamelog.playerTeam.teamId != team.teamId:
+                continue
+            player = players_dict[gamelog.playerId]
+            whole_minutes = int(gamelog.minutes)
+            seconds = (gamelog.minutes - whole_minutes) * 60
+            team_player = {
+                "personId": int(gamelog.playerId),
+                "firstName": player.firstName,
+                "familyName": player.lastName,
+                "starter": "1" if gamelog.isStarter else "0",
+                "statistics": {
+                    "minutes": f"PT{whole_minutes:02d}M{seconds:05.2f}S",
+                    "points": gamelog.points,
+                    "fieldGoalsMade": gamelog.fieldGoalsMade,
+                    "fieldGoalsAttempted": gamelog.fieldGoalsAttempted,
+                    "threePointersMade": gamelog.threesMade,
+                    "threePointersAttempted": gamelog.threesAttempted,
+                    "freeThrowsMade": gamelog.freeThrowsMade,
+                    "freeThrowsAttempted": gamelog.freeThrowsAttempted,
+                    "reboundsOffensive": gamelog.reboundsOffensive,
+                    "reboundsDefensive": gamelog.reboundsDefensive,
+                    "reboundsTotal": gamelog.reboundsTotal,
+                    "assists": gamelog.assists,
+                    "steals": gamelog.steals,
+                    "blocks": gamelog.blocks,
+                    "turnovers": gamelog.turnovers,
+                    "foulsPersonal": gamelog.fouls,
+                    "plusMinusPoints": gamelog.plusMinus,
+                },
+            }
+            if not gamelog.isActive:
+                team_player["notPlayingReason"] = "INACTIVE_INJURY"
+            team_players.append(team_player)
+
+        return {
+            "teamId": int(team.teamId),
+            "teamName": team.name,
+            "teamCity": team.location,
+            "teamTricode": team.abbreviation,
+            "score": score,
+            "players": team_players,
+        }
+
+    home_gamelog = next(gamelog for gamelog in gamelogs if gamelog.playerTeam.teamId == matchup.homeTeam.teamId)
+    return {
+        "game": {
+            "gameId": matchup.gameId,
+            "gameTimeUTC": matchup.dateTimeUTC,
+            "gameStatus": 3,
+            "period": 4,
+            "gameClock": "PT00M00.00S",
+            "homeTeam": _team(matchup.homeTeam, home_gamelog.playerTeamScore),
+            "awayTeam": _team(matchup.awayTeam, home_gamelog.opposingTeamScore),
+        }
+    }
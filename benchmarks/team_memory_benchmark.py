@@ -0,0 +1,129 @@
+"""
+Measures the memory held by gamelog and player lists read from the database with and without interned teams.
+
+Usage:
+    python -m benchmarks.team_memory_benchmark --scale medium
+    python -m benchmarks.team_memory_benchmark --output benchmarks/results/team_memory.json
+
+Each load is traced with tracemalloc, once with the team registry interning teams and once with it building
+a new TeamEntity for every team it is given, as the repositories did before. The retained size is what the
+loaded list still holds once it is built, the peak size includes the documents it was built from.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+from benchmarks.mongo_stand_in import create_database, bind_repository
+from benchmarks.run_benchmarks import SCALES, build_league, seed_database
+
+
+def trace_memory(load: Callable) -> dict:
+    """
+    Traces the memory allocated by a load and still held by its result.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = load()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"items": len(result), "retained_bytes": retained, "peak_bytes": peak}
+
+
+def _copy_team(team):
+    """
+    Stands in for TeamRegistry.intern, building a new team every time like the repositories did before.
+    """
+
+    from src.domain.entities import TeamEntity
+
+    if team is None:
+        return None
+    return TeamEntity(**(team if isinstance(team, dict) else team.__dict__))
+
+
+def run(scale_name: str) -> dict:
+    """
+    Loads the league's gamelogs and players, with their week's projections, with and without interned teams.
+    """
+
+    from src.app.caching import team_registry
+    from src.infra.persistence.repositories import GamelogRepository, PlayerRepository, ScheduledMatchupRepository
+    from src.infra.projections_model import PlayerWeeklyProjectionsForecasterService
+
+    scale = SCALES[scale_name]
+    league = build_league(scale)
+    database = create_database()
+    seed_database(database, league)
+    gamelog_repository = bind_repository(GamelogRepository(), database)
+    player_repository = bind_repository(PlayerRepository(), database)
+    scheduled_matchup_repository = bind_repository(ScheduledMatchupRepository(), database)
+    forecaster_service = PlayerWeeklyProjectionsForecasterService()
+    now = datetime.utcnow()
+    week_matchups = [
+        matchup for matchup in league["matchups"] if matchup.dateTimeUTC >= now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    ]
+    player_repository.upsert_many_projections(
+        forecaster_service.execute(league["gamelogs"], week_matchups, league["players"])
+    )
+
+    loads: dict[str, Callable] = {
+        "gamelog_repository.get_all_between_dates(365 days)": lambda: gamelog_repository.get_all_between_dates(
+            now - timedelta(days=365), now, limit=None
+        ),
+        "player_repository.get_all": player_repository.get_all,
+        "scheduled_matchup_repository.get_scheduled_matchups": scheduled_matchup_repository.get_scheduled_matchups,
+    }
+
+    results: dict[str, dict] = {}
+    for name, load in loads.items():
+        with mock.patch.object(team_registry, "intern", side_effect=_copy_team):
+            before = trace_memory(load)
+        after = trace_memory(load)
+        results[name] = {
+            "before": before,
+            "after": after,
+            "retained_reduction": 1 - after["retained_bytes"] / before["retained_bytes"],
+        }
+
+    return {
+        "metadata": {
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "scale": scale_name,
+            "gamelogs": len(league["gamelogs"]),
+            "interned_teams": len(team_registry),
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--output", default=None, help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    results = run(args.scale)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    for name, result in results["results"].items():
+        print(
+            f"{name:<52} retained {result['before']['retained_bytes'] / 1024:>9.1f} KiB"
+            + f" -> {result['after']['retained_bytes'] / 1024:>9.1f} KiB ({result['retained_reduction']:.0%} less)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,38 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from src.presentation.middleware import RequestTimingMiddleware
+from src.presentation.live_projections import live_projections_enabled, live_projections_worker
+from src.presentation.cache_invalidation import change_streams_enabled, cache_invalidation_worker
 from src.presentation.routes import (
     teams_router,
     players_router,
-    scheduled_matchups_router
+    scheduled_matchups_router,
+    metrics_router,
+    profiles_router,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Poll the in-progress games, in one worker of the host, and stream their projections at
+    # /api/v1/players/projections/live from every worker
+    if live_projections_enabled():
+        live_projections_worker.start()
+    # Invalidate the caches when another instance changes their data, rather than when they expire
+    if change_streams_enabled():
+        cache_invalidation_worker.start()
+    yield
+    await live_projections_worker.stop()
+    cache_invalidation_worker.stop()
+
+
 app = FastAPI(
     title="Draftbash-Players-API",
     description="API for NBA player stats.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -22,6 +44,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record the latency of every request, exposed at /metrics
+app.add_middleware(RequestTimingMiddleware)
+
 
 @app.get("/")
 async def main():
@@ -37,3 +62,5 @@ async def main():
 app.include_router(players_router)
 app.include_router(teams_router)
 app.include_router(scheduled_matchups_router)
+app.include_router(metrics_router)
+app.include_router(profiles_router)
@@ -0,0 +1,4 @@
+from src.app.caching.bounded_cache import BoundedCache
+from src.app.caching.schedule_index import ScheduleIndex
+from src.app.caching.team_registry import TeamRegistry, team_registry
+from src.app.caching.invalidation_bus import InvalidationBus, invalidation_bus
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from src.app.monitoring import metrics_registry
+
+cache_lookups_total = metrics_registry.counter(
+    "cache_lookups_total", "Number of lookups of a named cache, by hit or miss.", ("cache", "result")
+)
+cache_evictions_total = metrics_registry.counter(
+    "cache_evictions_total",
+    "Number of values removed from a named cache, by capacity, expired or invalidated.",
+    ("cache", "reason"),
+)
+
+
+class BoundedCache:
+    """
+    A thread-safe cache holding at most max_entries values, evicting the least recently used one first.
+
+    The cache can also be bounded by the total size of its values, measured with len(), i.e. for serialized
+    bytes, and by their age, for values that may change without the cache being told. Lookups and evictions
+    of a named cache are counted in the process's metrics, see stats() for the cache's own counts.
+
+    :param max_entries int: The maximum number of cached values.
+    :param max_bytes int: The maximum total size of the cached values, unbounded by default.
+    :param max_age_seconds float: How long a value is cached, forever by default.
+    :param name str: The name of the cache in the metrics, unreported by default.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        name: Optional[str] = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_age_seconds = max_age_seconds
+        self._name = name
+        self._values: OrderedDict = OrderedDict()  # Maps keys to (value, size, time cached)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets a cached value and marks it as the most recently used.
+
+        :param key Hashable: The key of the value.
+        :param default Any: What to return when the key isn't cached.
+        :return: The cached value, or the default.
+        """
+
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and self._max_age_seconds is not None:
+                if time.monotonic() - entry[2] > self._max_age_seconds:
+                    self._remove(key, "expired")
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                self._count_lookup("miss")
+                return default
+            self.hits += 1
+            self._count_lookup("hit")
+            self._values.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Caches a value, evicting the least recently used values beyond max_entries or max_bytes. A value larger
+        than max_bytes on its own isn't cached.
+
+        :param key Hashable: The key of the value.
+        :param value Any: The value to cache.
+        """
+
+        size = len(value) if self._max_bytes is not None else 0
+        with self._lock:
+            if key in self._values:
+                self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            self._values[key] = (value, size, time.monotonic())
+            self._size += size
+            while len(self._values) > self._max_entries or (
+                self._max_bytes is not None and self._size > self._max_bytes
+            ):
+                self._remove(next(iter(self._values)), "capacity")
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Invalidates a cached value, i.e. once the data it was computed from changed.
+
+        :param key Hashable: The key of the value.
+        :return: Whether the key was cached.
+        :rtype: bool
+        """
+
+        with self._lock:
+            if key not in self._values:
+                return False
+            self._remove(key, "invalidated")
+            return True
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Invalidates the cached values whose keys match a predicate, i.e. every season of a player.
+
+        :param predicate Callable: Tells whether a key is invalidated.
+        :return: The number of values invalidated.
+        :rtype: int
+        """
+
+        with self._lock:
+            keys = [key for key in self._values if predicate(key)]
+            for key in keys:
+                self._remove(key, "invalidated")
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Gets the cache's size and counts of lookups and evictions since it was created.
+
+        :return: The number of entries and their total size, and the hits, misses, evictions and invalidations.
+        :rtype: dict
+        """
+
+        with self._lock:
+            return {
+                "entries": len(self._values),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable, reason: Optional[str] = None) -> None:
+        _, size, _ = self._values.pop(key)
+        self._size -= size
+        if reason == "invalidated":
+            self.invalidations += 1
+        elif reason is not None:
+            self.evictions += 1
+        if reason is not None and self._name is not None:
+            cache_evictions_total.inc(self._name, reason)
+
+    def _count_lookup(self, result: str) -> None:
+        if self._name is not None:
+            cache_lookups_total.inc(self._name, result)
@@ -0,0 +1,51 @@
+import threading
+from typing import Callable
+from src.domain.value_objects import CacheInvalidation
+
+
+class InvalidationBus:
+    """
+    Delivers the invalidations of the data changed by any instance, i.e. as watched on MongoDB's change
+    streams, to the process's caches that derive from that data.
+
+    Subscribers are called in order on the publishing thread, and one failing doesn't keep the others from
+    being called.
+    """
+
+    def __init__(self):
+        self._subscribers: list[Callable[[CacheInvalidation], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber: Callable[[CacheInvalidation], None]) -> None:
+        """
+        Registers a cache's invalidation handler.
+
+        :param subscriber Callable: Called with every invalidation.
+        """
+
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Callable[[CacheInvalidation], None]) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, invalidation: CacheInvalidation) -> None:
+        """
+        Delivers an invalidation to every subscriber.
+
+        :param invalidation CacheInvalidation: The data that changed.
+        """
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber(invalidation)
+            except Exception as e:
+                print(f"Error invalidating a cache: {e}")
+
+
+# The process's invalidation bus
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,178 @@
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, date, timedelta
+from typing import Callable
+from src.domain.entities import ScheduledMatchupEntity, TeamEntity
+
+# NBA games tip off between 16:00 and 03:30 UTC, so shifting by 6 hours puts every game on its US calendar day
+GAME_DAY_OFFSET: timedelta = timedelta(hours=6)
+
+
+class _Snapshot:
+    """
+    An immutable view of the schedule, swapped in whole on refresh so readers never see a partial index.
+    """
+
+    def __init__(self, scheduled_matchups: list[ScheduledMatchupEntity]):
+        self.matchups: list[ScheduledMatchupEntity] = sorted(
+            scheduled_matchups, key=lambda matchup: (matchup.dateTimeUTC, matchup.gameId)
+        )
+        self.start_times: list[datetime] = [_parse_date_time(matchup.dateTimeUTC) for matchup in self.matchups]
+        self.team_matchups: dict[str, list[ScheduledMatchupEntity]] = {}
+        self.team_start_times: dict[str, list[datetime]] = {}
+        self.date_matchups: dict[date, list[ScheduledMatchupEntity]] = {}
+        self.teams: dict[str, TeamEntity] = {}
+        for matchup, start_time in zip(self.matchups, self.start_times):
+            for team in (matchup.homeTeam, matchup.awayTeam):
+                self.teams[team.teamId] = team
+                self.team_matchups.setdefault(team.teamId, []).append(matchup)
+                self.team_start_times.setdefault(team.teamId, []).append(start_time)
+            self.date_matchups.setdefault(game_day(start_time), []).append(matchup)
+
+
+class ScheduleIndex:
+    """
+    An in-memory index of the season's schedule, mapping each team to its games in order and each day to its
+    games, so range lookups are bisections instead of scans or database queries.
+
+    The schedule is loaded on first use, reloaded once it is older than max_age_seconds so that processes
+    which didn't run the upsert eventually see it, and refreshed right away by refresh().
+
+    :param load_matchups Callable: Loads every scheduled matchup of the season.
+    :param max_age_seconds float: How long a loaded schedule is used before it is reloaded.
+    """
+
+    def __init__(self, load_matchups: Callable[[], list[ScheduledMatchupEntity]], max_age_seconds: float = 3600):
+        self._load_matchups = load_matchups
+        self._max_age_seconds = max_age_seconds
+        self._snapshot: _Snapshot = None
+        self._loaded_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Reloads the schedule, i.e. after the scheduled matchups were upserted.
+        """
+
+        snapshot = _Snapshot(self._load_matchups())
+        with self._lock:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+
+    def expire(self) -> None:
+        """
+        Marks the schedule as outdated, i.e. after another instance upserted the scheduled matchups, so that
+        it is reloaded on next use.
+        """
+
+        with self._lock:
+            self._loaded_at = float("-inf")
+
+    def get_all(self) -> list[ScheduledMatchupEntity]:
+        """
+        Gets every game of the season.
+
+        :return: The games, in order of start time.
+        :rtype: list[ScheduledMatchupEntity]
+        """
+
+        return list(self._get_snapshot().matchups)
+
+    def get_between_dates(self, start_date: datetime, end_date: datetime) -> list[ScheduledMatchupEntity]:
+        """
+        Gets the games starting within a date range.
+
+        :param start_date datetime: The start of the range (inclusive).
+        :param end_date datetime: The end of the range (exclusive).
+        :return: The games, in order of start time.
+        :rtype: list[ScheduledMatchupEntity]
+        """
+
+        snapshot = self._get_snapshot()
+        start, end = _bisect_range(snapshot.start_times, start_date, end_date)
+        return snapshot.matchups[start:end]
+
+    def get_team_games_between_dates(
+        self, team_id: str, start_date: datetime, end_date: datetime
+    ) -> list[ScheduledMatchupEntity]:
+        """
+        Gets a team's games starting within a date range.
+
+        :param team_id str: The id of the team.
+        :param start_date datetime: The start of the range (inclusive).
+        :param end_date datetime: The end of the range (exclusive).
+        :return: The team's games, in order of start time.
+        :rtype: list[ScheduledMatchupEntity]
+        """
+
+        snapshot = self._get_snapshot()
+        start, end = _bisect_range(snapshot.team_start_times.get(team_id, []), start_date, end_date)
+        return snapshot.team_matchups.get(team_id, [])[start:end]
+
+    def get_games_on_day(self, day: date) -> list[ScheduledMatchupEntity]:
+        """
+        Gets the games of a US calendar day.
+
+        :param day date: The day.
+        :return: The day's games, in order of start time.
+        :rtype: list[ScheduledMatchupEntity]
+        """
+
+        return self._get_snapshot().date_matchups.get(day, [])
+
+    def get_teams(self) -> list[TeamEntity]:
+        """
+        Gets the teams playing in the season.
+
+        :return: The teams, by abbreviation.
+        :rtype: list[TeamEntity]
+        """
+
+        return sorted(self._get_snapshot().teams.values(), key=lambda team: team.abbreviation)
+
+    def get_team_game_days(self, start_day: date, end_day: date) -> dict[str, list[date]]:
+        """
+        Gets the US calendar days every team plays on within a range of days.
+
+        :param start_day date: The first day of the range (inclusive).
+        :param end_day date: The last day of the range (exclusive).
+        :return: The days each team plays on, in order, by team id.
+        :rtype: dict[str, list[date]]
+        """
+
+        snapshot = self._get_snapshot()
+        start_date = datetime.combine(start_day, datetime.min.time()) + GAME_DAY_OFFSET
+        end_date = datetime.combine(end_day, datetime.min.time()) + GAME_DAY_OFFSET
+        team_game_days: dict[str, list[date]] = {}
+        for team_id, start_times in snapshot.team_start_times.items():
+            start, end = _bisect_range(start_times, start_date, end_date)
+            team_game_days[team_id] = [game_day(start_time) for start_time in start_times[start:end]]
+        return team_game_days
+
+    def _get_snapshot(self) -> _Snapshot:
+        if self._snapshot is None or time.monotonic() - self._loaded_at > self._max_age_seconds:
+            self.refresh()
+        return self._snapshot
+
+
+def game_day(start_time: datetime) -> date:
+    """
+    Gets the US calendar day of a game from its UTC start time.
+    """
+
+    return (start_time - GAME_DAY_OFFSET).date()
+
+
+def _parse_date_time(date_time_utc: str) -> datetime:
+    return datetime.strptime(date_time_utc, "%Y-%m-%dT%H:%M:%SZ")
+
+
+def _bisect_range(start_times: list[datetime], start_date: datetime, end_date: datetime) -> tuple[int, int]:
+    return bisect_left(start_times, _to_naive_utc(start_date)), bisect_left(start_times, _to_naive_utc(end_date))
+
+
+def _to_naive_utc(date_time: datetime) -> datetime:
+    if date_time.tzinfo is None:
+        return date_time
+    return (date_time - date_time.utcoffset()).replace(tzinfo=None)
@@ -0,0 +1,331 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+import numpy as np
+from src.domain.entities import GamelogEntity
+from src.domain.value_objects import PlayerSplit
+from src.interfaces.caching import ISharedCache, SharedSnapshot
+
+# The stats of a gamelog that splits average, in the order of the columns of the cumulative sums
+SPLIT_STATS: tuple[str, ...] = (
+    "minutes",
+    "points",
+    "fieldGoalsMade",
+    "fieldGoalsAttempted",
+    "threesMade",
+    "threesAttempted",
+    "freeThrowsMade",
+    "freeThrowsAttempted",
+    "reboundsOffensive",
+    "reboundsDefensive",
+    "reboundsTotal",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+    "plusMinus",
+)
+_STAT_COLUMNS: dict[str, int] = {stat: column for column, stat in enumerate(SPLIT_STATS)}
+
+# The shooting percentages of a split, with the made and attempted stats they are computed from
+SPLIT_PERCENTAGES: dict[str, tuple[str, str]] = {
+    "fieldGoalPercentage": ("fieldGoalsMade", "fieldGoalsAttempted"),
+    "threePointPercentage": ("threesMade", "threesAttempted"),
+    "freeThrowPercentage": ("freeThrowsMade", "freeThrowsAttempted"),
+}
+SHARED_CACHE_ENTRY = "splits"
+
+
+class _Splits:
+    """
+    Every player's games in one dense layout: the games are grouped by player and ordered by date, the games of
+    the player at position p are the rows offsets[p] to offsets[p + 1], and the row i of cumulative_stats holds
+    the totals of the first i games, so the totals of any of a player's windows are a single subtraction.
+
+    Immutable once built, an update builds a new one, so readers never see a partially updated index. The
+    arrays are either the process's own or read-only views of a version published to a shared cache.
+    """
+
+    def __init__(
+        self,
+        player_ids: list[str],
+        arrays: dict[str, np.ndarray],
+        built_at: float,
+        version: Optional[int] = None,
+    ):
+        self.player_ids = player_ids
+        self.player_positions: dict[str, int] = {player_id: position for position, player_id in enumerate(player_ids)}
+        self.arrays = arrays
+        self.offsets: np.ndarray = arrays["offsets"]
+        self.game_ids: np.ndarray = arrays["gameIds"]
+        self.dates: np.ndarray = arrays["dates"]
+        self.stats: np.ndarray = arrays["stats"]
+        self.cumulative_stats: np.ndarray = arrays["cumulativeStats"]
+        self.built_at = built_at
+        self.version = version
+
+    @classmethod
+    def build(
+        cls, player_ids: list[str], player_positions: np.ndarray, game_ids: np.ndarray, dates: np.ndarray, stats
+    ) -> "_Splits":
+        """
+        Builds the layout from games in any order, given as the position of their player in player_ids, their
+        ids, dates and stats.
+        """
+
+        order = np.lexsort((game_ids, dates, player_positions))
+        stats = np.asarray(stats, dtype=np.float64).reshape(-1, len(SPLIT_STATS))[order]
+        cumulative_stats = np.zeros((len(order) + 1, len(SPLIT_STATS)))
+        np.cumsum(stats, axis=0, out=cumulative_stats[1:])
+        games_per_player = np.bincount(player_positions, minlength=len(player_ids))
+        offsets = np.concatenate(([0], np.cumsum(games_per_player))).astype(np.int64)
+        arrays = {
+            "offsets": offsets,
+            "gameIds": game_ids[order],
+            "dates": dates[order],
+            "stats": stats,
+            "cumulativeStats": cumulative_stats,
+        }
+        return cls(player_ids, arrays, time.time())
+
+    @classmethod
+    def from_shared_snapshot(cls, snapshot: SharedSnapshot) -> "_Splits":
+        return cls(snapshot.metadata["playerIds"], snapshot.arrays, snapshot.metadata["builtAt"], snapshot.version)
+
+    def window(
+        self, position: int, start_date: Optional[bytes], end_date: Optional[bytes], last_games: Optional[int]
+    ) -> tuple[int, int]:
+        """
+        Finds a player's games within a date range, narrowed down to the last of them, as the rows of the first
+        game and of the game after the last.
+        """
+
+        first, last = self.offsets[position], self.offsets[position + 1]
+        dates = self.dates[first:last]
+        start = int(np.searchsorted(dates, start_date)) if start_date is not None else 0
+        end = int(np.searchsorted(dates, end_date)) if end_date is not None else len(dates)
+        if last_games is not None:
+            start = max(start, end - last_games)
+        return first + start, first + end
+
+
+class SplitsIndex:
+    """
+    An in-memory index of every player's recent games, answering split averages, i.e. over the last 7 days or
+    the last 10 games, without reading or averaging gamelogs per request.
+
+    Each player's games are sorted once and their stats summed cumulatively, so the averages of any window of
+    consecutive games take a bisection to find the window and a subtraction of two rows to total it, however
+    many games it spans.
+
+    The gamelogs are loaded on first use and reloaded once they are older than max_age_seconds, so that
+    processes which didn't run the ingest eventually see the new games. update() adds freshly ingested games
+    right away, without reading the other players' games again.
+
+    With a shared cache, the index is published to it whenever it is loaded or updated, and every process
+    reads the latest version from it instead of holding its own copy or loading the gamelogs itself.
+
+    :param load_gamelogs Callable: Loads the gamelogs to index, i.e. those of the past year.
+    :param max_age_seconds float: How long loaded gamelogs are used before they are reloaded.
+    :param shared_cache ISharedCache: The cache the index is shared through by the workers, if any.
+    """
+
+    def __init__(
+        self,
+        load_gamelogs: Callable[[], list[GamelogEntity]],
+        max_age_seconds: float = 6 * 3600,
+        shared_cache: Optional[ISharedCache] = None,
+    ):
+        self._load_gamelogs = load_gamelogs
+        self._max_age_seconds = max_age_seconds
+        self._shared_cache = shared_cache
+        self._splits: _Splits = None
+        self._expired_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Reloads and indexes every gamelog.
+        """
+
+        gamelogs = [gamelog for gamelog in self._load_gamelogs() if gamelog.isActive]
+        player_ids = list(dict.fromkeys(gamelog.playerId for gamelog in gamelogs))
+        player_positions = {player_id: position for position, player_id in enumerate(player_ids)}
+        splits = _Splits.build(
+            player_ids,
+            np.array([player_positions[gamelog.playerId] for gamelog in gamelogs], dtype=np.int64),
+            _to_bytes_array([gamelog.gameId for gamelog in gamelogs]),
+            _to_bytes_array([gamelog.dateUTC for gamelog in gamelogs]),
+            [getattr(gamelog, stat) for gamelog in gamelogs for stat in SPLIT_STATS],
+        )
+        with self._lock:
+            self._swap(splits)
+
+    def update(self, gamelogs: Iterable[GamelogEntity]) -> None:
+        """
+        Adds or replaces games, i.e. the gamelogs of an ingest. Does nothing before the index is first loaded,
+        as the load reads the games anyway.
+
+        :param gamelogs Iterable[GamelogEntity]: The gamelogs to add or replace.
+        """
+
+        with self._lock:
+            splits = self._current_splits()
+            if splits is None:
+                return
+            gamelogs = list(gamelogs)
+            player_ids = list(splits.player_ids)
+            player_positions = dict(splits.player_positions)
+            for gamelog in gamelogs:
+                if gamelog.playerId not in player_positions:
+                    player_positions[gamelog.playerId] = len(player_ids)
+                    player_ids.append(gamelog.playerId)
+
+            # The games being replaced or no longer active are dropped, only among the updated players' rows
+            kept_rows = np.ones(len(splits.game_ids), dtype=bool)
+            updated_game_ids: dict[int, set[bytes]] = {}
+            for gamelog in gamelogs:
+                updated_game_ids.setdefault(player_positions[gamelog.playerId], set()).add(gamelog.gameId.encode())
+            for position, game_ids in updated_game_ids.items():
+                if position < len(splits.player_ids):
+                    first, last = splits.offsets[position], splits.offsets[position + 1]
+                    kept_rows[first:last] = ~np.isin(splits.game_ids[first:last], list(game_ids))
+
+            active_gamelogs = [gamelog for gamelog in gamelogs if gamelog.isActive]
+            row_positions = np.repeat(np.arange(len(splits.player_ids)), np.diff(splits.offsets))
+            self._swap(
+                _Splits.build(
+                    player_ids,
+                    np.concatenate(
+                        (
+                            row_positions[kept_rows],
+                            np.array([player_positions[gamelog.playerId] for gamelog in active_gamelogs], np.int64),
+                        )
+                    ),
+                    np.concatenate(
+                        (splits.game_ids[kept_rows], _to_bytes_array([gamelog.gameId for gamelog in active_gamelogs]))
+                    ),
+                    np.concatenate(
+                        (splits.dates[kept_rows], _to_bytes_array([gamelog.dateUTC for gamelog in active_gamelogs]))
+                    ),
+                    np.concatenate(
+                        (
+                            splits.stats[kept_rows].ravel(),
+                            [getattr(gamelog, stat) for gamelog in active_gamelogs for stat in SPLIT_STATS],
+                        )
+                    ),
+                )
+            )
+
+    def expire(self) -> None:
+        """
+        Marks the index as outdated, i.e. after another instance upserted gamelogs, so that it is reloaded on
+        next use, unless another process sharing it reloaded it since.
+        """
+
+        with self._lock:
+            self._expired_at = time.time()
+
+    def get_splits(
+        self,
+        player_ids: Optional[list[str]] = None,
+        last_games: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[PlayerSplit]:
+        """
+        Gets the split averages of players over their last games or over a date range.
+
+        :param player_ids list[str]: The players, or None for every player with games within the window.
+        :param last_games int: The number of most recent games within the date range to average.
+        :param start_date datetime: The start of the date range (inclusive), or None for the first game indexed.
+        :param end_date datetime: The end of the date range (exclusive), or None for the last game indexed.
+        :return: The splits, in order of the players given or of player id.
+        :rtype: list[PlayerSplit]
+        """
+
+        splits = self._get_splits()
+        start_date_utc = _format_date(start_date).encode() if start_date is not None else None
+        end_date_utc = _format_date(end_date).encode() if end_date is not None else None
+
+        player_splits: list[PlayerSplit] = []
+        for player_id in player_ids if player_ids is not None else sorted(splits.player_ids):
+            position = splits.player_positions.get(player_id)
+            start, end = (0, 0)
+            if position is not None:
+                start, end = splits.window(position, start_date_utc, end_date_utc, last_games)
+            if start >= end:
+                if player_ids is not None:
+                    player_splits.append(PlayerSplit(playerId=player_id, gamesPlayed=0))
+                continue
+            player_splits.append(_split(player_id, splits, start, end))
+        return player_splits
+
+    def _get_splits(self) -> _Splits:
+        with self._lock:
+            splits = self._current_splits()
+        if (
+            splits is None
+            or splits.built_at < self._expired_at
+            or time.time() - splits.built_at > self._max_age_seconds
+        ):
+            self.refresh()
+            with self._lock:
+                splits = self._splits
+        return splits
+
+    def _current_splits(self) -> Optional[_Splits]:
+        """
+        Gets the index, switching to the latest version of the shared cache if another process published one.
+        """
+
+        if self._shared_cache is not None:
+            snapshot = self._shared_cache.get(SHARED_CACHE_ENTRY)
+            if snapshot is not None and (self._splits is None or self._splits.version != snapshot.version):
+                self._splits = _Splits.from_shared_snapshot(snapshot)
+        return self._splits
+
+    def _swap(self, splits: _Splits) -> None:
+        if self._shared_cache is not None:
+            self._shared_cache.publish(
+                SHARED_CACHE_ENTRY, splits.arrays, {"playerIds": splits.player_ids, "builtAt": splits.built_at}
+            )
+            # The published version replaces the process's own arrays, so the process holds no copy of its own
+            snapshot = self._shared_cache.get(SHARED_CACHE_ENTRY)
+            if snapshot is not None:
+                splits = _Splits.from_shared_snapshot(snapshot)
+        self._splits = splits
+
+
+def _split(player_id: str, splits: _Splits, start: int, end: int) -> PlayerSplit:
+    """
+    Averages the games start to end (exclusive) of a player from the difference of their running totals.
+    """
+
+    games_played = end - start
+    totals: np.ndarray = splits.cumulative_stats[end] - splits.cumulative_stats[start]
+    percentages: dict[str, Optional[float]] = {}
+    for percentage, (made, attempted) in SPLIT_PERCENTAGES.items():
+        attempts = totals[_STAT_COLUMNS[attempted]]
+        percentages[percentage] = round(totals[_STAT_COLUMNS[made]] / attempts, 3) if attempts > 0 else None
+    return PlayerSplit(
+        playerId=player_id,
+        gamesPlayed=games_played,
+        firstGameDateUTC=splits.dates[start].decode(),
+        lastGameDateUTC=splits.dates[end - 1].decode(),
+        averages={stat: round(float(total) / games_played, 2) for stat, total in zip(SPLIT_STATS, totals)},
+        **percentages,
+    )
+
+
+def _to_bytes_array(values: list[str]) -> np.ndarray:
+    # Fixed width bytes, which numpy sorts and bisects, and which can be shared as raw memory unlike objects
+    return np.array([value.encode() for value in values], dtype=bytes)
+
+
+def _format_date(date_time: datetime) -> str:
+    if date_time.tzinfo is not None:
+        date_time = (date_time - date_time.utcoffset()).replace(tzinfo=None)
+    return date_time.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,86 @@
+from typing import Iterable, Optional, Union
+from src.domain.entities import TeamEntity
+
+# The fields that make up a team, and the key it is interned by
+TEAM_FIELDS: tuple[str, ...] = ("teamId", "abbreviation", "location", "name")
+
+
+class TeamRegistry:
+    """
+    Interns TeamEntity instances, so the entities the fetchers, repositories and forecaster build all refer to
+    one shared instance per team instead of each allocating their own, i.e. two per gamelog and projection.
+
+    Teams are interned by all of their fields rather than by id alone, so a team whose details changed, i.e.
+    after a relocation, is never swapped for the outdated one. TeamEntity is frozen, which keeps the shared
+    instances from being modified through any of the entities referring to them.
+    """
+
+    def __init__(self):
+        self._teams: dict[tuple, TeamEntity] = {}
+        self._teams_by_id: dict[str, TeamEntity] = {}
+
+    def seed(self, teams: Iterable[TeamEntity]) -> list[TeamEntity]:
+        """
+        Registers the teams, i.e. the ones fetched by the teams fetcher.
+
+        :param teams Iterable[TeamEntity]: The teams to register.
+        :return: The interned teams.
+        :rtype: list[TeamEntity]
+        """
+
+        return [self.intern(team) for team in teams]
+
+    def intern(self, team: Union[TeamEntity, dict, None]) -> Optional[TeamEntity]:
+        """
+        Gets the shared instance of a team, registering it if it wasn't seen before.
+
+        :param team Union[TeamEntity, dict, None]: The team, or its fields as read from the database.
+        :return: The shared instance of the team, or None if there is no team.
+        :rtype: Optional[TeamEntity]
+        """
+
+        if team is None:
+            return None
+        fields = team if isinstance(team, dict) else team.__dict__
+        key = tuple(fields[field] for field in TEAM_FIELDS)
+        interned: Optional[TeamEntity] = self._teams.get(key)
+        if interned is None:
+            interned = team if isinstance(team, TeamEntity) else TeamEntity(**team)
+            # setdefault keeps the instance registered first when two threads intern the same team at once
+            interned = self._teams.setdefault(key, interned)
+            self._teams_by_id[interned.teamId] = interned
+        return interned
+
+    def intern_fields(self, document: dict, fields: Iterable[str]) -> dict:
+        """
+        Replaces the teams of a document read from the database with their shared instances, before an entity is
+        built from it.
+
+        :param document dict: The document, i.e. a gamelog.
+        :param fields Iterable[str]: The fields of the document holding teams, i.e. playerTeam and opposingTeam.
+        :return: The document itself.
+        :rtype: dict
+        """
+
+        for field in fields:
+            if field in document:
+                document[field] = self.intern(document[field])
+        return document
+
+    def resolve(self, team_id: str) -> Optional[TeamEntity]:
+        """
+        Gets the most recently registered team with the given id.
+
+        :param team_id str: The id of the team.
+        :return: The team, or None if no team with the id was registered.
+        :rtype: Optional[TeamEntity]
+        """
+
+        return self._teams_by_id.get(team_id)
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+
+# The process's team registry
+team_registry = TeamRegistry()
@@ -0,0 +1,2 @@
+from src.app.monitoring.metrics import metrics_registry, MetricsRegistry, Histogram, Counter
+from src.app.monitoring.tracing import trace_stage
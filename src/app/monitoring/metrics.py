@@ -0,0 +1,153 @@
+import threading
+from bisect import bisect_left
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Histogram:
+    """
+    A Prometheus style histogram of observations, i.e. durations, partitioned by label values.
+
+    :param name str: The metric name.
+    :param description str: The help text of the metric.
+    :param label_names tuple[str]: The names of the labels observations are partitioned by.
+    :param buckets tuple[float]: The upper bounds of the histogram buckets.
+    """
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...], buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, list] = {}  # Maps label values to [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Records an observation.
+
+        :param value float: The observed value.
+        :param label_values str: The label values, in the order of the label names.
+        """
+
+        bucket_index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            if bucket_index < len(self.buckets):
+                series[0][bucket_index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        """
+        Renders the histogram in the Prometheus text exposition format.
+
+        :return: The lines of the rendered histogram.
+        :rtype: list[str]
+        """
+
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series_items = [(labels, (list(s[0]), s[1], s[2])) for labels, s in self._series.items()]
+
+        for label_values, (bucket_counts, total, count) in sorted(series_items):
+            labels = _format_labels(self.label_names, label_values)
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative_count += bucket_count
+                lines.append(
+                    f'{self.name}_bucket{{{labels}{"," if labels else ""}le="{upper_bound}"}} {cumulative_count}'
+                )
+            lines.append(f'{self.name}_bucket{{{labels}{"," if labels else ""}le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {count}")
+        return lines
+
+
+class Counter:
+    """
+    A Prometheus style monotonically increasing counter partitioned by label values.
+
+    :param name str: The metric name.
+    :param description str: The help text of the metric.
+    :param label_names tuple[str]: The names of the labels the counter is partitioned by.
+    """
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{{{_format_labels(self.label_names, label_values)}}} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds the process's metrics and renders them for scraping.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self, name: str, description: str, label_names: tuple[str, ...], buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        """
+        Gets the histogram with the given name, creating it if it doesn't exist yet.
+        """
+
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, description, label_names, buckets)
+            return self._metrics[name]
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...]) -> Counter:
+        """
+        Gets the counter with the given name, creating it if it doesn't exist yet.
+        """
+
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, description, label_names)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        :return: The metrics page.
+        :rtype: str
+        """
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple) -> str:
+    formatted_labels = []
+    for name, value in zip(label_names, label_values):
+        escaped_value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        formatted_labels.append(f'{name}="{escaped_value}"')
+    return ",".join(formatted_labels)
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,35 @@
+import time
+from contextlib import contextmanager
+from src.app.monitoring.metrics import metrics_registry
+
+stage_duration_seconds = metrics_registry.histogram(
+    "stage_duration_seconds",
+    "Duration of a stage, i.e. fetch, parse or mongo_write, inside a use case or service.",
+    ("operation", "stage"),
+)
+stage_errors_total = metrics_registry.counter(
+    "stage_errors_total", "Number of stages that raised an exception.", ("operation", "stage")
+)
+
+
+@contextmanager
+def trace_stage(operation: str, stage: str):
+    """
+    Times the enclosed block and records it as a stage of an operation.
+
+    Usage:
+        with trace_stage("gamelogs_upserter", "mongo_write"):
+            self.gamelog_repository.upsert_many(gamelogs)
+
+    :param operation str: The use case or service the stage belongs to.
+    :param stage str: The stage, i.e. fetch, parse, entity_build, mongo_read, mongo_write or pandas_compute.
+    """
+
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        stage_errors_total.inc(operation, stage)
+        raise
+    finally:
+        stage_duration_seconds.observe(time.perf_counter() - start, operation, stage)
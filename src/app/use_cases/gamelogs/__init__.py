@@ -1 +1,4 @@
-from src.app.use_cases.gamelogs.commands.gamelogs_upserter_use_case import GamelogsUpserterUseCase
\ No newline at end of file
+from src.app.use_cases.gamelogs.commands.gamelogs_upserter_use_case import GamelogsUpserterUseCase
+from src.app.use_cases.gamelogs.queries.get_players_gamelogs_use_case import GetPlayersGamelogsUseCase
+from src.app.use_cases.gamelogs.queries.get_player_splits_use_case import GetPlayerSplitsUseCase
+from src.app.use_cases.gamelogs.queries.get_player_gamelogs_use_case import GetPlayerGamelogsUseCase
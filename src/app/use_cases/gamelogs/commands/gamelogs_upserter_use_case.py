@@ -1,6 +1,12 @@
+from typing import Optional, TYPE_CHECKING
 from src.domain.entities import GamelogEntity
 from src.interfaces.repositories import IGamelogRepository
 from src.interfaces.external import IGamelogsFetcher
+from src.app.monitoring import trace_stage
+from src.app.caching import BoundedCache
+
+if TYPE_CHECKING:
+    from src.app.caching.splits_index import SplitsIndex
 
 
 class GamelogsUpserterUseCase:
@@ -8,11 +14,21 @@ class GamelogsUpserterUseCase:
     This class is responsible for upserting gamelogs into the database
 
     :param gamelog_repository IGamelogRepository: An instance of a gamelog repository implementing its interface
+    :param splits_index SplitsIndex: The in-memory splits to update with the upserted gamelogs.
+    :param gamelogs_cache BoundedCache: The cache of players' season gamelogs to invalidate for the upserted ones.
     """
 
-    def __init__(self, gamelog_repository: IGamelogRepository, gamelogs_fetcher: IGamelogsFetcher):
+    def __init__(
+        self,
+        gamelog_repository: IGamelogRepository,
+        gamelogs_fetcher: IGamelogsFetcher,
+        splits_index: Optional["SplitsIndex"] = None,
+        gamelogs_cache: Optional[BoundedCache] = None,
+    ):
         self.gamelog_repository = gamelog_repository
         self.gamelogs_fetcher = gamelogs_fetcher
+        self._splits_index = splits_index
+        self._gamelogs_cache = gamelogs_cache
 
     def execute(self, season) -> None:
         """
@@ -22,11 +38,22 @@ class GamelogsUpserterUseCase:
         """
 
         game_ids: list[int] = []
-        if season is None:
-            game_ids = self.gamelogs_fetcher.get_recent_game_ids()
-        else:
-            game_ids = self.gamelogs_fetcher.get_season_game_ids(season)
+        with trace_stage("gamelogs_upserter", "fetch_game_ids"):
+            if season is None:
+                game_ids = self.gamelogs_fetcher.get_recent_game_ids()
+            else:
+                game_ids = self.gamelogs_fetcher.get_season_game_ids(season)
+
+        with trace_stage("gamelogs_upserter", "fetch_gamelogs"):
+            gamelogs: list[GamelogEntity] = self.gamelogs_fetcher.get_new_gamelogs(game_ids)
+
+        with trace_stage("gamelogs_upserter", "mongo_write"):
+            self.gamelog_repository.upsert_many(gamelogs)
 
-        gamelogs: list[GamelogEntity] = self.gamelogs_fetcher.get_new_gamelogs(game_ids)
+        if self._gamelogs_cache is not None:
+            for player_season in {(gamelog.playerId, gamelog.season) for gamelog in gamelogs}:
+                self._gamelogs_cache.delete(player_season)
 
-        self.gamelog_repository.upsert_many(gamelogs)
\ No newline at end of file
+        if self._splits_index is not None:
+            with trace_stage("gamelogs_upserter", "splits_update"):
+                self._splits_index.update(gamelogs)
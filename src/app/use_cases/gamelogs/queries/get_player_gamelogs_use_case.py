@@ -0,0 +1,42 @@
+from typing import Optional
+import orjson
+from src.interfaces.repositories import IGamelogRepository
+from src.app.caching import BoundedCache
+
+
+class GetPlayerGamelogsUseCase:
+    """
+    This class is responsible for getting a player's regular season gamelogs, i.e. for player cards.
+
+    The gamelogs are cached serialized, keyed by player and season, so opening a card again neither reads
+    MongoDB nor builds entities. The gamelogs upserter invalidates the seasons of the players it ingested.
+
+    :param gamelog_repository IGamelogRepository: An instance of a gamelog repository implementing its interface
+    :param gamelogs_cache BoundedCache: The cache of serialized gamelogs, uncached by default.
+    """
+
+    def __init__(self, gamelog_repository: IGamelogRepository, gamelogs_cache: Optional[BoundedCache] = None):
+        self._gamelog_repository = gamelog_repository
+        self._gamelogs_cache = gamelogs_cache
+
+    def execute(self, player_id: str, season: Optional[int]) -> bytes:
+        """
+        Gets a player's gamelogs of a season.
+
+        :param player_id str: The ID of the player.
+        :param season int: The season.
+        :return: The gamelogs, most recent first, serialized as a JSON array.
+        :rtype: bytes
+        """
+
+        key = (player_id, season)
+        if self._gamelogs_cache is not None:
+            content: Optional[bytes] = self._gamelogs_cache.get(key)
+            if content is not None:
+                return content
+
+        gamelogs = self._gamelog_repository.get_all_by_player_id_and_season(player_id, season)
+        content = orjson.dumps([dict(gamelog) for gamelog in gamelogs])
+        if self._gamelogs_cache is not None:
+            self._gamelogs_cache.set(key, content)
+        return content
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from typing import Optional, TYPE_CHECKING
+from src.domain.value_objects import PlayerSplit
+
+if TYPE_CHECKING:
+    from src.app.caching.splits_index import SplitsIndex
+
+
+class GetPlayerSplitsUseCase:
+    """
+    This class is responsible for getting the split averages of players, i.e. over the last 14 days or the last
+    10 games, for trends and waiver views.
+
+    :param splits_index SplitsIndex: The in-memory index of the players' recent games.
+    """
+
+    def __init__(self, splits_index: "SplitsIndex"):
+        self._splits_index = splits_index
+
+    def execute(
+        self,
+        player_ids: Optional[list[str]] = None,
+        last_games: Optional[int] = None,
+        last_days: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[PlayerSplit]:
+        """
+        Gets the split averages of players over one window: their last games, the last days, or a date range.
+        Without a window, every game indexed is averaged.
+
+        :param player_ids list[str]: The players, or None for every player who played within the window.
+        :param last_games int: The number of most recent games to average.
+        :param last_days int: The number of days before now to average the games of.
+        :param start_date datetime: The start of the date range (inclusive).
+        :param end_date datetime: The end of the date range (exclusive).
+        :return: The players' splits.
+        :rtype: list[PlayerSplit]
+        :raises ValueError: If more than one window is given, or the window is empty.
+        """
+
+        windows = [last_games is not None, last_days is not None, start_date is not None or end_date is not None]
+        if sum(windows) > 1:
+            raise ValueError("Only one of the last games, the last days or a date range is expected")
+        if last_games is not None and last_games < 1:
+            raise ValueError("The number of games must be at least 1")
+        if last_days is not None and last_days < 1:
+            raise ValueError("The number of days must be at least 1")
+        if start_date is not None and end_date is not None and start_date >= end_date:
+            raise ValueError("The start date must be before the end date")
+
+        if last_days is not None:
+            start_date = datetime.utcnow() - timedelta(days=last_days)
+        player_ids = list(dict.fromkeys(player_ids)) if player_ids else None
+        return self._splits_index.get_splits(player_ids, last_games, start_date, end_date)
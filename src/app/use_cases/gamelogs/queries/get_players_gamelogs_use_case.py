@@ -0,0 +1,57 @@
+from typing import Iterator
+from src.interfaces.repositories import IGamelogRepository
+from src.domain.entities import GamelogEntity
+from src.domain.value_objects import GamelogsBatchQuery
+
+# The fields gamelogs can be narrowed down to
+SELECTABLE_FIELDS: set[str] = set(GamelogEntity.model_fields)
+MAX_PLAYERS: int = 100
+
+
+class GetPlayersGamelogsUseCase:
+    """
+    This class is responsible for getting the season gamelogs of several players at once, i.e. for roster and
+    comparison views, instead of a request per player.
+
+    :param gamelog_repository IGamelogRepository: An instance of a gamelog repository implementing its interface
+    """
+
+    def __init__(self, gamelog_repository: IGamelogRepository):
+        self._gamelog_repository = gamelog_repository
+
+    def execute(self, gamelogs_query: GamelogsBatchQuery) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Gets the gamelogs of the players of a query. The query is validated right away, and the gamelogs are
+        read as the result is iterated.
+
+        :param gamelogs_query GamelogsBatchQuery: The players, season, number of games and fields to get.
+        :return: The id and games, most recent first, of every player of the query, without games if they
+            have none.
+        :rtype: Iterator[tuple[str, list[dict]]]
+        :raises ValueError: If the players, number of games or fields aren't valid.
+        """
+
+        if not 0 < len(gamelogs_query.playerIds) <= MAX_PLAYERS:
+            raise ValueError(f"Between 1 and {MAX_PLAYERS} player ids are expected")
+        if gamelogs_query.lastN is not None and gamelogs_query.lastN < 1:
+            raise ValueError("The number of games must be at least 1")
+        unknown_fields = set(gamelogs_query.fields or ()) - SELECTABLE_FIELDS
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields {', '.join(sorted(unknown_fields))}, expected any of "
+                + ", ".join(sorted(SELECTABLE_FIELDS))
+            )
+
+        unique_query = gamelogs_query.model_copy(update={"playerIds": list(dict.fromkeys(gamelogs_query.playerIds))})
+        return self._with_missing_players(self._gamelog_repository.get_batch(unique_query), unique_query.playerIds)
+
+    @staticmethod
+    def _with_missing_players(
+        players_games: Iterator[tuple[str, list[dict]]], player_ids: list[str]
+    ) -> Iterator[tuple[str, list[dict]]]:
+        missing_player_ids: dict[str, None] = dict.fromkeys(player_ids)
+        for player_id, games in players_games:
+            missing_player_ids.pop(player_id, None)
+            yield player_id, games
+        for player_id in missing_player_ids:
+            yield player_id, []
@@ -1 +1,2 @@
-from src.app.use_cases.players.commands.players_upserter_use_case import PlayersUpserterUseCase
\ No newline at end of file
+from src.app.use_cases.players.commands.players_upserter_use_case import PlayersUpserterUseCase
+from src.app.use_cases.players.queries.query_players_use_case import QueryPlayersUseCase
@@ -2,6 +2,7 @@ from src.domain.entities import PlayerEntity
 from src.domain.value_objects.player_season_totals import PlayerSeasonTotals
 from src.interfaces.repositories import IPlayerRepository
 from src.interfaces.external import IPlayersFetcher
+from src.app.monitoring import trace_stage
 from datetime import datetime
 
 
@@ -24,12 +25,15 @@ class PlayersUpserterUseCase():
         if datetime.now().month >= 10:
             current_season = current_season
 
-        players: list[PlayerEntity] = await self.playersFetcher.execute()
-        player_totals: dict = self.player_repository.get_season_totals(current_season)
+        with trace_stage("players_upserter", "fetch"):
+            players: list[PlayerEntity] = await self.playersFetcher.execute()
+        with trace_stage("players_upserter", "mongo_read"):
+            player_totals: dict = self.player_repository.get_season_totals(current_season)
         for player in players:
             try:
                 player.seasonTotals = player_totals[player.playerId]
             except KeyError:
                 continue
 
-        self.player_repository.upsert_many(players)
+        with trace_stage("players_upserter", "mongo_write"):
+            self.player_repository.upsert_many(players)
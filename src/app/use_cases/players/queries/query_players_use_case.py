@@ -0,0 +1,48 @@
+from src.interfaces.repositories import IPlayerRepository
+from src.domain.entities import PlayerEntity, ProjectionEntity
+from src.domain.value_objects import PlayerQuery, PlayerSeasonProjections, PlayerSeasonTotals
+
+# The fields players can be sorted by, grouped by the part of the player they are read from
+SORTABLE_FIELDS: dict[str, set[str]] = {
+    "seasonProjections": set(PlayerSeasonProjections.model_fields),
+    "seasonTotals": set(PlayerSeasonTotals.model_fields),
+    "weeklyProjections": {
+        field for field, info in ProjectionEntity.model_fields.items() if info.annotation in (int, float)
+    },
+}
+MAX_LIMIT: int = 1000
+
+
+class QueryPlayersUseCase:
+    """
+    This class is responsible for filtering, sorting and limiting players on the database, so that views like
+    draft boards and waiver lists only receive the players they show.
+
+    :param player_repository IPlayerRepository: An instance of a player repository implementing its interface
+    """
+
+    def __init__(self, player_repository: IPlayerRepository):
+        self._player_repository = player_repository
+
+    def execute(self, player_query: PlayerQuery) -> list[PlayerEntity]:
+        """
+        Gets the players matching a query.
+
+        :param player_query PlayerQuery: The filters, sort and limit of the query.
+        :return: The matching players, in order.
+        :rtype: list[PlayerEntity]
+        :raises ValueError: If the sort field, limit or offset isn't valid.
+        """
+
+        group, _, field = player_query.sortBy.partition(".")
+        if field not in SORTABLE_FIELDS.get(group, ()):
+            raise ValueError(
+                f"Can't sort by {player_query.sortBy}, expected one of "
+                + ", ".join(f"{group}.<{'|'.join(sorted(fields))}>" for group, fields in SORTABLE_FIELDS.items())
+            )
+        if player_query.limit is not None and not 0 < player_query.limit <= MAX_LIMIT:
+            raise ValueError(f"The limit must be between 1 and {MAX_LIMIT}")
+        if player_query.offset < 0:
+            raise ValueError("The offset can't be negative")
+
+        return self._player_repository.query(player_query)
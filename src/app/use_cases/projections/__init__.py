@@ -1,3 +1,7 @@
 from src.app.use_cases.projections.commands.player_weekly_projections_forecaster_use_case import (
     PlayerWeeklyProjectionsForecasterUseCase,
 )
+from src.app.use_cases.projections.commands.live_projections_updater_use_case import LiveProjectionsUpdaterUseCase
+from src.app.use_cases.projections.queries.get_projections_use_case import GetProjectionsUseCase
+from src.app.use_cases.projections.queries.backtest_projections_use_case import BacktestProjectionsUseCase
+from src.app.use_cases.projections.queries.get_weekly_scores_use_case import GetWeeklyScoresUseCase
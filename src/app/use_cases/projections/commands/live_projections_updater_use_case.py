@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from src.interfaces.repositories import IPlayerRepository, IScheduledMatchupRepository, IProjectionRepository
+from src.interfaces.external import ILiveBoxscoresFetcher
+from src.domain.entities import ProjectionEntity, ScheduledMatchupEntity
+from src.domain.value_objects import LivePlayerStats
+from src.app.monitoring import trace_stage
+
+GAME_WINDOW: timedelta = timedelta(hours=4)  # Games are polled from tip-off until final, or at most this long
+BLENDED_STATS: tuple[str, ...] = (
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "threesMade",
+    "points",
+    "steals",
+    "blocks",
+    "assists",
+    "rebounds",
+    "turnovers",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+)
+
+
+class LiveProjectionsUpdaterUseCase:
+    """
+    This class is responsible for updating the projections of in-progress games from their live boxscores.
+
+    A projection is blended as the player's actual stats so far plus their pregame projection scaled by the
+    fraction of the game left to play, so it converges to the final line as the game ends. The instance keeps
+    the pregame projections of the games it polls between ticks, so it is meant to live in a polling worker.
+
+    :param player_repository IPlayerRepository: An instance of a player repository implementing its interface
+    :param scheduled_matchup_repository IScheduledMatchupRepository: An instance of a scheduled matchup repository
+        implementing its interface
+    :param projection_repository IProjectionRepository: An instance of a projection repository
+        implementing its interface
+    :param live_boxscores_fetcher ILiveBoxscoresFetcher: An instance of a live boxscores fetcher
+        implementing its interface
+    """
+
+    def __init__(
+        self,
+        player_repository: IPlayerRepository,
+        scheduled_matchup_repository: IScheduledMatchupRepository,
+        projection_repository: IProjectionRepository,
+        live_boxscores_fetcher: ILiveBoxscoresFetcher,
+    ):
+        self._player_repository = player_repository
+        self._scheduled_matchup_repository = scheduled_matchup_repository
+        self._projection_repository = projection_repository
+        self._live_boxscores_fetcher = live_boxscores_fetcher
+        self._pregame_projections: dict[str, dict[str, ProjectionEntity]] = {}  # gameId -> playerId -> projection
+        self._final_game_ids: set[str] = set()
+
+    def execute(self, current_datetime: Optional[datetime] = None) -> list[ProjectionEntity]:
+        """
+        Polls every in-progress game once and writes the projections that changed.
+
+        :param current_datetime datetime: The time of the poll, now by default.
+        :return: The updated projections.
+        :rtype: list[ProjectionEntity]
+        """
+
+        current_datetime = current_datetime or datetime.utcnow()
+        with trace_stage("live_projections_updater", "mongo_read"):
+            window_matchups: list[ScheduledMatchupEntity] = (
+                self._scheduled_matchup_repository.get_matchups_between_dates(
+                    current_datetime - GAME_WINDOW, current_datetime
+                )
+            )
+            self._final_game_ids &= {matchup.gameId for matchup in window_matchups}
+            live_matchups = [matchup for matchup in window_matchups if matchup.gameId not in self._final_game_ids]
+            self._load_pregame_projections(live_matchups, current_datetime)
+
+        updated_projections: list[ProjectionEntity] = []
+        for matchup in live_matchups:
+            try:
+                changed_player_stats = self._live_boxscores_fetcher.get_changed_player_stats(matchup.gameId)
+            except Exception as e:
+                print(f"Error polling game {matchup.gameId}: {e}")
+                continue
+
+            game_projections = self._pregame_projections.get(matchup.gameId, {})
+            for player_stats in changed_player_stats:
+                pregame_projection = game_projections.get(player_stats.playerId)
+                if pregame_projection is not None:
+                    updated_projections.append(self._blend(pregame_projection, player_stats))
+                if player_stats.isFinal:
+                    self._final_game_ids.add(matchup.gameId)
+
+        with trace_stage("live_projections_updater", "mongo_write"):
+            self._player_repository.update_live_projections(updated_projections)
+
+        # Games that ended, or fell out of the window, are not polled again
+        live_game_ids = {matchup.gameId for matchup in live_matchups} - self._final_game_ids
+        for game_id in set(self._pregame_projections) - live_game_ids:
+            self._pregame_projections.pop(game_id)
+            self._live_boxscores_fetcher.forget_game(game_id)
+
+        return updated_projections
+
+    def _load_pregame_projections(self, live_matchups: list[ScheduledMatchupEntity], current_datetime: datetime):
+        """
+        Loads the pregame projections of the games that weren't polled yet.
+
+        :param live_matchups list[ScheduledMatchupEntity]: The in-progress games.
+        :param current_datetime datetime: The time of the poll.
+        """
+
+        new_game_ids = {matchup.gameId for matchup in live_matchups} - set(self._pregame_projections)
+        if not new_game_ids:
+            return
+
+        for game_id in new_game_ids:
+            self._pregame_projections[game_id] = {}
+        for projection in self._projection_repository.get_between_dates(
+            current_datetime - GAME_WINDOW, current_datetime + timedelta(minutes=1)
+        ):
+            if projection.gameId in new_game_ids:
+                self._pregame_projections[projection.gameId][projection.playerId] = projection
+
+    def _blend(self, pregame_projection: ProjectionEntity, player_stats: LivePlayerStats) -> ProjectionEntity:
+        """
+        Blends a player's actual stats so far with the part of their pregame projection left to play.
+
+        :param pregame_projection ProjectionEntity: The player's projection for the game before it started.
+        :param player_stats LivePlayerStats: The player's live stats.
+        :return: The blended projection.
+        :rtype: ProjectionEntity
+        """
+
+        remaining_fraction = 0.0
+        if player_stats.isActive and not player_stats.isFinal:
+            remaining_fraction = 1.0 - player_stats.gameProgress
+
+        return pregame_projection.model_copy(
+            update={
+                stat: getattr(player_stats, stat) + getattr(pregame_projection, stat) * remaining_fraction
+                for stat in BLENDED_STATS
+            }
+        )
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from typing import Optional
 from src.interfaces.repositories import (
     IPlayerRepository,
     IGamelogRepository,
@@ -7,12 +8,13 @@ from src.interfaces.repositories import (
 )
 from src.interfaces.projections_model import IPlayerWeeklyProjectionsForecasterService
 from src.domain.entities import ProjectionEntity, PlayerEntity, GamelogEntity, ScheduledMatchupEntity
+from src.app.monitoring import trace_stage
 
 
 class PlayerWeeklyProjectionsForecasterUseCase:
     """
     This class is responsible for forecasting weekly projections, i.e. rebounds, assists, etc., for games a player
-    is scheduled to play in the upcoming week.
+    is scheduled to play in the upcoming week, or over a longer horizon.
 
     :param player_repository IPlayerRepository: An instance of a player repository implementing its interface
     :param gamelog_repository IGamelogRepository: An instance of a gamelog repository implementing its interface
@@ -38,19 +40,54 @@ class PlayerWeeklyProjectionsForecasterUseCase:
         self._projection_repository = projection_repository
         self._forecaster_service = player_weekly_projections_forecaster_service
 
-    def execute(self) -> None:
+    def execute(self, weeks: Optional[int] = 1, rest_of_season: bool = False, incremental: bool = False) -> None:
+        """
+        Forecasts the projections of every remaining game within the horizon in a single pass.
+
+        The current week's projections are stored on the players, and every projection within the horizon
+        is stored in the projections collection.
+
+        :param weeks int: The number of weeks, starting with the current one, to forecast.
+        :param rest_of_season bool: Whether to forecast every remaining game of the season instead.
+        :param incremental bool: Whether to only forecast and write the players whose inputs, i.e. injury status,
+            depth chart or matchups, changed since the last incremental run, as when injury news comes in.
+        """
 
         week_start: datetime = datetime.utcnow() - timedelta(days=(datetime.utcnow().weekday() - 0) % 7)
         week_finish: datetime = week_start + timedelta(days=7)
-        players: list[PlayerEntity] = self._player_repository.get_all()
-        gamelogs: list[GamelogEntity] = self._gamelog_repository.get_all_between_dates(
-            datetime.utcnow() - timedelta(days=365), datetime.utcnow()
-        )
-        if len(gamelogs) > 0:
-            matchups: list[ScheduledMatchupEntity] = self._scheduled_matchup_repository.get_matchups_between_dates(
-                week_start, week_finish
+        horizon_finish: datetime = week_start + timedelta(days=7 * max(weeks or 1, 1))
+        if rest_of_season:
+            horizon_finish = datetime(9999, 12, 31)
+
+        with trace_stage("weekly_projections_forecaster", "mongo_read"):
+            players: list[PlayerEntity] = self._player_repository.get_all()
+            gamelogs: list[GamelogEntity] = self._gamelog_repository.get_all_between_dates(
+                datetime.utcnow() - timedelta(days=365), datetime.utcnow()
             )
+        if len(gamelogs) > 0:
+            with trace_stage("weekly_projections_forecaster", "mongo_read"):
+                matchups: list[ScheduledMatchupEntity] = self._scheduled_matchup_repository.get_matchups_between_dates(
+                    week_start, horizon_finish
+                )
+
+            input_signatures: Optional[dict[str, str]] = None
+            with trace_stage("weekly_projections_forecaster", "forecast"):
+                if incremental:
+                    projections, input_signatures = self._forecaster_service.execute_incremental(
+                        gamelogs, matchups, players
+                    )
+                else:
+                    projections = self._forecaster_service.execute(gamelogs, matchups, players)
 
-            projections: list[ProjectionEntity] = self._forecaster_service.execute(gamelogs, matchups, players)
-            self._player_repository.upsert_many_projections(projections)
-            self._projection_repository.upsert_many(projections)
+            week_finish_utc: str = week_finish.strftime("%Y-%m-%dT%H:%M:%SZ")
+            current_week_projections: list[ProjectionEntity] = [
+                projection for projection in projections if projection.dateUTC < week_finish_utc
+            ]
+            with trace_stage("weekly_projections_forecaster", "mongo_write"):
+                if len(current_week_projections) > 0:
+                    self._player_repository.upsert_many_projections(current_week_projections)
+                if len(projections) > 0:
+                    self._projection_repository.upsert_many(projections)
+            # Only once the projections are saved, so that a failed write is forecasted again by the next run
+            if input_signatures is not None:
+                self._forecaster_service.commit_input_signatures(input_signatures)
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from src.interfaces.repositories import IGamelogRepository
+from src.interfaces.projections_model import IProjectionsBacktester
+from src.domain.entities import GamelogEntity
+from src.app.monitoring import trace_stage
+
+HISTORY_DAYS: int = 365  # The forecaster builds its averages from the gamelogs of the last year
+
+
+class BacktestProjectionsUseCase:
+    """
+    This class is responsible for measuring how accurate the projection model was over past games.
+
+    :param gamelog_repository IGamelogRepository: An instance of a gamelog repository implementing its interface
+    :param projections_backtester IProjectionsBacktester: An instance of a projections backtester
+        implementing its interface
+    """
+
+    def __init__(self, gamelog_repository: IGamelogRepository, projections_backtester: IProjectionsBacktester):
+        self._gamelog_repository = gamelog_repository
+        self._projections_backtester = projections_backtester
+
+    def execute(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> dict:
+        """
+        Backtests the projections of every game played within a date range, by default the last 4 weeks.
+
+        :param start_date datetime: The start of the range (inclusive).
+        :param end_date datetime: The end of the range (exclusive), now by default.
+        :return: The errors of the projections per stat, overall and per week.
+        :rtype: dict
+        """
+
+        end_date = end_date or datetime.utcnow()
+        start_date = start_date or end_date - timedelta(weeks=4)
+
+        with trace_stage("projections_backtest", "mongo_read"):
+            gamelogs: list[GamelogEntity] = self._gamelog_repository.get_all_between_dates(
+                start_date - timedelta(days=HISTORY_DAYS), end_date, limit=None
+            )
+
+        return self._projections_backtester.execute(gamelogs, start_date, end_date)
@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from src.domain.entities import ProjectionEntity
+from src.interfaces.repositories import IProjectionRepository
+
+
+class GetProjectionsUseCase:
+    """
+    This class is responsible for retrieving stored player game projections from the database.
+
+    :param projection_repository IProjectionRepository: The repository for projections.
+    """
+
+    def __init__(self, projection_repository: IProjectionRepository):
+        self._projection_repository = projection_repository
+
+    def execute(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None, player_id: str = None
+    ) -> list[ProjectionEntity]:
+        """
+        Gets the projections of the games within a date range, by default every remaining game.
+
+        :param start_date datetime: The start of the range (inclusive), now by default.
+        :param end_date datetime: The end of the range (exclusive), unbounded by default.
+        :param player_id str: Only return the projections of this player.
+        :return: A list of projections sorted by player and date.
+        :rtype: list[ProjectionEntity]
+        """
+
+        start_date = start_date or datetime.utcnow()
+        end_date = end_date or start_date + timedelta(days=366)
+        return self._projection_repository.get_between_dates(start_date, end_date, player_id)
@@ -0,0 +1,52 @@
+from typing import Optional
+from src.interfaces.repositories import IPlayerRepository
+from src.interfaces.projections_model import IWeeklyScoringService
+from src.domain.value_objects import PlayerWeeklyScore, ScoringConfig
+from src.app.caching import BoundedCache
+from src.app.monitoring import trace_stage
+
+
+class GetWeeklyScoresUseCase:
+    """
+    This class is responsible for scoring the players' projected weeks under a league's scoring configuration.
+
+    Scores are memoized by the configuration's hash and the version of the projections, so every league sharing
+    a scoring format is served from the cache until the projections are written again.
+
+    :param player_repository IPlayerRepository: An instance of a player repository implementing its interface
+    :param weekly_scoring_service IWeeklyScoringService: An instance of a weekly scoring service
+        implementing its interface
+    :param scores_cache BoundedCache: The memoized scores, shared between requests.
+    """
+
+    def __init__(
+        self,
+        player_repository: IPlayerRepository,
+        weekly_scoring_service: IWeeklyScoringService,
+        scores_cache: BoundedCache,
+    ):
+        self._player_repository = player_repository
+        self._weekly_scoring_service = weekly_scoring_service
+        self._scores_cache = scores_cache
+
+    def execute(self, scoring_config: ScoringConfig, limit: Optional[int] = None) -> list[PlayerWeeklyScore]:
+        """
+        Gets the players' weekly scores, ranked from best to worst.
+
+        :param scoring_config ScoringConfig: The league's scoring.
+        :param limit int: The number of top ranked players to return, all of them by default.
+        :return: The players' weekly totals, z-scores and ranks.
+        :rtype: list[PlayerWeeklyScore]
+        :raises ValueError: If the scoring uses an unknown stat or category.
+        """
+
+        cache_key = (scoring_config.config_hash, self._player_repository.get_projections_version())
+        scores: list[PlayerWeeklyScore] = self._scores_cache.get(cache_key)
+        if scores is None:
+            with trace_stage("weekly_scores", "mongo_read"):
+                players_totals = self._player_repository.get_current_week_projection_totals()
+            with trace_stage("weekly_scores", "scoring"):
+                scores = self._weekly_scoring_service.execute(players_totals, scoring_config)
+            self._scores_cache.set(cache_key, scores)
+
+        return scores[:limit] if limit is not None else scores
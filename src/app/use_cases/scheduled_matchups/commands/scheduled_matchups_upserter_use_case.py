@@ -1,6 +1,10 @@
+from typing import Optional
 from src.domain.entities import ScheduledMatchupEntity
+from src.domain.value_objects import ScheduleDiff
 from src.interfaces.repositories import IScheduledMatchupRepository
 from src.interfaces.external import IScheduledMatchupsFetcherService
+from src.app.monitoring import trace_stage
+from src.app.caching import ScheduleIndex
 
 
 class ScheduledMatchupsUpserterUseCase:
@@ -9,21 +13,38 @@ class ScheduledMatchupsUpserterUseCase:
 
     :param team_schedule_repository IScheduledMatchupRepository: The repository for scheduled matchups.
     :param scheduled_matchups_fetcher_service IScheduledMatchupsFetcherService: The service for fetching scheduled matchups.
+    :param schedule_index ScheduleIndex: The in-memory schedule to refresh once the matchups are upserted.
     """
 
     def __init__(
         self,
         scheduled_matchup_repository: IScheduledMatchupRepository,
         scheduled_matchups_fetcher_service: IScheduledMatchupsFetcherService,
+        schedule_index: Optional[ScheduleIndex] = None,
     ):
         self._scheduled_matchup_repository = scheduled_matchup_repository
         self._scheduled_matchups_fetcher_service = scheduled_matchups_fetcher_service
+        self._schedule_index = schedule_index
 
-    def execute(self) -> None:
+    def execute(self) -> ScheduleDiff:
         """
         This method is responsible for upserting the week's scheduled matchups into the database.
+
+        Only the games that were added, changed or removed since the last run are written, and the schedule
+        index is only refreshed when there were any.
+
+        :return: The games that were inserted, updated and removed, and the teams they involve.
+        :rtype: ScheduleDiff
         """
 
-        scheduled_matchups: list[ScheduledMatchupEntity] = self._scheduled_matchups_fetcher_service.execute()
+        with trace_stage("scheduled_matchups_upserter", "fetch"):
+            scheduled_matchups: list[ScheduledMatchupEntity] = self._scheduled_matchups_fetcher_service.execute()
+
+        with trace_stage("scheduled_matchups_upserter", "mongo_write"):
+            schedule_diff = self._scheduled_matchup_repository.sync_many(scheduled_matchups)
+
+        if self._schedule_index is not None and schedule_diff.has_changes():
+            with trace_stage("scheduled_matchups_upserter", "index_refresh"):
+                self._schedule_index.refresh()
 
-        self._scheduled_matchup_repository.upsert_many(scheduled_matchups)
\ No newline at end of file
+        return schedule_diff
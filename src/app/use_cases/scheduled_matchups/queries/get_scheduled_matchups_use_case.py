@@ -1,6 +1,10 @@
+from typing import Optional
 from src.domain.entities import ScheduledMatchupEntity
+from src.domain.value_objects import TeamWeekSchedule
 from src.interfaces.repositories import IScheduledMatchupRepository
-from datetime import datetime, timedelta
+from src.app.caching import ScheduleIndex
+from src.app.caching.schedule_index import game_day
+from datetime import datetime, timedelta, date
 
 
 class GetScheduledMatchupsUseCase:
@@ -8,11 +12,16 @@ class GetScheduledMatchupsUseCase:
     This class is responsible for retrieving the current week's scheduled matchups from the database.
 
     :param team_schedule_repository IScheduledMatchupRepository: The repository for scheduled matchups.
+    :param schedule_index ScheduleIndex: The in-memory schedule, which serves the lookups instead of the
+        repository when given.
     """
 
-    def __init__(self, team_schedule_repository: IScheduledMatchupRepository):
+    def __init__(
+        self, team_schedule_repository: IScheduledMatchupRepository, schedule_index: Optional[ScheduleIndex] = None
+    ):
         self.team_schedule_repository = team_schedule_repository
-        
+        self.schedule_index = schedule_index
+
     def get_current_week(self) -> list[ScheduledMatchupEntity]:
         """
         This method is responsible for fetching the week's scheduled matchups from the database.
@@ -29,6 +38,9 @@ class GetScheduledMatchupsUseCase:
         week_start_date = today - timedelta(days=days_until_monday)
         week_finish_date = week_start_date + timedelta(days=7)
 
+        if self.schedule_index is not None:
+            return self.schedule_index.get_between_dates(week_start_date, week_finish_date)
+
         current_week_scheduled_matchups = self.team_schedule_repository.get_matchups_between_dates(
             week_start_date, week_finish_date
         )
@@ -42,4 +54,50 @@ class GetScheduledMatchupsUseCase:
         :rtype: list[ScheduledMatchup]
         """
 
+        if self.schedule_index is not None:
+            return self.schedule_index.get_all()
+
         return self.team_schedule_repository.get_scheduled_matchups()
+
+    def get_team_weeks(self, start_day: Optional[date] = None, weeks: int = 1) -> list[TeamWeekSchedule]:
+        """
+        Counts every team's games and back-to-backs per fantasy week, i.e. to plan streaming pickups.
+
+        Weeks run from Monday to Sunday in US calendar days.
+
+        :param start_day date: A day of the first week, today by default.
+        :param weeks int: The number of weeks.
+        :return: Every team's schedule for each week, by week and then by most games.
+        :rtype: list[TeamWeekSchedule]
+        """
+
+        schedule_index = self.schedule_index or ScheduleIndex(self.team_schedule_repository.get_scheduled_matchups)
+        start_day = start_day or game_day(datetime.utcnow())
+        first_week_start = start_day - timedelta(days=start_day.weekday())
+
+        # The day before the first week is included, so a Monday game after a Sunday game is a back-to-back
+        team_game_days = schedule_index.get_team_game_days(
+            first_week_start - timedelta(days=1), first_week_start + timedelta(weeks=weeks)
+        )
+        team_week_schedules: list[TeamWeekSchedule] = []
+        for week in range(weeks):
+            week_start = first_week_start + timedelta(weeks=week)
+            week_end = week_start + timedelta(days=7)
+            week_schedules: list[TeamWeekSchedule] = []
+            for team in schedule_index.get_teams():
+                game_days = team_game_days.get(team.teamId, [])
+                week_game_days = [day for day in game_days if week_start <= day < week_end]
+                played_days = set(game_days)
+                week_schedules.append(
+                    TeamWeekSchedule(
+                        weekStart=week_start.isoformat(),
+                        teamId=team.teamId,
+                        abbreviation=team.abbreviation,
+                        games=len(week_game_days),
+                        backToBacks=sum(day - timedelta(days=1) in played_days for day in week_game_days),
+                        gameDays=[day.isoformat() for day in week_game_days],
+                    )
+                )
+            week_schedules.sort(key=lambda schedule: (-schedule.games, schedule.abbreviation))
+            team_week_schedules.extend(week_schedules)
+        return team_week_schedules
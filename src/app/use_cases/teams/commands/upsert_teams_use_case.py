@@ -1,6 +1,7 @@
 from src.interfaces.repositories import ITeamRepository
 from src.domain.entities import TeamEntity
 from src.interfaces.external import ITeamsFetcherService
+from src.app.monitoring import trace_stage
 
 
 class UpsertTeamsUseCase:
@@ -22,5 +23,7 @@ class UpsertTeamsUseCase:
         :param teams: list[Team]
         """
         
-        teams: list[TeamEntity] = self._teams_fetcher.execute()
-        self._team_repository.upsert_many(teams)
+        with trace_stage("teams_upserter", "fetch"):
+            teams: list[TeamEntity] = self._teams_fetcher.execute()
+        with trace_stage("teams_upserter", "mongo_write"):
+            self._team_repository.upsert_many(teams)
@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class TeamEntity(BaseModel):
+    # Frozen, as every entity refers to the one instance of its team interned by the TeamRegistry
+    model_config = ConfigDict(frozen=True)
+
     teamId: str
     abbreviation: str
     location: str
-    name: str
\ No newline at end of file
+    name: str
@@ -1,2 +1,17 @@
 from src.domain.value_objects.player_season_projections import PlayerSeasonProjections
-from src.domain.value_objects.player_season_totals import PlayerSeasonTotals
\ No newline at end of file
+from src.domain.value_objects.player_season_totals import PlayerSeasonTotals
+from src.domain.value_objects.live_player_stats import LivePlayerStats
+from src.domain.value_objects.player_query import PlayerQuery
+from src.domain.value_objects.scoring_config import ScoringConfig
+from src.domain.value_objects.player_weekly_projection_totals import PlayerWeeklyProjectionTotals
+from src.domain.value_objects.player_weekly_score import PlayerWeeklyScore
+from src.domain.value_objects.team_week_schedule import TeamWeekSchedule
+from src.domain.value_objects.schedule_diff import ScheduleDiff
+from src.domain.value_objects.gamelogs_batch_query import GamelogsBatchQuery
+from src.domain.value_objects.player_split import PlayerSplit
+from src.domain.value_objects.cache_invalidation import (
+    CacheInvalidation,
+    PLAYERS_DATA,
+    GAMELOGS_DATA,
+    SCHEDULED_MATCHUPS_DATA,
+)
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+
+# The data whose changes invalidate caches
+PLAYERS_DATA: str = "players"
+GAMELOGS_DATA: str = "gamelogs"
+SCHEDULED_MATCHUPS_DATA: str = "scheduled_matchups"
+
+
+class CacheInvalidation(BaseModel):
+    changedData: set[str] = set()  # The data that changed, i.e. PLAYERS_DATA
+    playerIds: set[str] = set()  # The players whose documents, gamelogs or projections changed
+    gameIds: set[str] = set()  # The games whose gamelogs or scheduled matchups changed
+    teamIds: set[str] = set()  # The teams of the changed players, gamelogs and scheduled matchups
+    wholeData: set[str] = set()  # The changed data whose changes aren't all known by id, i.e. after a delete
+
+    def merge(self, other: "CacheInvalidation") -> "CacheInvalidation":
+        return CacheInvalidation(
+            changedData=self.changedData | other.changedData,
+            playerIds=self.playerIds | other.playerIds,
+            gameIds=self.gameIds | other.gameIds,
+            teamIds=self.teamIds | other.teamIds,
+            wholeData=self.wholeData | other.wholeData,
+        )
+
+    def is_whole(self, data: str) -> bool:
+        return data in self.wholeData
@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class GamelogsBatchQuery(BaseModel):
+    playerIds: list[str]
+    season: int
+    lastN: Optional[int] = None  # Only each player's most recent games, all of them by default
+    fields: Optional[list[str]] = None  # The gamelog fields to return besides gameId and dateUTC, all by default
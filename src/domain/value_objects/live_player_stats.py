@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+
+class LivePlayerStats(BaseModel):
+    gameId: str
+    playerId: str
+    isActive: bool
+    isFinal: bool
+    gameProgress: float  # Fraction of regulation played, from 0 at tip-off to 1 at the end of the 4th quarter
+    minutes: float
+    fieldGoalsAttempted: int
+    fieldGoalsMade: int
+    threesMade: int
+    points: int
+    steals: int
+    blocks: int
+    assists: int
+    rebounds: int
+    turnovers: int
+    freeThrowsAttempted: int
+    freeThrowsMade: int
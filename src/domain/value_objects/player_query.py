@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PlayerQuery(BaseModel):
+    positions: Optional[list[str]] = None  # Fantasy positions, i.e. PG or C, any of which matches
+    teams: Optional[list[str]] = None  # Team ids or abbreviations, any of which matches
+    injuryStatuses: Optional[list[str]] = None  # Injury statuses, i.e. Out, or Healthy for players without one
+    isAvailable: Optional[bool] = None  # Whether the player is on a team and not ruled out
+    sortBy: str = "seasonProjections.pointsLeagueRanking"
+    descending: bool = False
+    limit: Optional[int] = None
+    offset: int = 0
@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PlayerSplit(BaseModel):
+    playerId: str
+    gamesPlayed: int
+    firstGameDateUTC: Optional[str] = None  # The first and last games averaged, None without games
+    lastGameDateUTC: Optional[str] = None
+    averages: dict[str, float] = {}  # The per-game average of each stat, i.e. points and reboundsTotal
+    fieldGoalPercentage: Optional[float] = None  # Made over attempted across the games, None without attempts
+    threePointPercentage: Optional[float] = None
+    freeThrowPercentage: Optional[float] = None
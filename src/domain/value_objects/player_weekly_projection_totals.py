@@ -0,0 +1,22 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PlayerWeeklyProjectionTotals(BaseModel):
+    playerId: str
+    firstName: str
+    lastName: str
+    teamAbbreviation: Optional[str]
+    fantasyPositions: list[str]
+    games: int
+    fieldGoalsAttempted: float
+    fieldGoalsMade: float
+    threesMade: float
+    points: float
+    steals: float
+    blocks: float
+    assists: float
+    rebounds: float
+    turnovers: float
+    freeThrowsAttempted: float
+    freeThrowsMade: float
@@ -0,0 +1,15 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PlayerWeeklyScore(BaseModel):
+    playerId: str
+    firstName: str
+    lastName: str
+    teamAbbreviation: Optional[str]
+    fantasyPositions: list[str]
+    games: int
+    totals: dict[str, float]  # The projected totals of the week, one per scored stat or category
+    zScores: dict[str, float]  # How many standard deviations each total is above the average player's
+    score: float  # Fantasy points, or the sum of the category z-scores
+    rank: int
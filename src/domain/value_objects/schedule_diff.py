@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ScheduleDiff(BaseModel):
+    insertedGameIds: list[str] = []
+    updatedGameIds: list[str] = []
+    removedGameIds: list[str] = []
+    unchangedGames: int = 0
+    affectedTeamIds: list[str] = []  # The teams of every inserted, updated or removed game, before and after
+
+    def has_changes(self) -> bool:
+        return bool(self.insertedGameIds or self.updatedGameIds or self.removedGameIds)
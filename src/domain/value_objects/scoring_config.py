@@ -0,0 +1,27 @@
+import hashlib
+import json
+from typing import Optional
+from pydantic import BaseModel, model_validator
+
+
+class ScoringConfig(BaseModel):
+    pointsWeights: Optional[dict[str, float]] = None  # Fantasy points per unit of a stat, i.e. {"points": 1}
+    categories: Optional[list[str]] = None  # Head-to-head categories, i.e. ["points", "fieldGoalPercentage"]
+
+    @model_validator(mode="after")
+    def _check_scoring_type(self):
+        if (self.pointsWeights is None) == (self.categories is None):
+            raise ValueError("Exactly one of pointsWeights or categories must be given")
+        return self
+
+    @property
+    def config_hash(self) -> str:
+        """
+        A hash identifying the scoring, the same for configurations listing their stats in a different order.
+        """
+
+        normalized = {
+            "pointsWeights": sorted((self.pointsWeights or {}).items()),
+            "categories": sorted(set(self.categories or [])),
+        }
+        return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class TeamWeekSchedule(BaseModel):
+    weekStart: str  # The Monday starting the week, as a US calendar day, i.e. 2024-01-01
+    teamId: str
+    abbreviation: str
+    games: int
+    backToBacks: int  # The games played the day after another game, including one on the Sunday before the week
+    gameDays: list[str]
@@ -0,0 +1,23 @@
+import os
+
+TRUTHY_VALUES = ("1", "true", "yes")
+
+
+def is_truthy(value: str) -> bool:
+    """
+    Whether a flag's value turns it on, i.e. 1, true or yes, in any case.
+    """
+
+    return value.lower() in TRUTHY_VALUES
+
+
+def env_flag(name: str) -> bool:
+    """
+    Whether an opt-in feature is turned on by its environment variable, off when the variable isn't set.
+
+    :param name str: The environment variable, i.e. SNAPSHOTS_ENABLED.
+    :return: Whether the variable is set to 1, true or yes.
+    :rtype: bool
+    """
+
+    return is_truthy(os.getenv(name, ""))
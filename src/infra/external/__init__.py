@@ -1,5 +1,25 @@
-from src.infra.external.players_season_projections_fetcher import PlayersSeasonProjectionsFetcher
-from src.infra.external.scheduled_matchups_fetcher_service import ScheduledMatchupsFetcherService
-from src.infra.external.teams_fetcher import TeamsFetcher
-from src.infra.external.gamelogs_fetcher import GamelogsFetcher
-from src.infra.external.players_fetcher import PlayersFetcher
\ No newline at end of file
+import importlib
+
+# The fetchers pull in heavy dependencies, i.e. nba_api and BeautifulSoup, so they are only imported
+# when first accessed rather than when the package is imported.
+_LAZY_EXPORTS = {
+    "PlayersSeasonProjectionsFetcher": "src.infra.external.players_season_projections_fetcher",
+    "ScheduledMatchupsFetcherService": "src.infra.external.scheduled_matchups_fetcher_service",
+    "TeamsFetcher": "src.infra.external.teams_fetcher",
+    "GamelogsFetcher": "src.infra.external.gamelogs_fetcher",
+    "PlayersFetcher": "src.infra.external.players_fetcher",
+    "LiveBoxscoresFetcher": "src.infra.external.live_boxscores_fetcher",
+    "SleeperPlayerIndex": "src.infra.external.sleeper_player_index",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -3,6 +3,9 @@ import requests
 from datetime import datetime, timedelta
 from src.domain.entities import GamelogEntity, TeamEntity
 from src.interfaces.external import IGamelogsFetcher
+from src.app.monitoring import trace_stage
+from src.app.caching import team_registry
+from src.infra.external.sleeper_player_index import SleeperPlayerIndex, SleeperPlayer, get_sleeper_player_index
 
 
 class GamelogsFetcher(IGamelogsFetcher):
@@ -12,8 +15,12 @@ class GamelogsFetcher(IGamelogsFetcher):
     :param get_recent_game_ids: Gets the game_ids over the last 10 days
     :param get_season_game_ids: Gets the game_ids for a given season.
     :param execute: Fetches NBA player gamelogs according to the given game_ids.
+    :param sleeper_player_index SleeperPlayerIndex: The index of Sleeper's players, the process's by default.
     """
 
+    def __init__(self, sleeper_player_index: SleeperPlayerIndex = None):
+        self._sleeper_player_index = sleeper_player_index or get_sleeper_player_index()
+
     def get_recent_game_ids(self) -> dict[str, bool]:
         """
         Gets the game_ids over the last 3 days
@@ -74,23 +81,20 @@ class GamelogsFetcher(IGamelogsFetcher):
         :rtype: list[GamelogEntity]
         """
 
-        # Gets player data, i.e. position, from Sleeper's API
-        players_data = requests.get("https://api.sleeper.app/v1/players/nba").json()
-        player_name_to_sleeper_api_id_dict: dict = {
-            player_data.get("full_name", player_id): player_id
-            for player_id, player_data in players_data.items()
-            if player_data.get("status") == "ACT"
-        }
+        # Gets player data, i.e. position, from the Sleeper player index
+        sleeper_player_index: SleeperPlayerIndex = self._sleeper_player_index.load()
 
         # Get the gamelogs for each player in each game
         gamelogs = []
         for game_id, is_regular_season_game in game_ids.items():
             try:
                 # Get the game data from the NBA API
-                game_response = requests.get(
-                    f"https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{game_id}.json"
-                )
-                game = game_response.json()["game"]
+                with trace_stage("gamelogs_fetcher", "fetch"):
+                    game_response = requests.get(
+                        f"https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{game_id}.json"
+                    )
+                with trace_stage("gamelogs_fetcher", "parse"):
+                    game = game_response.json()["game"]
 
                 # Get the date of the game
                 game_date = game["gameTimeUTC"].split("T")[0]
@@ -109,127 +113,125 @@ class GamelogsFetcher(IGamelogsFetcher):
                 away_team_id = away_team["teamId"]
                 away_players = away_team["players"]
 
-                # Get the gamelogs for the home players
-                for home_player in home_players:
-                    stats = home_player["statistics"]
-                    position = "NaN"  # Position the player plays, i.e. power forward, shooting guard, etc
-                    minutes = float(stats["minutes"].split("M")[0][2:])
-                    seconds = float(stats["minutes"].split("M")[1][:2])
-                    minutes_played = minutes + (seconds / 60)
-                    is_active: bool = home_player.get("notPlayingReason") is None
-                    full_name = f"{home_player['firstName']} {home_player['familyName']}"
-                    sleeper_id: str = player_name_to_sleeper_api_id_dict.get(full_name, None)
-                    sleeper_api_player: dict = players_data.get(sleeper_id)
-
-                    if sleeper_api_player is not None:
-                        position = sleeper_api_player.get("position")
-
-                    gamelogs.append(
-                        GamelogEntity(
-                            gameId=str(game_id),
-                            season=season,
-                            dateUTC=game["gameTimeUTC"],
-                            playerId=str(home_player["personId"]),
-                            playerTeam=TeamEntity(
-                                teamId=str(home_team_id),
-                                abbreviation=home_team["teamTricode"],
-                                location=home_team["teamCity"],
-                                name=home_team["teamName"],
-                            ),
-                            isHomeGame=True,
-                            opposingTeam=TeamEntity(
-                                teamId=str(away_team_id),
-                                abbreviation=away_team["teamTricode"],
-                                location=away_team["teamCity"],
-                                name=away_team["teamName"],
-                            ),
-                            isRegularSeasonGame=is_regular_season_game,
-                            isActive=is_active,
-                            playerTeamScore=home_team["score"],
-                            opposingTeamScore=away_team["score"],
-                            position=position,
-                            isStarter=home_player["starter"],
-                            minutes=minutes_played,
-                            points=stats["points"],
-                            fieldGoalsMade=stats["fieldGoalsMade"],
-                            threesMade=stats["threePointersMade"],
-                            fieldGoalsAttempted=stats["fieldGoalsAttempted"],
-                            threesAttempted=stats["threePointersAttempted"],
-                            freeThrowsMade=stats["freeThrowsMade"],
-                            freeThrowsAttempted=stats["freeThrowsAttempted"],
-                            reboundsOffensive=stats["reboundsOffensive"],
-                            reboundsDefensive=stats["reboundsDefensive"],
-                            reboundsTotal=stats["reboundsTotal"],
-                            assists=stats["assists"],
-                            steals=stats["steals"],
-                            blocks=stats["blocks"],
-                            turnovers=stats["turnovers"],
-                            fouls=stats["foulsPersonal"],
-                            plusMinus=stats["plusMinusPoints"],
-                        )
+                # The game's two teams, shared by all of its gamelogs
+                home_team_entity: TeamEntity = team_registry.intern(
+                    TeamEntity(
+                        teamId=str(home_team_id),
+                        abbreviation=home_team["teamTricode"],
+                        location=home_team["teamCity"],
+                        name=home_team["teamName"],
+                    )
+                )
+                away_team_entity: TeamEntity = team_registry.intern(
+                    TeamEntity(
+                        teamId=str(away_team_id),
+                        abbreviation=away_team["teamTricode"],
+                        location=away_team["teamCity"],
+                        name=away_team["teamName"],
                     )
+                )
 
-                # Get the gamelogs for the away players
-                for away_player in away_players:
-                    stats = away_player["statistics"]
-                    position = "NaN"
-                    minutes = float(stats["minutes"].split("M")[0][2:])
-                    seconds = float(stats["minutes"].split("M")[1][:2])
-                    minutes_played = minutes + (seconds / 60)
-                    is_active = int(away_player.get("notPlayingReason") is None)
-
-                    # Get the player's position from the player data fetched from Sleeper's API
-                    for key, player in players_data.items():
-                        if (
-                            player["first_name"] == away_player["firstName"]
-                            and player["last_name"] in away_player["familyName"]
-                        ):
-                            position = player["position"]  # Position the player plays, i.e. center, pointguard, etc
-
-                    gamelogs.append(
-                        GamelogEntity(
-                            gameId=str(game_id),
-                            season=season,
-                            dateUTC=game["gameTimeUTC"],
-                            playerId=str(away_player["personId"]),
-                            playerTeam=TeamEntity(
-                                teamId=str(away_team_id),
-                                abbreviation=away_team["teamTricode"],
-                                location=away_team["teamCity"],
-                                name=away_team["teamName"],
-                            ),
-                            isHomeGame=True,
-                            opposingTeam=TeamEntity(
-                                teamId=str(home_team_id),
-                                abbreviation=home_team["teamTricode"],
-                                location=home_team["teamCity"],
-                                name=home_team["teamName"],
-                            ),
-                            isActive=is_active,
-                            isRegularSeasonGame=is_regular_season_game,
-                            playerTeamScore=away_team["score"],
-                            opposingTeamScore=home_team["score"],
-                            position=position,
-                            isStarter=away_player["starter"],
-                            minutes=minutes_played,
-                            points=stats["points"],
-                            fieldGoalsMade=stats["fieldGoalsMade"],
-                            threesMade=stats["threePointersMade"],
-                            fieldGoalsAttempted=stats["fieldGoalsAttempted"],
-                            threesAttempted=stats["threePointersAttempted"],
-                            freeThrowsMade=stats["freeThrowsMade"],
-                            freeThrowsAttempted=stats["freeThrowsAttempted"],
-                            reboundsOffensive=stats["reboundsOffensive"],
-                            reboundsDefensive=stats["reboundsDefensive"],
-                            reboundsTotal=stats["reboundsTotal"],
-                            assists=stats["assists"],
-                            steals=stats["steals"],
-                            blocks=stats["blocks"],
-                            turnovers=stats["turnovers"],
-                            fouls=stats["foulsPersonal"],
-                            plusMinus=stats["plusMinusPoints"],
+                with trace_stage("gamelogs_fetcher", "entity_build"):
+                    # Get the gamelogs for the home players
+                    for home_player in home_players:
+                        stats = home_player["statistics"]
+                        position = "NaN"  # Position the player plays, i.e. power forward, shooting guard, etc
+                        minutes = float(stats["minutes"].split("M")[0][2:])
+                        seconds = float(stats["minutes"].split("M")[1][:2])
+                        minutes_played = minutes + (seconds / 60)
+                        is_active: bool = home_player.get("notPlayingReason") is None
+                        full_name = f"{home_player['firstName']} {home_player['familyName']}"
+                        sleeper_id: str = sleeper_player_index.find_active_id(full_name)
+                        sleeper_api_player: SleeperPlayer = sleeper_player_index.get(sleeper_id)
+
+                        if sleeper_api_player is not None:
+                            position = sleeper_api_player.position
+
+                        gamelogs.append(
+                            GamelogEntity(
+                                gameId=str(game_id),
+                                season=season,
+                                dateUTC=game["gameTimeUTC"],
+                                playerId=str(home_player["personId"]),
+                                playerTeam=home_team_entity,
+                                isHomeGame=True,
+                                opposingTeam=away_team_entity,
+                                isRegularSeasonGame=is_regular_season_game,
+                                isActive=is_active,
+                                playerTeamScore=home_team["score"],
+                                opposingTeamScore=away_team["score"],
+                                position=position,
+                                isStarter=home_player["starter"],
+                                minutes=minutes_played,
+                                points=stats["points"],
+                                fieldGoalsMade=stats["fieldGoalsMade"],
+                                threesMade=stats["threePointersMade"],
+                                fieldGoalsAttempted=stats["fieldGoalsAttempted"],
+                                threesAttempted=stats["threePointersAttempted"],
+                                freeThrowsMade=stats["freeThrowsMade"],
+                                freeThrowsAttempted=stats["freeThrowsAttempted"],
+                                reboundsOffensive=stats["reboundsOffensive"],
+                                reboundsDefensive=stats["reboundsDefensive"],
+                                reboundsTotal=stats["reboundsTotal"],
+                                assists=stats["assists"],
+                                steals=stats["steals"],
+                                blocks=stats["blocks"],
+                                turnovers=stats["turnovers"],
+                                fouls=stats["foulsPersonal"],
+                                plusMinus=stats["plusMinusPoints"],
+                            )
+                        )
+
+                    # Get the gamelogs for the away players
+                    for away_player in away_players:
+                        stats = away_player["statistics"]
+                        position = "NaN"
+                        minutes = float(stats["minutes"].split("M")[0][2:])
+                        seconds = float(stats["minutes"].split("M")[1][:2])
+                        minutes_played = minutes + (seconds / 60)
+                        is_active = int(away_player.get("notPlayingReason") is None)
+
+                        # Get the player's position, i.e. center, pointguard, etc, from Sleeper's player data
+                        sleeper_api_player = sleeper_player_index.find_by_name(
+                            away_player["firstName"], away_player["familyName"]
+                        )
+                        if sleeper_api_player is not None:
+                            position = sleeper_api_player.position
+
+                        gamelogs.append(
+                            GamelogEntity(
+                                gameId=str(game_id),
+                                season=season,
+                                dateUTC=game["gameTimeUTC"],
+                                playerId=str(away_player["personId"]),
+                                playerTeam=away_team_entity,
+                                isHomeGame=True,
+                                opposingTeam=home_team_entity,
+                                isActive=is_active,
+                                isRegularSeasonGame=is_regular_season_game,
+                                playerTeamScore=away_team["score"],
+                                opposingTeamScore=home_team["score"],
+                                position=position,
+                                isStarter=away_player["starter"],
+                                minutes=minutes_played,
+                                points=stats["points"],
+                                fieldGoalsMade=stats["fieldGoalsMade"],
+                                threesMade=stats["threePointersMade"],
+                                fieldGoalsAttempted=stats["fieldGoalsAttempted"],
+                                threesAttempted=stats["threePointersAttempted"],
+                                freeThrowsMade=stats["freeThrowsMade"],
+                                freeThrowsAttempted=stats["freeThrowsAttempted"],
+                                reboundsOffensive=stats["reboundsOffensive"],
+                                reboundsDefensive=stats["reboundsDefensive"],
+                                reboundsTotal=stats["reboundsTotal"],
+                                assists=stats["assists"],
+                                steals=stats["steals"],
+                                blocks=stats["blocks"],
+                                turnovers=stats["turnovers"],
+                                fouls=stats["foulsPersonal"],
+                                plusMinus=stats["plusMinusPoints"],
+                            )
                         )
-                    )
             except Exception as e:
                 print(f"Error: {e.with_traceback(e.__traceback__)}")
             finally:
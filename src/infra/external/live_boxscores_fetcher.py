@@ -0,0 +1,145 @@
+import requests
+from src.domain.value_objects import LivePlayerStats
+from src.interfaces.external import ILiveBoxscoresFetcher
+from src.app.monitoring import trace_stage
+
+BOXSCORE_URL: str = "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{game_id}.json"
+GAME_STATUS_FINAL: int = 3
+REGULATION_PERIODS: int = 4
+PERIOD_MINUTES: float = 12.0
+
+# The boxscore fields a player's line is compared on between polls
+_SIGNATURE_FIELDS: tuple[str, ...] = (
+    "minutes",
+    "points",
+    "reboundsTotal",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "threePointersMade",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+)
+
+
+class LiveBoxscoresFetcher(ILiveBoxscoresFetcher):
+    """
+    Polls the NBA live boxscores with conditional requests, and only parses the players whose line changed.
+
+    The ETag of every game's last response is sent back as If-None-Match, so a boxscore that didn't change
+    since the last poll costs a 304 with no body. When it did change, every player's line is compared to the
+    one of the last poll, and only changed players are turned into LivePlayerStats. Every player of the game is
+    returned when the period changes or the game ends, as their remaining playing time changed.
+
+    :param session requests.Session: The session the boxscores are requested with, kept alive between polls.
+    :param timeout float: The timeout of a request in seconds.
+    """
+
+    def __init__(self, session: requests.Session = None, timeout: float = 10):
+        self._session = session or requests.Session()
+        self._timeout = timeout
+        self._etags: dict[str, str] = {}
+        self._game_states: dict[str, tuple] = {}  # Maps game ids to their last (status, period)
+        self._player_signatures: dict[str, dict[str, tuple]] = {}  # Maps game ids to the last line of each player
+
+    def get_changed_player_stats(self, game_id: str) -> list[LivePlayerStats]:
+        """
+        Gets the stats of the players whose line changed since the game was last polled.
+
+        :param game_id str: The id of the game to poll.
+        :return: The current stats of the players whose line changed, none if the boxscore didn't change.
+        :rtype: list[LivePlayerStats]
+        """
+
+        headers = {"If-None-Match": self._etags[game_id]} if game_id in self._etags else {}
+        with trace_stage("live_boxscores_fetcher", "fetch"):
+            response = self._session.get(BOXSCORE_URL.format(game_id=game_id), headers=headers, timeout=self._timeout)
+        if response.status_code == 304:
+            return []
+        if response.status_code in (403, 404):  # The boxscore isn't published until shortly before tip-off
+            return []
+        response.raise_for_status()
+        if response.headers.get("ETag"):
+            self._etags[game_id] = response.headers["ETag"]
+
+        with trace_stage("live_boxscores_fetcher", "parse"):
+            game: dict = response.json()["game"]
+            is_final = game["gameStatus"] == GAME_STATUS_FINAL
+            game_progress = 1.0 if is_final else _regulation_progress(game["period"], game.get("gameClock"))
+
+            game_state = (game["gameStatus"], game["period"])
+            state_changed = self._game_states.get(game_id) != game_state
+            self._game_states[game_id] = game_state
+            previous_signatures = self._player_signatures.setdefault(game_id, {})
+
+            changed_player_stats: list[LivePlayerStats] = []
+            for team in (game["homeTeam"], game["awayTeam"]):
+                for player in team["players"]:
+                    player_id = str(player["personId"])
+                    stats: dict = player["statistics"]
+                    is_active = player.get("notPlayingReason") is None
+                    signature = (is_active,) + tuple(stats.get(field) for field in _SIGNATURE_FIELDS)
+                    if not state_changed and previous_signatures.get(player_id) == signature:
+                        continue
+                    previous_signatures[player_id] = signature
+
+                    changed_player_stats.append(
+                        LivePlayerStats(
+                            gameId=str(game_id),
+                            playerId=player_id,
+                            isActive=is_active,
+                            isFinal=is_final,
+                            gameProgress=game_progress,
+                            minutes=_parse_minutes(stats["minutes"]),
+                            fieldGoalsAttempted=stats["fieldGoalsAttempted"],
+                            fieldGoalsMade=stats["fieldGoalsMade"],
+                            threesMade=stats["threePointersMade"],
+                            points=stats["points"],
+                            steals=stats["steals"],
+                            blocks=stats["blocks"],
+                            assists=stats["assists"],
+                            rebounds=stats["reboundsTotal"],
+                            turnovers=stats["turnovers"],
+                            freeThrowsAttempted=stats["freeThrowsAttempted"],
+                            freeThrowsMade=stats["freeThrowsMade"],
+                        )
+                    )
+
+        return changed_player_stats
+
+    def forget_game(self, game_id: str) -> None:
+        """
+        Drops the ETag and the player lines remembered for a game.
+
+        :param game_id str: The id of the game.
+        """
+
+        self._etags.pop(game_id, None)
+        self._game_states.pop(game_id, None)
+        self._player_signatures.pop(game_id, None)
+
+
+def _parse_minutes(duration: str) -> float:
+    """
+    Parses an ISO 8601 boxscore duration, i.e. PT25M01.00S, into minutes.
+    """
+
+    minutes, seconds = duration.split("M")
+    return float(minutes[2:] or 0) + float(seconds.rstrip("S") or 0) / 60
+
+
+def _regulation_progress(period: int, game_clock: str) -> float:
+    """
+    Gets the fraction of regulation played from the period and the time left on its clock.
+    """
+
+    if period <= 0:
+        return 0.0
+    if period > REGULATION_PERIODS:
+        return 1.0
+    minutes_left = _parse_minutes(game_clock) if game_clock else 0.0
+    minutes_played = (period - 1) * PERIOD_MINUTES + (PERIOD_MINUTES - minutes_left)
+    return min(max(minutes_played / (REGULATION_PERIODS * PERIOD_MINUTES), 0.0), 1.0)
@@ -2,7 +2,9 @@ import asyncio
 import requests
 from nba_api.stats.static import teams as teams_fetcher, players as nba_api_players_fetcher
 from src.domain.entities import PlayerEntity, TeamEntity
+from src.app.caching import team_registry
 from src.infra.external import PlayersSeasonProjectionsFetcher
+from src.infra.external.sleeper_player_index import SleeperPlayerIndex, SleeperPlayer, get_sleeper_player_index
 from src.domain.value_objects import PlayerSeasonProjections
 from src.interfaces.external import IPlayersFetcher
 
@@ -13,8 +15,13 @@ class PlayersFetcher(IPlayersFetcher):
 
     This class integrates multiple APIs and web scrapers to gather NBA player data,
     including projections, rankings, and other relevant information.
+
+    :param sleeper_player_index SleeperPlayerIndex: The index of Sleeper's players, the process's by default.
     """
 
+    def __init__(self, sleeper_player_index: SleeperPlayerIndex = None):
+        self._sleeper_player_index = sleeper_player_index or get_sleeper_player_index()
+
     async def execute(self) -> list[PlayerEntity]:
         """Fetches NBA players from APIs.
 
@@ -24,20 +31,19 @@ class PlayersFetcher(IPlayersFetcher):
 
         teams_dict: dict = {}
         for team in teams_fetcher.get_teams():
-            teams_dict[team["abbreviation"]] = TeamEntity(
-                teamId=str(team["id"]), location=team["city"], name=team["nickname"], abbreviation=team["abbreviation"]
+            teams_dict[team["abbreviation"]] = team_registry.intern(
+                TeamEntity(
+                    teamId=str(team["id"]),
+                    location=team["city"],
+                    name=team["nickname"],
+                    abbreviation=team["abbreviation"],
+                )
             )
 
         nba_api_players: list[dict] = nba_api_players_fetcher.get_players()
 
-        # Get the NBA players from the Sleeper API
-        sleeper_api_players: dict = requests.get(url="https://api.sleeper.app/v1/players/nba").json()
-
-        player_name_to_sleeper_api_id_dict: dict = {
-            player_data.get("full_name", player_id): player_id
-            for player_id, player_data in sleeper_api_players.items()
-            if player_data.get("status") == "ACT"
-        }
+        # Get the NBA players from the Sleeper API, refreshed for up-to-date injury statuses and depth charts
+        sleeper_player_index: SleeperPlayerIndex = self._sleeper_player_index.refresh()
 
         # Get the player's projected season stats and rankings for points and category leagues
         season_projections_fetcher = PlayersSeasonProjectionsFetcher()
@@ -63,11 +69,11 @@ class PlayersFetcher(IPlayersFetcher):
                 last_name: str = nba_api_player["last_name"]
                 full_name: str = f"{first_name} {last_name}"
                 team: TeamEntity = None
-                sleeper_id: str = player_name_to_sleeper_api_id_dict.get(full_name, None)
-                sleeper_api_player = sleeper_api_players.get(sleeper_id)
+                sleeper_id: str = sleeper_player_index.find_active_id(full_name)
+                sleeper_api_player: SleeperPlayer = sleeper_player_index.get(sleeper_id)
 
                 if sleeper_api_player is not None:
-                    team = teams_dict.get(sleeper_api_player.get("team"))
+                    team = teams_dict.get(sleeper_api_player.team)
                 else:
                     continue
 
@@ -81,19 +87,19 @@ class PlayersFetcher(IPlayersFetcher):
                 # Combine all the player's information into a PlayerEntity object.
                 player_entity = PlayerEntity(
                     playerId=str(nba_api_player["id"]),
-                    rotowireId=str(sleeper_api_player["rotowire_id"]),  # Fantasy news provider.
+                    rotowireId=str(sleeper_api_player.rotowire_id),  # Fantasy news provider.
                     firstName=first_name,
                     lastName=last_name,
-                    fantasyPositions=sleeper_api_player["fantasy_positions"],
-                    position=sleeper_api_player["position"],
+                    fantasyPositions=sleeper_api_player.fantasy_positions,
+                    position=sleeper_api_player.position,
                     team=team,
-                    height=sleeper_api_player["height"],
-                    weight=sleeper_api_player["weight"],
-                    age=sleeper_api_player["age"],
+                    height=sleeper_api_player.height,
+                    weight=sleeper_api_player.weight,
+                    age=sleeper_api_player.age,
                     currentWeekProjections=[],
-                    jerseyNumber=sleeper_api_player["number"],
-                    depthChartOrder=sleeper_api_player["depth_chart_order"],
-                    injuryStatus=sleeper_api_player["injury_status"],
+                    jerseyNumber=sleeper_api_player.number,
+                    depthChartOrder=sleeper_api_player.depth_chart_order,
+                    injuryStatus=sleeper_api_player.injury_status,
                     seasonProjections=season_projections,
                     seasonTotals=None,
                     addCount=add_count,
@@ -1,6 +1,8 @@
 import requests
 from src.domain.entities import TeamEntity, ScheduledMatchupEntity
 from src.interfaces.external.scheduled_matchups_fetcher_service_interface import IScheduledMatchupsFetcherService
+from src.app.monitoring import trace_stage
+from src.app.caching import team_registry
 
 
 class ScheduledMatchupsFetcherService(IScheduledMatchupsFetcherService):
@@ -19,29 +21,45 @@ class ScheduledMatchupsFetcherService(IScheduledMatchupsFetcherService):
 
         # Get the current week's schedule
         URL = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-        response = requests.get(URL) # Make request to the NBA schedule API.
-        game_dates = response.json()["leagueSchedule"]["gameDates"]
+        with trace_stage("scheduled_matchups_fetcher", "fetch"):
+            response = requests.get(URL) # Make request to the NBA schedule API.
+        with trace_stage("scheduled_matchups_fetcher", "parse"):
+            game_dates = response.json()["leagueSchedule"]["gameDates"]
         current_week_schedule = [game_date for game_date in game_dates]
 
         # Create a list of scheduled matchups for the week
+        with trace_stage("scheduled_matchups_fetcher", "entity_build"):
+            week_matchups = self._build_matchups(current_week_schedule)
+
+        return week_matchups
+
+    def _build_matchups(self, current_week_schedule: list[dict]) -> list[ScheduledMatchupEntity]:
+        """
+        Builds the scheduled matchup entities from the NBA schedule's game dates.
+        """
+
         week_matchups = []
         for game_date in current_week_schedule:
             for game in game_date["games"]:
                 scheduled_matchup = ScheduledMatchupEntity(
                     gameId=str(game["gameId"]),
                     dateTimeUTC=game["gameDateTimeUTC"],
-                    homeTeam=TeamEntity(
-                        teamId=str(game["homeTeam"]["teamId"]),
-                        name=game["homeTeam"]["teamName"],
-                        abbreviation=game["homeTeam"]["teamTricode"],
-                        location=game["homeTeam"]["teamCity"],
+                    homeTeam=team_registry.intern(
+                        TeamEntity(
+                            teamId=str(game["homeTeam"]["teamId"]),
+                            name=game["homeTeam"]["teamName"],
+                            abbreviation=game["homeTeam"]["teamTricode"],
+                            location=game["homeTeam"]["teamCity"],
+                        )
+                    ),
+                    awayTeam=team_registry.intern(
+                        TeamEntity(
+                            teamId=str(game["awayTeam"]["teamId"]),
+                            name=game["awayTeam"]["teamName"],
+                            abbreviation=game["awayTeam"]["teamTricode"],
+                            location=game["awayTeam"]["teamCity"],
+                        )
                     ),
-                    awayTeam=TeamEntity(
-                        teamId=str(game["awayTeam"]["teamId"]),
-                        name=game["awayTeam"]["teamName"],
-                        abbreviation=game["awayTeam"]["teamTricode"],
-                        location=game["awayTeam"]["teamCity"],
-                    )
                 )
                 week_matchups.append(scheduled_matchup)
 
@@ -0,0 +1,202 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional
+import orjson
+import requests
+from src.app.monitoring import trace_stage
+from src.infra.files import atomic_write_bytes
+
+SLEEPER_PLAYERS_URL = "https://api.sleeper.app/v1/players/nba"
+SLEEPER_PLAYER_INDEX_ID = "sleeperPlayerIndex"
+DEFAULT_INDEX_PATH = "cache/sleeper_player_index.json"
+
+
+class SleeperPlayer(NamedTuple):
+    """
+    The fields of a Sleeper player the fetchers use, out of the hundred or so in Sleeper's players dump.
+    """
+
+    full_name: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    status: Optional[str]
+    team: Optional[str]
+    position: Optional[str]
+    fantasy_positions: Optional[list[str]]
+    depth_chart_order: Optional[int]
+    injury_status: Optional[str]
+    rotowire_id: Optional[int]
+    height: Optional[str]
+    weight: Optional[str]
+    age: Optional[int]
+    number: Optional[int]
+
+
+class SleeperPlayerIndex:
+    """
+    A slim index of Sleeper's NBA players, shared by the fetchers instead of each of them downloading and
+    parsing Sleeper's players dump.
+
+    The dump is parsed once with orjson and only the fields of SleeperPlayer are kept, keyed by Sleeper id and
+    by name. The index is persisted to disk and to the metadata collection with the time it was refreshed, so
+    that other processes and restarts load it rather than downloading the dump again while it is fresh.
+
+    :param path str: The file the index is persisted to, SLEEPER_INDEX_PATH or cache/sleeper_player_index.json
+        by default.
+    :param max_age_seconds float: How long a persisted index is used before the dump is downloaded again,
+        SLEEPER_INDEX_MAX_AGE_SECONDS or 12 hours by default.
+    :param metadata_collection Collection: The collection the index is persisted to, if any.
+    """
+
+    def __init__(self, path: str = None, max_age_seconds: float = None, metadata_collection=None):
+        self._path = Path(path or os.getenv("SLEEPER_INDEX_PATH", DEFAULT_INDEX_PATH))
+        self._max_age = timedelta(
+            seconds=max_age_seconds or float(os.getenv("SLEEPER_INDEX_MAX_AGE_SECONDS", str(12 * 60 * 60)))
+        )
+        self._metadata_collection = metadata_collection
+        self._lock = threading.Lock()
+        self._refreshed_at: Optional[datetime] = None
+        self._players: dict[str, SleeperPlayer] = {}
+        self._active_ids_by_full_name: dict[str, str] = {}
+        self._ids_by_first_name: dict[str, list[str]] = {}
+
+    def load(self) -> "SleeperPlayerIndex":
+        """
+        Makes sure the index is loaded and fresh, reading it from disk or from the metadata collection if it
+        was persisted within the max age, and downloading the dump otherwise.
+
+        :return: The index itself.
+        :rtype: SleeperPlayerIndex
+        """
+
+        with self._lock:
+            if self._is_fresh(self._refreshed_at):
+                return self
+            for document in (self._read_file(), self._read_metadata()):
+                if document is not None and self._is_fresh(_parse_timestamp(document["refreshedAt"])):
+                    self._build(document)
+                    self._write_file(document)
+                    return self
+            self._refresh()
+        return self
+
+    def refresh(self) -> "SleeperPlayerIndex":
+        """
+        Downloads and indexes Sleeper's players dump regardless of the age of the index, i.e. for
+        up-to-date injury statuses and depth charts.
+
+        :return: The index itself.
+        :rtype: SleeperPlayerIndex
+        """
+
+        with self._lock:
+            self._refresh()
+        return self
+
+    def get(self, sleeper_id: Optional[str]) -> Optional[SleeperPlayer]:
+        """
+        Gets a player by Sleeper id.
+
+        :param sleeper_id str: The Sleeper id of the player.
+        :return: The player, or None if there is no player with the id.
+        :rtype: Optional[SleeperPlayer]
+        """
+
+        return self._players.get(sleeper_id)
+
+    def find_active_id(self, full_name: str) -> Optional[str]:
+        """
+        Finds the Sleeper id of an active player by full name.
+
+        :param full_name str: The full name of the player, i.e. "LeBron James".
+        :return: The Sleeper id, or None if no active player has the name.
+        :rtype: Optional[str]
+        """
+
+        return self._active_ids_by_full_name.get(full_name)
+
+    def find_by_name(self, first_name: str, family_name: str) -> Optional[SleeperPlayer]:
+        """
+        Finds a player, active or not, by first name and a family name containing the player's last name, i.e.
+        "Jaren Jackson Jr." for Sleeper's "Jaren Jackson". The last such player of the dump wins.
+
+        :param first_name str: The first name of the player.
+        :param family_name str: The family name of the player, as listed in NBA boxscores.
+        :return: The player, or None if there is no matching player.
+        :rtype: Optional[SleeperPlayer]
+        """
+
+        for sleeper_id in reversed(self._ids_by_first_name.get(first_name, [])):
+            player = self._players[sleeper_id]
+            if player.last_name is not None and player.last_name in family_name:
+                return player
+        return None
+
+    def _refresh(self) -> None:
+        with trace_stage("sleeper_player_index", "fetch"):
+            response = requests.get(SLEEPER_PLAYERS_URL)
+        with trace_stage("sleeper_player_index", "parse"):
+            dump: dict[str, dict] = orjson.loads(response.content)
+            document = {
+                "refreshedAt": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "players": {
+                    sleeper_id: [player.get(field) for field in SleeperPlayer._fields]
+                    for sleeper_id, player in dump.items()
+                },
+            }
+        del dump
+        self._build(document)
+        self._write_file(document)
+        if self._metadata_collection is not None:
+            self._metadata_collection.replace_one({"_id": SLEEPER_PLAYER_INDEX_ID}, document, upsert=True)
+
+    def _build(self, document: dict) -> None:
+        players = {sleeper_id: SleeperPlayer(*values) for sleeper_id, values in document["players"].items()}
+        active_ids_by_full_name: dict[str, str] = {}
+        ids_by_first_name: dict[str, list[str]] = {}
+        for sleeper_id, player in players.items():
+            if player.status == "ACT":
+                active_ids_by_full_name[player.full_name or sleeper_id] = sleeper_id
+            ids_by_first_name.setdefault(player.first_name, []).append(sleeper_id)
+
+        self._players = players
+        self._active_ids_by_full_name = active_ids_by_full_name
+        self._ids_by_first_name = ids_by_first_name
+        self._refreshed_at = _parse_timestamp(document["refreshedAt"])
+
+    def _is_fresh(self, refreshed_at: Optional[datetime]) -> bool:
+        return refreshed_at is not None and datetime.utcnow() - refreshed_at < self._max_age
+
+    def _read_file(self) -> Optional[dict]:
+        if not self._path.is_file():
+            return None
+        return orjson.loads(self._path.read_bytes())
+
+    def _write_file(self, document: dict) -> None:
+        atomic_write_bytes(self._path, orjson.dumps(document))
+
+    def _read_metadata(self) -> Optional[dict]:
+        if self._metadata_collection is None:
+            return None
+        return self._metadata_collection.find_one({"_id": SLEEPER_PLAYER_INDEX_ID}, {"_id": 0})
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=None)
+def get_sleeper_player_index() -> SleeperPlayerIndex:
+    """
+    Gets the process's Sleeper player index, persisted to the metadata collection.
+
+    :return: The Sleeper player index
+    :rtype: SleeperPlayerIndex
+    """
+
+    from src.infra.persistence import database
+
+    return SleeperPlayerIndex(metadata_collection=database.get_collection(database.METADATA))
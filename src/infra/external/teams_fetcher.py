@@ -1,4 +1,5 @@
 from src.domain.entities import TeamEntity
+from src.app.caching import team_registry
 from src.interfaces.external import ITeamsFetcherService
 
 
@@ -48,4 +49,4 @@ class TeamsFetcher(ITeamsFetcherService):
             TeamEntity(name="Wizards", location="Washington", abbreviation="WAS", teamId="1610612764"),
         ]
 
-        return nba_teams
+        return team_registry.seed(nba_teams)
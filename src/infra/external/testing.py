@@ -1,7 +1,9 @@
 import requests
 from nba_api.stats.static import teams as teams_fetcher, players as nba_api_players_fetcher
 from src.domain.entities import PlayerEntity, TeamEntity
+from src.app.caching import team_registry
 from src.infra.external import PlayersSeasonProjectionsFetcher
+from src.infra.external.sleeper_player_index import get_sleeper_player_index
 from src.domain.value_objects import PlayerSeasonProjections
 from src.interfaces.external import IPlayersFetcher
 
@@ -12,20 +14,19 @@ class Testing:
 
         teams_dict: dict = {}
         for team in teams_fetcher.get_teams():
-            teams_dict[team["abbreviation"]] = TeamEntity(
-                teamId=str(team["id"]), location=team["city"], name=team["nickname"], abbreviation=team["abbreviation"]
+            teams_dict[team["abbreviation"]] = team_registry.intern(
+                TeamEntity(
+                    teamId=str(team["id"]),
+                    location=team["city"],
+                    name=team["nickname"],
+                    abbreviation=team["abbreviation"],
+                )
             )
 
         nba_api_players: list[dict] = nba_api_players_fetcher.get_players()
 
-        # Get the NBA players from the Sleeper API
-        sleeper_api_players: dict = requests.get(url="https://api.sleeper.app/v1/players/nba").json()
-
-        player_name_to_sleeper_api_id_dict: dict = {
-            player_data.get("full_name", player_id): player_id
-            for player_id, player_data in sleeper_api_players.items()
-            if player_data.get("status") == "ACT"
-        }
+        # Get the NBA players from the Sleeper player index
+        sleeper_player_index = get_sleeper_player_index().load()
 
         # Get the player's projected season stats and rankings for points and category leagues
         season_projections_fetcher = PlayersSeasonProjectionsFetcher()
@@ -42,8 +43,7 @@ class Testing:
         return {
             "teams_dict": teams_dict,
             "nba_api_players": nba_api_players,
-            "sleeper_api_players": sleeper_api_players,
-            "player_name_to_sleeper_api_id_dict": player_name_to_sleeper_api_id_dict,
+            "sleeper_player_index": sleeper_player_index,
             "players_season_projections": players_season_projections,
             "player_adds_dict": player_adds_dict,
             "player_drops_dict": player_drops_dict
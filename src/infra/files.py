@@ -0,0 +1,19 @@
+import uuid
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write_bytes(path: Union[str, Path], content: bytes) -> None:
+    """
+    Writes a file next to its path and renames it over the path, so that readers, in this or another process,
+    see either the previous or the new content and never a partially written file.
+
+    :param path str | Path: The path of the file, whose directory is created if it doesn't exist.
+    :param content bytes: The content of the file.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    temporary_path.write_bytes(content)
+    temporary_path.replace(path)
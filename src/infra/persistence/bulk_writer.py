@@ -0,0 +1,174 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from pydantic import BaseModel
+from pymongo.collection import Collection
+from pymongo.errors import AutoReconnect, BulkWriteError
+from src.app.monitoring import metrics_registry
+
+# Write error codes of a primary stepping down, a shutdown or a network error, which succeed when retried
+RETRYABLE_ERROR_CODES: frozenset[int] = frozenset(
+    {6, 7, 89, 91, 112, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436}
+)
+
+bulk_write_documents_total = metrics_registry.counter(
+    "mongo_bulk_write_documents_total",
+    "Number of documents matched, modified, upserted, inserted or deleted by bulk writes.",
+    ("collection", "result"),
+)
+bulk_write_retries_total = metrics_registry.counter(
+    "mongo_bulk_write_retries_total", "Number of bulk write chunks retried after a transient error.", ("collection",)
+)
+
+
+class BulkWriteStats(BaseModel):
+    matched: int = 0
+    modified: int = 0
+    upserted: int = 0
+    inserted: int = 0
+    deleted: int = 0
+    chunks: int = 0
+    retries: int = 0
+    writeErrors: list[dict] = []  # The errors of the operations that couldn't be written, with their index
+
+    def add(self, other: "BulkWriteStats") -> None:
+        for field in ("matched", "modified", "upserted", "inserted", "deleted", "chunks", "retries"):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.writeErrors.extend(other.writeErrors)
+
+
+class BulkWriter:
+    """
+    Writes bulk operations to a collection in chunks, so a large write is neither one huge batch nor aborted
+    by its first error.
+
+    Chunks are written unordered by default, so every operation that can be written is, and chunks failing
+    with a transient error, i.e. a primary stepping down, are retried with an exponential backoff. Only the
+    operations that failed are retried, which is safe as the repositories' operations are idempotent upserts,
+    updates and deletes. Errors that remain are raised once every chunk was written.
+
+    :param chunk_size int: The number of operations per bulk_write, BULK_WRITE_CHUNK_SIZE or 1000 by default.
+    :param max_workers int: The number of chunks written concurrently, BULK_WRITE_WORKERS or 1 by default,
+        in which case the chunks are written in order on the calling thread.
+    :param max_retries int: The number of times a chunk is retried.
+    :param backoff_seconds float: The wait before the first retry, doubled before every following one.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ):
+        self._chunk_size = max(chunk_size or int(os.getenv("BULK_WRITE_CHUNK_SIZE", "1000")), 1)
+        self._max_workers = max(max_workers or int(os.getenv("BULK_WRITE_WORKERS", "1")), 1)
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+
+    def execute(self, collection: Collection, operations: list, ordered: bool = False) -> BulkWriteStats:
+        """
+        Writes the operations to the collection.
+
+        :param collection Collection: The collection to write to.
+        :param operations list: The operations, i.e. UpdateOne or DeleteOne.
+        :param ordered bool: Whether the operations must be applied in order, i.e. several updates of the same
+            document that depend on each other. The chunks are then written one after the other, and the first
+            error stops the write.
+        :return: The number of documents written, chunks and retries.
+        :rtype: BulkWriteStats
+        :raises BulkWriteError: If any operation couldn't be written, with the aggregated statistics as details.
+        """
+
+        stats = BulkWriteStats()
+        if not operations:
+            return stats
+
+        chunks = [
+            (start, operations[start : start + self._chunk_size])
+            for start in range(0, len(operations), self._chunk_size)
+        ]
+        if ordered or self._max_workers == 1 or len(chunks) == 1:
+            for start, chunk in chunks:
+                chunk_stats = self._write_chunk(collection, start, chunk, ordered)
+                stats.add(chunk_stats)
+                if ordered and chunk_stats.writeErrors:
+                    break
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(chunks))) as executor:
+                for chunk_stats in executor.map(
+                    lambda indexed_chunk: self._write_chunk(collection, *indexed_chunk, ordered), chunks
+                ):
+                    stats.add(chunk_stats)
+
+        for result in ("matched", "modified", "upserted", "inserted", "deleted"):
+            bulk_write_documents_total.inc(collection.name, result, amount=getattr(stats, result))
+        if stats.writeErrors:
+            raise BulkWriteError({**stats.model_dump(), "writeErrors": stats.writeErrors})
+        return stats
+
+    def _write_chunk(self, collection: Collection, start: int, chunk: list, ordered: bool) -> BulkWriteStats:
+        """
+        Writes a chunk of operations, retrying the operations that failed with a transient error.
+
+        :param collection Collection: The collection to write to.
+        :param start int: The index of the chunk's first operation, so errors point at the caller's operations.
+        :param chunk list: The operations of the chunk.
+        :param ordered bool: Whether the operations must be applied in order.
+        :return: The statistics of the chunk.
+        :rtype: BulkWriteStats
+        """
+
+        stats = BulkWriteStats(chunks=1)
+        indexes = list(range(start, start + len(chunk)))  # The caller's index of every pending operation
+        pending = chunk
+        for attempt in range(self._max_retries + 1):
+            if attempt > 0:
+                stats.retries += 1
+                bulk_write_retries_total.inc(collection.name)
+                time.sleep(self._backoff_seconds * 2 ** (attempt - 1))
+
+            try:
+                result = collection.bulk_write(pending, ordered=ordered)
+                stats.matched += result.matched_count
+                stats.modified += result.modified_count
+                stats.upserted += result.upserted_count
+                stats.inserted += result.inserted_count
+                stats.deleted += result.deleted_count
+                return stats
+            except AutoReconnect as e:
+                # The server may or may not have applied the chunk, so all of it is retried
+                last_errors = [{"index": index, "code": None, "errmsg": str(e)} for index in indexes]
+            except BulkWriteError as e:
+                stats.matched += e.details.get("nMatched", 0)
+                stats.modified += e.details.get("nModified", 0)
+                stats.upserted += e.details.get("nUpserted", 0)
+                stats.inserted += e.details.get("nInserted", 0)
+                stats.deleted += e.details.get("nRemoved", 0)
+                write_errors = e.details.get("writeErrors", [])
+                stats.writeErrors.extend(e.details.get("writeConcernErrors", []))
+                if ordered and write_errors:
+                    # An ordered write stops at its first error, so the operations after it are pending too
+                    retry_positions = (
+                        list(range(write_errors[0]["index"], len(pending)))
+                        if write_errors[0].get("code") in RETRYABLE_ERROR_CODES
+                        else []
+                    )
+                else:
+                    retry_positions = [
+                        error["index"] for error in write_errors if error.get("code") in RETRYABLE_ERROR_CODES
+                    ]
+
+                failed_errors = [{**error, "index": indexes[error["index"]]} for error in write_errors]
+                stats.writeErrors.extend(
+                    error for error in failed_errors if error.get("code") not in RETRYABLE_ERROR_CODES
+                )
+                if not retry_positions:
+                    return stats
+                last_errors = [error for error in failed_errors if error.get("code") in RETRYABLE_ERROR_CODES]
+                indexes = [indexes[position] for position in retry_positions]
+                pending = [pending[position] for position in retry_positions]
+
+        stats.writeErrors.extend(last_errors)
+        return stats
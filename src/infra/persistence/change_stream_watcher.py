@@ -0,0 +1,236 @@
+"""
+Watches MongoDB's change streams, so that every instance invalidates the caches derived from data another
+instance changed, i.e. the players after POST /api/v1/players/projections ran elsewhere.
+
+Change streams need a replica set. Locally, a single-node replica set is enough:
+
+    mongod --replSet rs0 --dbpath ./data/db --bind_ip localhost
+    mongosh --eval 'rs.initiate({_id: "rs0", members: [{_id: 0, host: "localhost:27017"}]})'
+    MONGODB_URL="mongodb://localhost:27017/?replicaSet=rs0" CHANGE_STREAMS_ENABLED=true uvicorn main:app
+
+MongoDB Atlas and Cosmos DB for MongoDB vCore clusters are replica sets already.
+"""
+
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+import orjson
+from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
+from src.infra.persistence import database
+from src.infra.files import atomic_write_bytes
+from src.domain.value_objects import CacheInvalidation, PLAYERS_DATA, GAMELOGS_DATA, SCHEDULED_MATCHUPS_DATA
+from src.app.caching import InvalidationBus
+
+# The watched collections, and the data whose caches their changes invalidate
+WATCHED_COLLECTIONS: dict[str, str] = {
+    database.PLAYERS: PLAYERS_DATA,
+    database.GAMELOGS: GAMELOGS_DATA,
+    database.GAMELOG_BUCKETS: GAMELOGS_DATA,
+    database.SCHEDULED_MATCHUPS: SCHEDULED_MATCHUPS_DATA,
+}
+DEFAULT_RESUME_TOKEN_PATH = "cache/change_stream_resume_token.json"
+# How often the resume token is saved while no changes come in, as the stream's position still moves
+IDLE_SAVE_SECONDS = 60
+# The errors of a resume token the oplog no longer holds, after which the stream has to start over
+HISTORY_LOST_CODES: tuple[int, ...] = (260, 280, 286)
+# Only the fields identifying the changed players, games and teams are sent, not the changed documents
+CHANGE_PROJECTION: dict[str, int] = {
+    "operationType": 1,
+    "ns": 1,
+    "fullDocument.playerId": 1,
+    "fullDocument.gameId": 1,
+    "fullDocument.team.teamId": 1,
+    "fullDocument.playerTeam.teamId": 1,
+    "fullDocument.opposingTeam.teamId": 1,
+    "fullDocument.homeTeam.teamId": 1,
+    "fullDocument.awayTeam.teamId": 1,
+    "fullDocument.teams": 1,
+    "updateDescription.updatedFields": 1,
+}
+
+
+class ChangeStreamWatcher:
+    """
+    Watches the players, gamelogs and scheduled matchups collections on one change stream, on a background
+    thread, and publishes which players, games and teams changed to an invalidation bus.
+
+    Changes are batched over batch_seconds, so an upsert of thousands of documents is one invalidation rather
+    than thousands. The stream's resume token is saved to resume_token_path once its changes are published, so
+    a watcher restarted after an error or a redeploy resumes after the last published change instead of
+    missing the changes in between. If the oplog no longer holds the token, the watcher starts over and
+    invalidates everything, since it can't know what it missed.
+
+    Every worker process watches the stream for its own caches, but only the one holding the lock on the
+    token's .lock file saves the token, so that the workers don't overwrite each other's position. The others
+    keep theirs in memory, and take over saving it if that worker stops.
+
+    :param invalidation_bus InvalidationBus: Where the invalidations are published.
+    :param resume_token_path str: The file the resume token is saved to, CHANGE_STREAM_RESUME_TOKEN_PATH or
+        cache/change_stream_resume_token.json by default.
+    :param batch_seconds float: How long changes are batched before being published,
+        CHANGE_STREAM_BATCH_SECONDS or 1 second by default.
+    :param watched_database Database: The database to watch, the player stats database by default.
+    """
+
+    def __init__(
+        self,
+        invalidation_bus: InvalidationBus,
+        resume_token_path: str = None,
+        batch_seconds: float = None,
+        watched_database: Database = None,
+    ):
+        self._invalidation_bus = invalidation_bus
+        self._resume_token_path = Path(
+            resume_token_path or os.getenv("CHANGE_STREAM_RESUME_TOKEN_PATH", DEFAULT_RESUME_TOKEN_PATH)
+        )
+        self._batch_seconds = batch_seconds or float(os.getenv("CHANGE_STREAM_BATCH_SECONDS", "1"))
+        self._database = watched_database
+        self._resume_token: Optional[dict] = None
+        self._saved_at = 0.0
+        self._token_lock_file = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopped.clear()
+            self._resume_token = self._read_resume_token()
+            self._thread = threading.Thread(target=self._run, name="change-stream-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._token_lock_file is not None:
+            self._token_lock_file.close()  # Hands saving the token over to another worker
+            self._token_lock_file = None
+
+    def _run(self) -> None:
+        retry_seconds = 1.0
+        while not self._stopped.is_set():
+            try:
+                self._watch()
+                retry_seconds = 1.0
+            except OperationFailure as e:
+                if e.code not in HISTORY_LOST_CODES or self._resume_token is None:
+                    print(f"Error watching the change streams: {e}")
+                    self._stopped.wait(retry_seconds)
+                    retry_seconds = min(retry_seconds * 2, 60)
+                    continue
+                print(f"The change streams can't resume, invalidating every cache: {e}")
+                self._resume_token = None
+                self._invalidation_bus.publish(_invalidate_everything())
+            except PyMongoError as e:
+                print(f"Error watching the change streams: {e}")
+                self._stopped.wait(retry_seconds)
+                retry_seconds = min(retry_seconds * 2, 60)
+
+    def _watch(self) -> None:
+        """
+        Publishes the changes of the stream until the watcher is stopped or the stream is invalidated.
+        """
+
+        pipeline = [
+            {"$match": {"ns.coll": {"$in": list(WATCHED_COLLECTIONS)}}},
+            {"$project": CHANGE_PROJECTION},
+        ]
+        watched_database = self._database if self._database is not None else database.get_database()
+        with watched_database.watch(
+            pipeline, full_document="updateLookup", resume_after=self._resume_token, max_await_time_ms=500
+        ) as stream:
+            pending: Optional[CacheInvalidation] = None
+            pending_since = 0.0
+            while not self._stopped.is_set():
+                change: Optional[dict] = stream.try_next()
+                if change is not None:
+                    if change["operationType"] == "invalidate":
+                        # The stream ends after an invalidate, i.e. once the database is dropped
+                        self._publish(_invalidate_everything(), None)
+                        return
+                    invalidation = to_cache_invalidation(change)
+                    if pending is None:
+                        pending, pending_since = invalidation, time.monotonic()
+                    else:
+                        pending = pending.merge(invalidation)
+                if pending is not None and (change is None or time.monotonic() - pending_since >= self._batch_seconds):
+                    self._publish(pending, stream.resume_token)
+                    pending = None
+                elif pending is None and stream.resume_token != self._resume_token:
+                    self._resume_token = stream.resume_token
+                    if time.monotonic() - self._saved_at >= IDLE_SAVE_SECONDS:
+                        self._save_resume_token(stream.resume_token)
+
+    def _publish(self, invalidation: CacheInvalidation, resume_token: Optional[dict]) -> None:
+        self._invalidation_bus.publish(invalidation)
+        self._save_resume_token(resume_token)
+
+    def _read_resume_token(self) -> Optional[dict]:
+        try:
+            return orjson.loads(self._resume_token_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    def _save_resume_token(self, resume_token: Optional[dict]) -> None:
+        self._resume_token = resume_token
+        if not self._owns_resume_token():
+            return
+        self._saved_at = time.monotonic()
+        atomic_write_bytes(self._resume_token_path, orjson.dumps(resume_token))
+
+    def _owns_resume_token(self) -> bool:
+        """
+        Takes the lock of the worker saving the resume token unless another worker holds it.
+        """
+
+        if self._token_lock_file is None:
+            self._resume_token_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self._resume_token_path.with_name(f"{self._resume_token_path.name}.lock"), "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return False
+            self._token_lock_file = lock_file
+        return True
+
+
+def _invalidate_everything() -> CacheInvalidation:
+    data = set(WATCHED_COLLECTIONS.values())
+    return CacheInvalidation(changedData=data, wholeData=data)
+
+
+def to_cache_invalidation(change: dict) -> CacheInvalidation:
+    """
+    Gets the players, games and teams a change event is about.
+
+    :param change dict: The change event, projected with CHANGE_PROJECTION.
+    :return: The invalidation of the change.
+    :rtype: CacheInvalidation
+    """
+
+    data = WATCHED_COLLECTIONS[change["ns"]["coll"]]
+    document: Optional[dict] = change.get("fullDocument")
+    if document is None:
+        # A deleted document, or one deleted since it changed, is only known by its _id
+        return CacheInvalidation(changedData={data}, wholeData={data})
+
+    invalidation = CacheInvalidation(changedData={data})
+    if document.get("playerId") is not None:
+        invalidation.playerIds.add(document["playerId"])
+    if document.get("gameId") is not None:
+        invalidation.gameIds.add(document["gameId"])
+    for team_field in ("team", "playerTeam", "opposingTeam", "homeTeam", "awayTeam"):
+        if (document.get(team_field) or {}).get("teamId") is not None:
+            invalidation.teamIds.add(document[team_field]["teamId"])
+    # A gamelog bucket holds a player's games of a season, the changed ones are its updated games.<gameId> fields
+    invalidation.teamIds.update(document.get("teams") or {})
+    for field in (change.get("updateDescription") or {}).get("updatedFields") or {}:
+        if field.startswith("games."):
+            invalidation.gameIds.add(field.split(".")[1])
+    return invalidation
@@ -1,16 +1,51 @@
 import os
+from functools import lru_cache
 from pymongo import MongoClient
+from pymongo.collection import Collection
+from pymongo.database import Database
 from dotenv import load_dotenv
+from src.infra.persistence.mongo_command_listener import MongoCommandTimer
 
 load_dotenv()
 
-client = MongoClient(os.getenv('MONGODB_URL'))
+# Collection names
+GAMELOGS = "gamelogs"
+GAMELOG_BUCKETS = "gamelog_buckets"
+PLAYERS = "players"
+SCHEDULED_MATCHUPS = "scheduled_matchups"
+PROJECTIONS = "projections"
+TEAMS = "teams"
+METADATA = "metadata"
+TEST = "test"
 
-db = client.player_stats_db
 
-gamelogs_collection = db['gamelogs']
-players_collection = db['players']
-scheduled_matchups_collection = db['scheduled_matchups']
-projections_collection = db['projections']
-teams_collection = db['teams']
-test_collection = db['test']
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_client() -> MongoClient:
+    """
+    Gets the process's MongoDB client, creating it on first use rather than at import time.
+
+    :return: The MongoDB client
+    :rtype: MongoClient
+    """
+
+    return MongoClient(os.getenv("MONGODB_URL"), event_listeners=[MongoCommandTimer()])
+
+
+def get_database() -> Database:
+    """
+    Gets the player stats database.
+    """
+
+    return get_client().player_stats_db
+
+
+def get_collection(name: str) -> Collection:
+    """
+    Gets a collection of the player stats database.
+
+    :param name str: The name of the collection, i.e. database.GAMELOGS.
+    :return: The collection
+    :rtype: Collection
+    """
+
+    return get_database()[name]
@@ -0,0 +1,38 @@
+import os
+from src.interfaces.repositories import IGamelogRepository
+
+# The layouts gamelogs can be stored in, selected by the GAMELOG_STORAGE environment variable
+FLAT: str = "flat"  # One document per player game in the gamelogs collection
+BUCKETED: str = "bucketed"  # One document per player season in the gamelog_buckets collection
+GAMELOG_STORAGES: tuple[str, ...] = (FLAT, BUCKETED)
+
+
+def get_gamelog_storage() -> str:
+    """
+    Gets the layout gamelogs are stored in, set by the GAMELOG_STORAGE environment variable and flat by default.
+
+    :return: The layout, FLAT or BUCKETED.
+    :rtype: str
+    :raises ValueError: If GAMELOG_STORAGE is set to an unknown layout.
+    """
+
+    storage = os.getenv("GAMELOG_STORAGE", FLAT).lower()
+    if storage not in GAMELOG_STORAGES:
+        raise ValueError(f"Unknown GAMELOG_STORAGE {storage}, expected one of {list(GAMELOG_STORAGES)}")
+    return storage
+
+
+def create_gamelog_repository(storage: str = None) -> IGamelogRepository:
+    """
+    Creates the gamelog repository of a storage layout.
+
+    :param storage str: The layout, the configured one by default.
+    :return: The gamelog repository
+    :rtype: IGamelogRepository
+    """
+
+    from src.infra.persistence.repositories import GamelogRepository, BucketedGamelogRepository
+
+    if (storage or get_gamelog_storage()) == BUCKETED:
+        return BucketedGamelogRepository()
+    return GamelogRepository()
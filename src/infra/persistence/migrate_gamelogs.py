@@ -0,0 +1,85 @@
+"""
+Copies the gamelogs from one storage layout to the other, i.e. before switching GAMELOG_STORAGE to bucketed.
+
+Usage:
+    python -m src.infra.persistence.migrate_gamelogs --to bucketed
+    python -m src.infra.persistence.migrate_gamelogs --to flat --batch-size 2000
+
+Gamelogs are streamed from the source collection and upserted into the target in batches, so the migration
+can be run again, i.e. after it was interrupted or to catch up on gamelogs written during the switch. The
+source collection is left untouched.
+"""
+
+import argparse
+import sys
+from typing import Iterator
+from src.infra.persistence import database
+from src.infra.persistence.gamelog_storage import FLAT, BUCKETED, GAMELOG_STORAGES, create_gamelog_repository
+from src.domain.entities import GamelogEntity
+from src.app.caching import team_registry
+
+
+def iter_gamelogs(storage: str, batch_size: int = 5000) -> Iterator[list[GamelogEntity]]:
+    """
+    Streams every gamelog stored in a layout.
+
+    :param storage str: The layout to read, FLAT or BUCKETED.
+    :param batch_size int: The number of gamelogs per batch.
+    :return: The gamelogs, in batches.
+    :rtype: Iterator[list[GamelogEntity]]
+    """
+
+    from src.infra.persistence.repositories.bucketed_gamelog_repository import from_bucket
+    from src.infra.persistence.repositories.gamelog_repository import GAMELOG_TEAM_FIELDS
+
+    batch: list[GamelogEntity] = []
+    if storage == BUCKETED:
+        documents = database.get_collection(database.GAMELOG_BUCKETS).find(batch_size=100)
+        gamelogs = (gamelog for bucket in documents for gamelog in from_bucket(bucket))
+    else:
+        documents = database.get_collection(database.GAMELOGS).find(batch_size=batch_size)
+        gamelogs = (GamelogEntity(**team_registry.intern_fields(gamelog, GAMELOG_TEAM_FIELDS)) for gamelog in documents)
+
+    for gamelog in gamelogs:
+        batch.append(gamelog)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def migrate(source: str, target: str, batch_size: int = 5000) -> int:
+    """
+    Upserts every gamelog of the source layout into the target layout.
+
+    :param source str: The layout to copy from.
+    :param target str: The layout to copy to.
+    :param batch_size int: The number of gamelogs upserted at once.
+    :return: The number of gamelogs copied.
+    :rtype: int
+    """
+
+    target_repository = create_gamelog_repository(target)
+    copied = 0
+    for batch in iter_gamelogs(source, batch_size):
+        target_repository.upsert_many(batch)
+        copied += len(batch)
+        print(f"Copied {copied} gamelogs")
+    return copied
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--to", dest="target", choices=GAMELOG_STORAGES, required=True, help="The target layout.")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    source = FLAT if args.target == BUCKETED else BUCKETED
+    copied = migrate(source, args.target, args.batch_size)
+    print(f"Migrated {copied} gamelogs from the {source} to the {args.target} layout")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+from pymongo import monitoring
+from src.app.monitoring import metrics_registry
+
+mongo_command_duration_seconds = metrics_registry.histogram(
+    "mongo_command_duration_seconds",
+    "Duration of MongoDB commands as reported by the driver.",
+    ("command", "collection", "status"),
+)
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """
+    Records the duration of every MongoDB command, i.e. find, aggregate or update, per collection.
+    """
+
+    def __init__(self):
+        self._collections: dict[tuple, str] = {}  # Maps in-flight commands to the collection they target
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = ""
+        self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event, "success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event, "failure")
+
+    def _record(self, event, status: str) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        mongo_command_duration_seconds.observe(
+            event.duration_micros / 1_000_000, event.command_name, collection, status
+        )
@@ -2,4 +2,5 @@ from src.infra.persistence.repositories.player_repository import PlayerRepositor
 from src.infra.persistence.repositories.team_repository import TeamRepository
 from src.infra.persistence.repositories.scheduled_matchup_repository import ScheduledMatchupRepository
 from src.infra.persistence.repositories.gamelog_repository import GamelogRepository
-from src.infra.persistence.repositories.projection_repository import ProjectionRepository
\ No newline at end of file
+from src.infra.persistence.repositories.projection_repository import ProjectionRepository
+from src.infra.persistence.repositories.bucketed_gamelog_repository import BucketedGamelogRepository
@@ -0,0 +1,193 @@
+from datetime import datetime
+from typing import Iterator, Optional
+from pymongo import UpdateOne, ASCENDING
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
+from src.infra.persistence.repositories.gamelog_repository import group_player_games
+from src.interfaces.repositories import IGamelogRepository
+from src.domain.entities import GamelogEntity, TeamEntity
+from src.domain.value_objects import GamelogsBatchQuery
+from src.app.caching import team_registry
+
+# The fields stored once on a bucket rather than on each of its games, whose ids are the keys of the games map
+BUCKET_FIELDS: tuple[str, ...] = ("playerId", "season")
+
+
+class BucketedGamelogRepository(IGamelogRepository):
+    """
+    Repository for gamelogs, stored as one bucket document per player and season instead of one per game.
+
+    A bucket holds the player's games of the season in a games map keyed by game id, where each game refers
+    to its teams by id, and the teams once in a teams map, so the player, season and team details aren't
+    repeated on every game. Buckets also keep the dates of their first and last games, so a date range scan
+    only reads the buckets overlapping the range. Selected with GAMELOG_STORAGE=bucketed, see gamelog_storage.
+    """
+
+    def __init__(self):
+        self._gamelog_buckets_collection = database.get_collection(database.GAMELOG_BUCKETS)
+        self._bulk_writer = BulkWriter()
+        self._indexes_created = False
+
+    def upsert_many(self, gamelogs: list[GamelogEntity]) -> None:
+        """
+        Upsert gamelogs in bulk, with a single update per bucket.
+
+        :param gamelogs list[GamelogEntity]: List of gamelog entities to upsert.
+        """
+
+        buckets: dict[tuple, list[GamelogEntity]] = {}
+        for gamelog in gamelogs:
+            buckets.setdefault((gamelog.playerId, gamelog.season), []).append(gamelog)
+
+        bulk_operations = []
+        for (player_id, season), bucket_gamelogs in buckets.items():
+            games: dict[str, dict] = {gamelog.gameId: to_bucket_game(gamelog) for gamelog in bucket_gamelogs}
+            teams: dict[str, dict] = {
+                team.teamId: dict(team)
+                for gamelog in bucket_gamelogs
+                for team in (gamelog.playerTeam, gamelog.opposingTeam)
+            }
+            dates: list[str] = [game["dateUTC"] for game in games.values()]
+            # Games and teams are keyed by id, so upserting a game again replaces it
+            bulk_operations.append(
+                UpdateOne(
+                    {"playerId": player_id, "season": season},
+                    {
+                        "$set": {
+                            **{f"games.{game_id}": game for game_id, game in games.items()},
+                            **{f"teams.{team_id}": team for team_id, team in teams.items()},
+                        },
+                        "$min": {"firstDateUTC": min(dates)},
+                        "$max": {"lastDateUTC": max(dates)},
+                    },
+                    upsert=True,
+                )
+            )
+
+        if len(bulk_operations) > 0:
+            self._create_indexes()
+            self._bulk_writer.execute(self._gamelog_buckets_collection, bulk_operations)
+
+    def get_all_between_dates(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = 7500
+    ) -> list[GamelogEntity]:
+        """
+        Get gamelogs from the database within a specified date range.
+
+        :param start_date: Start date of the range (inclusive).
+        :param end_date: End date of the range (exclusive).
+        :param limit: The maximum number of most recent gamelogs to return, or None for all of them.
+        :return: A list of gamelogs within the specified date range.
+        """
+
+        formatted_start_date = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        formatted_end_date = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        gamelogs: list[GamelogEntity] = [
+            gamelog
+            for bucket in self._gamelog_buckets_collection.find(
+                {"firstDateUTC": {"$lt": formatted_end_date}, "lastDateUTC": {"$gte": formatted_start_date}}
+            )
+            for gamelog in from_bucket(
+                bucket,
+                lambda game: game["isActive"] and formatted_start_date <= game["dateUTC"] < formatted_end_date,
+            )
+        ]
+        gamelogs.sort(key=lambda gamelog: gamelog.dateUTC, reverse=True)
+        return gamelogs[:limit] if limit is not None else gamelogs
+
+    def get_all(self) -> list[GamelogEntity]:
+        """
+        Get all gamelogs from the database.
+
+        :return list[GamelogEntity]: A list of all gamelogs in the database.
+        """
+
+        return [gamelog for bucket in self._gamelog_buckets_collection.find() for gamelog in from_bucket(bucket)]
+
+    def get_all_by_player_id_and_season(self, player_id: str, season: int) -> list[GamelogEntity]:
+        """
+        Get all gamelogs of a given season from the database that belong to a certain player.
+
+        :param player_id str: The ID of the player for which to retrieve gamelogs.
+        :param season int: The season for which to retrieve gamelogs.
+        :return list[GamelogEntity]: A list of gamelogs that match the criteria.
+        """
+
+        bucket: Optional[dict] = self._gamelog_buckets_collection.find_one({"playerId": player_id, "season": season})
+        if bucket is None:
+            return []
+        gamelogs = from_bucket(bucket, lambda game: game["isRegularSeasonGame"])
+        return sorted(gamelogs, key=lambda gamelog: gamelog.dateUTC, reverse=True)
+
+    def get_batch(self, gamelogs_query: GamelogsBatchQuery) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Get the regular season gamelogs of several players with a single query on their buckets, grouped by
+        player.
+
+        :param gamelogs_query GamelogsBatchQuery: The players, season, number of games and fields to get.
+        :return: The id and games, most recent first, of every player with games, in player id order.
+        :rtype: Iterator[tuple[str, list[dict]]]
+        """
+
+        buckets = self._gamelog_buckets_collection.find(
+            {"playerId": {"$in": gamelogs_query.playerIds}, "season": gamelogs_query.season}
+        ).sort("playerId", ASCENDING)
+        gamelogs = (
+            dict(gamelog)
+            for bucket in buckets
+            for gamelog in sorted(
+                from_bucket(bucket, lambda game: game["isRegularSeasonGame"]),
+                key=lambda gamelog: gamelog.dateUTC,
+                reverse=True,
+            )
+        )
+        return group_player_games(gamelogs, gamelogs_query)
+
+    def _create_indexes(self) -> None:
+        """
+        Creates the indexes backing upserts by player season and date range scans.
+        """
+
+        if self._indexes_created:
+            return
+        self._gamelog_buckets_collection.create_index([("playerId", ASCENDING), ("season", ASCENDING)], unique=True)
+        self._gamelog_buckets_collection.create_index([("lastDateUTC", ASCENDING), ("firstDateUTC", ASCENDING)])
+        self._indexes_created = True
+
+
+def to_bucket_game(gamelog: GamelogEntity) -> dict:
+    """
+    Converts a gamelog to a game of its bucket, which refers to its teams by id.
+    """
+
+    game = dict(gamelog)
+    for field in BUCKET_FIELDS + ("gameId",):
+        game.pop(field)
+    game["playerTeamId"] = game.pop("playerTeam")["teamId"]
+    game["opposingTeamId"] = game.pop("opposingTeam")["teamId"]
+    return game
+
+
+def from_bucket(bucket: dict, game_filter=None) -> list[GamelogEntity]:
+    """
+    Converts the games of a bucket back to gamelogs.
+
+    :param bucket dict: The bucket document.
+    :param game_filter Callable: Only the games it returns True for are converted, all of them by default.
+    :return: The bucket's gamelogs.
+    :rtype: list[GamelogEntity]
+    """
+
+    teams: dict[str, TeamEntity] = {team_id: team_registry.intern(team) for team_id, team in bucket["teams"].items()}
+    return [
+        GamelogEntity(
+            **{field: value for field, value in game.items() if field not in ("playerTeamId", "opposingTeamId")},
+            gameId=game_id,
+            playerId=bucket["playerId"],
+            season=bucket["season"],
+            playerTeam=teams[game["playerTeamId"]],
+            opposingTeam=teams[game["opposingTeamId"]],
+        )
+        for game_id, game in bucket["games"].items()
+        if game_filter is None or game_filter(game)
+    ]
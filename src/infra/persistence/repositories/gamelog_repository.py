@@ -1,8 +1,18 @@
 from datetime import datetime
-from pymongo import UpdateOne
-from src.infra.persistence.database import gamelogs_collection
+from itertools import groupby, islice
+from typing import Iterable, Iterator, Optional
+from pymongo import UpdateOne, ASCENDING, DESCENDING
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
 from src.interfaces.repositories import IGamelogRepository
 from src.domain.entities import GamelogEntity
+from src.domain.value_objects import GamelogsBatchQuery
+from src.app.caching import team_registry
+
+# The fields of a gamelog holding teams, which are interned when gamelogs are read
+GAMELOG_TEAM_FIELDS: tuple[str, ...] = ("playerTeam", "opposingTeam")
+# The fields identifying each game of a batch, returned whichever fields are selected
+BATCH_KEY_FIELDS: tuple[str, ...] = ("gameId", "dateUTC")
 
 
 class GamelogRepository(IGamelogRepository):
@@ -11,7 +21,9 @@ class GamelogRepository(IGamelogRepository):
     """
 
     def __init__(self):
-        self._gamelogs_collection = gamelogs_collection
+        self._gamelogs_collection = database.get_collection(database.GAMELOGS)
+        self._bulk_writer = BulkWriter()
+        self._indexes_created = False
 
     def upsert_many(self, gamelogs: list[GamelogEntity]) -> None:
         """
@@ -26,36 +38,37 @@ class GamelogRepository(IGamelogRepository):
                     {"playerId": gamelog.playerId, "gameId": gamelog.gameId}, {"$set": dict(gamelog)}, upsert=True
                 )
             )
-        self._gamelogs_collection.bulk_write(bulk_operations)
+        self._bulk_writer.execute(self._gamelogs_collection, bulk_operations)
 
-    def get_all_between_dates(self, start_date: datetime, end_date: datetime) -> list[GamelogEntity]:
+    def get_all_between_dates(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = 7500
+    ) -> list[GamelogEntity]:
         """
         Get gamelogs from the database within a specified date range.
 
         :param start_date: Start date of the range (inclusive).
         :param end_date: End date of the range (exclusive).
+        :param limit: The maximum number of most recent gamelogs to return, or None for all of them.
         :return: A list of gamelogs within the specified date range.
         """
 
-        gamelogs: list[dict] = list(
-            self._gamelogs_collection.aggregate(
-                [
-                    {
-                        "$match": {
-                            "dateUTC": {
-                                "$gte": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                                "$lt": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                            },
-                            "isActive": True,
-                        }
+        pipeline: list[dict] = [
+            {
+                "$match": {
+                    "dateUTC": {
+                        "$gte": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "$lt": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
                     },
-                    {"$sort": {"dateUTC": -1}},
-                    {"$limit": 7500}
-                ]
-            )
-        )
+                    "isActive": True,
+                }
+            },
+            {"$sort": {"dateUTC": -1}},
+        ]
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        gamelogs: list[dict] = list(self._gamelogs_collection.aggregate(pipeline))
 
-        return [GamelogEntity(**gamelog) for gamelog in gamelogs]
+        return [GamelogEntity(**team_registry.intern_fields(gamelog, GAMELOG_TEAM_FIELDS)) for gamelog in gamelogs]
 
     def get_all(self) -> list[GamelogEntity]:
         """
@@ -64,7 +77,10 @@ class GamelogRepository(IGamelogRepository):
         :return list[GamelogEntity]: A list of all gamelogs in the database.
         """
 
-        return [GamelogEntity(**gamelog) for gamelog in self._gamelogs_collection.find()]
+        return [
+            GamelogEntity(**team_registry.intern_fields(gamelog, GAMELOG_TEAM_FIELDS))
+            for gamelog in self._gamelogs_collection.find()
+        ]
 
     def get_all_by_player_id_and_season(self, player_id: str, season: int) -> list[GamelogEntity]:
         """
@@ -75,9 +91,71 @@ class GamelogRepository(IGamelogRepository):
         :return list[GamelogEntity]: A list of gamelogs that match the criteria.
         """
 
+        self._create_indexes()
         return [
-            GamelogEntity(**gamelog)
+            GamelogEntity(**team_registry.intern_fields(gamelog, GAMELOG_TEAM_FIELDS))
             for gamelog in self._gamelogs_collection.find(
                 {"playerId": player_id, "season": season, "isRegularSeasonGame": True}
             ).sort("dateUTC", -1)
         ]
+
+    def get_batch(self, gamelogs_query: GamelogsBatchQuery) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Get the regular season gamelogs of several players with a single query, grouped by player.
+
+        The gamelogs are read in player and date order off the (playerId, season, dateUTC) index and grouped as
+        they stream from the cursor, so only one player's games are held at a time.
+
+        :param gamelogs_query GamelogsBatchQuery: The players, season, number of games and fields to get.
+        :return: The id and games, most recent first, of every player with games, in player id order.
+        :rtype: Iterator[tuple[str, list[dict]]]
+        """
+
+        self._create_indexes()
+        projection: dict = {"_id": 0}
+        if gamelogs_query.fields is not None:
+            projection.update({field: 1 for field in ("playerId",) + BATCH_KEY_FIELDS + tuple(gamelogs_query.fields)})
+        cursor = self._gamelogs_collection.find(
+            {
+                "playerId": {"$in": gamelogs_query.playerIds},
+                "season": gamelogs_query.season,
+                "isRegularSeasonGame": True,
+            },
+            projection,
+        ).sort([("playerId", ASCENDING), ("dateUTC", DESCENDING)])
+        return group_player_games(cursor, gamelogs_query)
+
+    def _create_indexes(self) -> None:
+        """
+        Creates the index backing the reads of players' season gamelogs.
+        """
+
+        if self._indexes_created:
+            return
+        self._gamelogs_collection.create_index(
+            [("playerId", ASCENDING), ("season", ASCENDING), ("dateUTC", DESCENDING)]
+        )
+        self._indexes_created = True
+
+
+def group_player_games(
+    gamelogs: Iterable[dict], gamelogs_query: GamelogsBatchQuery
+) -> Iterator[tuple[str, list[dict]]]:
+    """
+    Groups gamelogs sorted by player, most recent first, into each player's last games and selected fields.
+
+    :param gamelogs Iterable[dict]: The gamelogs, sorted by player and then by date, descending.
+    :param gamelogs_query GamelogsBatchQuery: The number of games and the fields to keep.
+    :return: The id and games of every player.
+    :rtype: Iterator[tuple[str, list[dict]]]
+    """
+
+    fields: Optional[list[str]] = None
+    if gamelogs_query.fields is not None:
+        fields = list(dict.fromkeys(BATCH_KEY_FIELDS + tuple(gamelogs_query.fields)))
+    for player_id, player_gamelogs in groupby(gamelogs, key=lambda gamelog: gamelog["playerId"]):
+        yield player_id, [
+            gamelog if fields is None else {field: gamelog[field] for field in fields if field in gamelog}
+            for gamelog in islice(player_gamelogs, gamelogs_query.lastN)
+        ]
+
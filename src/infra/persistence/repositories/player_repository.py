@@ -1,9 +1,30 @@
+import uuid
 from datetime import datetime
-from src.domain.value_objects import PlayerSeasonTotals
-from src.infra.persistence.database import players_collection, gamelogs_collection
+from src.domain.value_objects import PlayerSeasonTotals, PlayerQuery, PlayerWeeklyProjectionTotals
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
+from src.infra.persistence.gamelog_storage import get_gamelog_storage, BUCKETED
 from src.domain.entities import PlayerEntity, ProjectionEntity
+from src.app.caching import team_registry
 from src.interfaces.repositories import IPlayerRepository
-from pymongo import UpdateOne
+from pymongo import UpdateOne, ASCENDING, DESCENDING
+
+WEEKLY_PROJECTIONS_PREFIX: str = "weeklyProjections."  # Sorts on a stat summed over the current week's games
+UNAVAILABLE_INJURY_STATUSES: list[str] = ["Out", "OUT", "IR", "Sus"]
+PROJECTIONS_VERSION_ID: str = "currentWeekProjections"  # The metadata document versioning the players' projections
+WEEKLY_PROJECTION_STATS: tuple[str, ...] = (
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "threesMade",
+    "points",
+    "steals",
+    "blocks",
+    "assists",
+    "rebounds",
+    "turnovers",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+)
 
 
 class PlayerRepository(IPlayerRepository):
@@ -12,7 +33,12 @@ class PlayerRepository(IPlayerRepository):
     """
 
     def __init__(self) -> None:
-        self._players_collection = players_collection
+        self._players_collection = database.get_collection(database.PLAYERS)
+        self._gamelogs_collection = database.get_collection(database.GAMELOGS)
+        self._gamelog_buckets_collection = database.get_collection(database.GAMELOG_BUCKETS)
+        self._metadata_collection = database.get_collection(database.METADATA)
+        self._bulk_writer = BulkWriter()
+        self._indexes_created = False
 
     def get_all(self) -> list[PlayerEntity]:
         """
@@ -23,11 +49,74 @@ class PlayerRepository(IPlayerRepository):
         """
 
         return [
-            PlayerEntity(**player)
+            _to_player(player)
             for player in self._players_collection.find({"seasonProjections.pointsLeagueRanking": {"$ne": None}})
             .sort("seasonProjections.pointsLeagueRanking", 1)
         ]
 
+    def query(self, player_query: PlayerQuery) -> list[PlayerEntity]:
+        """
+        Get the NBA players matching the filters of a query, sorted and limited on the database.
+
+        Players without a value for the sorted field, i.e. without season projections, are left out.
+
+        :param player_query PlayerQuery: The filters, sort and limit of the query.
+        :return: The matching players, in order.
+        :rtype: list[PlayerEntity]
+        """
+
+        if not self._indexes_created:
+            self._create_indexes()
+            self._indexes_created = True
+
+        conditions: list[dict] = []
+        if player_query.positions:
+            conditions.append({"fantasyPositions": {"$in": player_query.positions}})
+        if player_query.teams:
+            conditions.append(
+                {
+                    "$or": [
+                        {"team.teamId": {"$in": player_query.teams}},
+                        {"team.abbreviation": {"$in": [team.upper() for team in player_query.teams]}},
+                    ]
+                }
+            )
+        if player_query.injuryStatuses:
+            injury_statuses = [status for status in player_query.injuryStatuses if status.lower() != "healthy"]
+            injury_conditions: list[dict] = [{"injuryStatus": {"$in": injury_statuses}}]
+            if len(injury_statuses) < len(player_query.injuryStatuses):
+                injury_conditions.append({"injuryStatus": None})
+            conditions.append({"$or": injury_conditions})
+        if player_query.isAvailable is True:
+            conditions.append({"team": {"$ne": None}, "injuryStatus": {"$nin": UNAVAILABLE_INJURY_STATUSES}})
+        elif player_query.isAvailable is False:
+            conditions.append({"$or": [{"team": None}, {"injuryStatus": {"$in": UNAVAILABLE_INJURY_STATUSES}}]})
+
+        sort_direction = DESCENDING if player_query.descending else ASCENDING
+        if player_query.sortBy.startswith(WEEKLY_PROJECTIONS_PREFIX):
+            # The week's projections are an array of games, so they are summed before sorting
+            stat = player_query.sortBy[len(WEEKLY_PROJECTIONS_PREFIX) :]
+            pipeline: list[dict] = [
+                {"$match": {"$and": conditions} if conditions else {}},
+                {"$addFields": {"_sortKey": {"$sum": f"$currentWeekProjections.{stat}"}}},
+                {"$sort": {"_sortKey": sort_direction, "playerId": ASCENDING}},
+                {"$skip": player_query.offset},
+            ]
+            if player_query.limit is not None:
+                pipeline.append({"$limit": player_query.limit})
+            pipeline.append({"$project": {"_sortKey": 0}})
+            return [_to_player(player) for player in self._players_collection.aggregate(pipeline)]
+
+        conditions.append({player_query.sortBy: {"$ne": None}})
+        cursor = (
+            self._players_collection.find({"$and": conditions})
+            .sort([(player_query.sortBy, sort_direction), ("playerId", ASCENDING)])
+            .skip(player_query.offset)
+        )
+        if player_query.limit is not None:
+            cursor = cursor.limit(player_query.limit)
+        return [_to_player(player) for player in cursor]
+
     def upsert_many_projections(self, projections: list[ProjectionEntity]) -> None:
         """
         Upsert the projections for multiple players in bulk.
@@ -78,8 +167,74 @@ class PlayerRepository(IPlayerRepository):
                 )
             )
 
-        # Execute bulk write operations
-        self._players_collection.bulk_write(bulk_operations)
+        # The updates of a player append to their projections in order, so they're written ordered
+        self._bulk_writer.execute(self._players_collection, bulk_operations, ordered=True)
+        self._bump_projections_version()
+
+    def update_live_projections(self, projections: list[ProjectionEntity]) -> None:
+        """
+        Replaces the projections of games already in the players' current week projections.
+
+        Each projection is written in place with a positional update, so only the changed game is sent
+        and rewritten instead of the player's whole projections array.
+
+        :param projections: A list of projection entities to write.
+        """
+
+        if not projections:
+            return
+
+        bulk_operations = [
+            UpdateOne(
+                {"playerId": projection.playerId, "currentWeekProjections.gameId": projection.gameId},
+                {"$set": {"currentWeekProjections.$": dict(projection)}},
+            )
+            for projection in projections
+        ]
+        self._bulk_writer.execute(self._players_collection, bulk_operations)
+        self._bump_projections_version()
+
+    def get_current_week_projection_totals(self) -> list[PlayerWeeklyProjectionTotals]:
+        """
+        Get every player's projected stats summed over their games of the current week.
+
+        The sums are computed on the database, so only one small document per player is transferred.
+
+        :return: The weekly totals of the players with at least one projected game.
+        :rtype: list[PlayerWeeklyProjectionTotals]
+        """
+
+        players_totals = self._players_collection.aggregate(
+            [
+                {"$match": {"currentWeekProjections.0": {"$exists": True}}},
+                {
+                    "$project": {
+                        "_id": 0,
+                        "playerId": 1,
+                        "firstName": 1,
+                        "lastName": 1,
+                        "teamAbbreviation": "$team.abbreviation",
+                        "fantasyPositions": 1,
+                        "games": {"$size": "$currentWeekProjections"},
+                        **{stat: {"$sum": f"$currentWeekProjections.{stat}"} for stat in WEEKLY_PROJECTION_STATS},
+                    }
+                },
+                {"$sort": {"playerId": ASCENDING}},
+            ]
+        )
+        return [PlayerWeeklyProjectionTotals(**player_totals) for player_totals in players_totals]
+
+    def get_projections_version(self) -> str:
+        """
+        Get the version of the players' current week projections, which changes whenever the players or their
+        projections are written.
+
+        :return: The version, or "initial" if the projections were never written.
+        :rtype: str
+        """
+
+        metadata = self._metadata_collection.find_one({"_id": PROJECTIONS_VERSION_ID})
+        return metadata["version"] if metadata else "initial"
 
     def upsert_many(self, players: list[PlayerEntity]) -> None:
         """
@@ -110,7 +265,8 @@ class PlayerRepository(IPlayerRepository):
             bulk_operations.append(UpdateOne({"playerId": player.playerId}, {"$set": player_document}, upsert=True))
 
         # Execute bulk write operations
-        self._players_collection.bulk_write(bulk_operations)
+        self._bulk_writer.execute(self._players_collection, bulk_operations)
+        self._bump_projections_version()
 
     def get_season_totals(self, season: int) -> dict[str, dict]:
         """
@@ -121,26 +277,40 @@ class PlayerRepository(IPlayerRepository):
         :rtype: dict[str, PlayerSeasonTotals]
         """
 
+        gamelogs_collection = self._gamelogs_collection
+        bucket_stages: list[dict] = []
+        game = ""  # The path of a game's fields in the documents being grouped
+        if get_gamelog_storage() == BUCKETED:
+            # The games of the season's buckets are unwound into one document per game
+            gamelogs_collection = self._gamelog_buckets_collection
+            bucket_stages = [
+                {"$match": {"season": season}},
+                {"$project": {"playerId": 1, "season": 1, "games": {"$objectToArray": "$games"}}},
+                {"$unwind": "$games"},
+            ]
+            game = "games.v."
+
         players_totals: list[dict] = gamelogs_collection.aggregate(
-            [
+            bucket_stages
+            + [
                 {"$match": {"season": season}},
-                {"$match": {"isActive": True}},
-                {"$match": {"isRegularSeasonGame": True}},
+                {"$match": {f"{game}isActive": True}},
+                {"$match": {f"{game}isRegularSeasonGame": True}},
                 {
                     "$group": {
                         "_id": "$playerId",
-                        "points": {"$sum": "$points"},
-                        "rebounds": {"$sum": "$reboundsTotal"},
-                        "assists": {"$sum": "$assists"},
-                        "steals": {"$sum": "$steals"},
-                        "blocks": {"$sum": "$blocks"},
-                        "turnovers": {"$sum": "$turnovers"},
-                        "fieldGoalsAttempted": {"$sum": "$fieldGoalsAttempted"},
-                        "fieldGoalsMade": {"$sum": "$fieldGoalsMade"},
-                        "threesMade": {"$sum": "$threesMade"},
-                        "freeThrowsAttempted": {"$sum": "$freeThrowsAttempted"},
-                        "freeThrowsMade": {"$sum": "$freeThrowsMade"},
-                        "minutes": {"$sum": "$minutes"},
+                        "points": {"$sum": f"${game}points"},
+                        "rebounds": {"$sum": f"${game}reboundsTotal"},
+                        "assists": {"$sum": f"${game}assists"},
+                        "steals": {"$sum": f"${game}steals"},
+                        "blocks": {"$sum": f"${game}blocks"},
+                        "turnovers": {"$sum": f"${game}turnovers"},
+                        "fieldGoalsAttempted": {"$sum": f"${game}fieldGoalsAttempted"},
+                        "fieldGoalsMade": {"$sum": f"${game}fieldGoalsMade"},
+                        "threesMade": {"$sum": f"${game}threesMade"},
+                        "freeThrowsAttempted": {"$sum": f"${game}freeThrowsAttempted"},
+                        "freeThrowsMade": {"$sum": f"${game}freeThrowsMade"},
+                        "minutes": {"$sum": f"${game}minutes"},
                         "gamesPlayed": {"$sum": 1},
                     }
                 },
@@ -154,3 +324,34 @@ class PlayerRepository(IPlayerRepository):
             player_season_totals_dict[player_id] = totals
 
         return player_season_totals_dict
+
+    def _bump_projections_version(self) -> None:
+        self._metadata_collection.update_one(
+            {"_id": PROJECTIONS_VERSION_ID},
+            {"$set": {"version": uuid.uuid4().hex, "updatedAt": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")}},
+            upsert=True,
+        )
+
+    def _create_indexes(self) -> None:
+        """
+        Creates the indexes backing player queries, i.e. the draft board and waiver views. Creating an existing
+        index is a no-op.
+        """
+
+        self._players_collection.create_index([("playerId", ASCENDING)])
+        self._players_collection.create_index([("seasonProjections.pointsLeagueRanking", ASCENDING)])
+        self._players_collection.create_index([("seasonProjections.categoryLeagueRanking", ASCENDING)])
+        self._players_collection.create_index([("fantasyPositions", ASCENDING)])
+        self._players_collection.create_index([("team.abbreviation", ASCENDING)])
+        self._players_collection.create_index([("injuryStatus", ASCENDING)])
+
+
+def _to_player(player: dict) -> PlayerEntity:
+    """
+    Builds a player entity from its document, with the shared instances of its and its projections' teams.
+    """
+
+    team_registry.intern_fields(player, ("team",))
+    for projection in player.get("currentWeekProjections") or []:
+        team_registry.intern_fields(projection, ("playerTeam", "opposingTeam"))
+    return PlayerEntity(**player)
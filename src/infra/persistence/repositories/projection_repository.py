@@ -1,8 +1,10 @@
 from datetime import datetime
-from pymongo import UpdateOne
+from pymongo import UpdateOne, ASCENDING
 from src.interfaces.repositories import IProjectionRepository
-from src.infra.persistence.database import projections_collection
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
 from src.domain.entities import ProjectionEntity
+from src.app.caching import team_registry
 
 
 class ProjectionRepository(IProjectionRepository):
@@ -11,8 +13,8 @@ class ProjectionRepository(IProjectionRepository):
     """
 
     def __init__(self):
-        self._projections_collection = projections_collection
-
+        self._projections_collection = database.get_collection(database.PROJECTIONS)
+        self._bulk_writer = BulkWriter()
 
     def upsert_many(self, projections: list[ProjectionEntity]) -> None:
         """
@@ -20,12 +22,58 @@ class ProjectionRepository(IProjectionRepository):
 
         :param teams: A list of player game projections to upsert.
         """
-        current_date_utc = datetime.utcnow()  # Get the current date in UTC
+        current_date_utc = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")  # Get the current date in UTC
 
         bulk_operations = []
         for projection in projections:
             # Check if projection's dateUTC is beyond the current date
             if projection.dateUTC > current_date_utc:
-                bulk_operations.append(UpdateOne({"gameId": projection.gameId}, {"$set": dict(projection)}, upsert=True))
+                bulk_operations.append(
+                    UpdateOne(
+                        {"playerId": projection.playerId, "gameId": projection.gameId},
+                        {"$set": dict(projection)},
+                        upsert=True,
+                    )
+                )
+
+        if len(bulk_operations) > 0:
+            self._create_indexes()
+            self._bulk_writer.execute(self._projections_collection, bulk_operations)
+
+    def get_between_dates(
+        self, start_date: datetime, end_date: datetime, player_id: str = None
+    ) -> list[ProjectionEntity]:
+        """
+        Gets the projections of the games within a date range.
+
+        :param start_date datetime: The start of the range (inclusive).
+        :param end_date datetime: The end of the range (exclusive).
+        :param player_id str: Only return the projections of this player.
+        :return: A list of projections sorted by player and date.
+        :rtype: list[ProjectionEntity]
+        """
+
+        query: dict = {
+            "dateUTC": {
+                "$gte": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "$lt": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+        }
+        if player_id is not None:
+            query["playerId"] = player_id
+
+        return [
+            ProjectionEntity(**team_registry.intern_fields(projection, ("playerTeam", "opposingTeam")))
+            for projection in self._projections_collection.find(query, {"_id": 0}).sort(
+                [("playerId", ASCENDING), ("dateUTC", ASCENDING)]
+            )
+        ]
+
+    def _create_indexes(self) -> None:
+        """
+        Creates the indexes backing upserts by player game and date range reads. Creating an existing index is a no-op.
+        """
 
-        self._projections_collection.bulk_write(bulk_operations)
+        self._projections_collection.create_index([("playerId", ASCENDING), ("gameId", ASCENDING)], unique=True)
+        self._projections_collection.create_index([("playerId", ASCENDING), ("dateUTC", ASCENDING)])
+        self._projections_collection.create_index([("dateUTC", ASCENDING), ("playerId", ASCENDING)])
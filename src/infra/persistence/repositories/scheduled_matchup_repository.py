@@ -1,8 +1,13 @@
+import hashlib
+import json
 from datetime import datetime, timezone
-from pymongo import UpdateOne
+from pymongo import UpdateOne, DeleteOne
 from src.interfaces.repositories import IScheduledMatchupRepository
-from src.infra.persistence.database import scheduled_matchups_collection
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
 from src.domain.entities import ScheduledMatchupEntity
+from src.domain.value_objects import ScheduleDiff
+from src.app.caching import team_registry
 
 
 class ScheduledMatchupRepository(IScheduledMatchupRepository):
@@ -11,7 +16,8 @@ class ScheduledMatchupRepository(IScheduledMatchupRepository):
     """
 
     def __init__(self):
-        self._scheduled_matchups_collection = scheduled_matchups_collection
+        self._scheduled_matchups_collection = database.get_collection(database.SCHEDULED_MATCHUPS)
+        self._bulk_writer = BulkWriter()
 
     def upsert_many(self, scheduled_matchups: list[ScheduledMatchupEntity]) -> None:
         """
@@ -29,7 +35,71 @@ class ScheduledMatchupRepository(IScheduledMatchupRepository):
                 )
             )
 
-        self._scheduled_matchups_collection.bulk_write(bulk_operations)
+        self._bulk_writer.execute(self._scheduled_matchups_collection, bulk_operations)
+
+    def sync_many(self, scheduled_matchups: list[ScheduledMatchupEntity]) -> ScheduleDiff:
+        """
+        Makes the stored schedule match the given one, writing only the games that were added, changed or removed.
+
+        Every game is stored with a hash of its fields, so a game is compared to its stored version by reading
+        only the hashes back. A game missing from the given schedule was removed from the league's, i.e. a
+        postponed game awaiting a new date. Only the stored games between the first and last games of the given
+        schedule can be removed, so that the games of past seasons, which the fetch doesn't cover, are kept. An
+        empty schedule is taken as a failed fetch and removes nothing.
+
+        :param scheduled_matchups list[ScheduledMatchupEntity]: Every scheduled matchup of the season.
+        :return: The games that were inserted, updated and removed, and the teams they involve.
+        :rtype: ScheduleDiff
+        """
+
+        stored_games: dict[str, dict] = {
+            stored_game["gameId"]: stored_game
+            for stored_game in self._scheduled_matchups_collection.find(
+                {},
+                {"_id": 0, "gameId": 1, "dateTimeUTC": 1, "contentHash": 1, "homeTeam.teamId": 1, "awayTeam.teamId": 1},
+            )
+        }
+
+        diff = ScheduleDiff()
+        affected_team_ids: set[str] = set()
+        bulk_operations = []
+        given_game_ids: set[str] = set()
+        for matchup in scheduled_matchups:
+            given_game_ids.add(matchup.gameId)
+            content_hash = _hash_matchup(matchup)
+            stored_game = stored_games.get(matchup.gameId)
+            if stored_game is not None and stored_game.get("contentHash") == content_hash:
+                diff.unchangedGames += 1
+                continue
+
+            if stored_game is None:
+                diff.insertedGameIds.append(matchup.gameId)
+            else:
+                diff.updatedGameIds.append(matchup.gameId)
+                affected_team_ids.update(_team_ids(stored_game))  # A team moved out of the game is affected too
+            affected_team_ids.update((matchup.homeTeam.teamId, matchup.awayTeam.teamId))
+            bulk_operations.append(
+                UpdateOne(
+                    {"gameId": matchup.gameId},
+                    {"$set": {**dict(matchup), "contentHash": content_hash}},
+                    upsert=True,
+                )
+            )
+
+        if scheduled_matchups:
+            season_start = min(matchup.dateTimeUTC for matchup in scheduled_matchups)
+            season_end = max(matchup.dateTimeUTC for matchup in scheduled_matchups)
+            for game_id in stored_games.keys() - given_game_ids:
+                if not season_start <= stored_games[game_id].get("dateTimeUTC", "") <= season_end:
+                    continue
+                diff.removedGameIds.append(game_id)
+                affected_team_ids.update(_team_ids(stored_games[game_id]))
+                bulk_operations.append(DeleteOne({"gameId": game_id}))
+
+        self._bulk_writer.execute(self._scheduled_matchups_collection, bulk_operations)
+        diff.removedGameIds.sort()
+        diff.affectedTeamIds = sorted(affected_team_ids)
+        return diff
 
     def get_scheduled_matchups(self) -> list[ScheduledMatchupEntity]:
         """
@@ -43,7 +113,9 @@ class ScheduledMatchupRepository(IScheduledMatchupRepository):
         scheduled_matchups = []
         for scheduled_matchup in self._scheduled_matchups_collection.find():
             # ** is used to unpack the dictionary into keyword arguments to create the entity.
-            scheduled_matchups.append(ScheduledMatchupEntity(**scheduled_matchup))
+            scheduled_matchups.append(
+                ScheduledMatchupEntity(**team_registry.intern_fields(scheduled_matchup, ("homeTeam", "awayTeam")))
+            )
         return scheduled_matchups
 
     def get_matchups_between_dates(self, start_date: datetime, end_date: datetime) -> list[ScheduledMatchupEntity]:
@@ -73,5 +145,19 @@ class ScheduledMatchupRepository(IScheduledMatchupRepository):
         ):
 
             # ** is used to unpack the dictionary into keyword arguments to create the entity.
-            scheduled_matchups.append(ScheduledMatchupEntity(**scheduled_matchup))
+            scheduled_matchups.append(
+                ScheduledMatchupEntity(**team_registry.intern_fields(scheduled_matchup, ("homeTeam", "awayTeam")))
+            )
         return scheduled_matchups
+
+
+def _hash_matchup(matchup: ScheduledMatchupEntity) -> str:
+    """
+    Hashes the fields of a scheduled matchup, so that two versions of a game hash the same only if they are equal.
+    """
+
+    return hashlib.sha1(json.dumps(dict(matchup), sort_keys=True).encode()).hexdigest()
+
+
+def _team_ids(stored_game: dict) -> list[str]:
+    return [stored_game[side]["teamId"] for side in ("homeTeam", "awayTeam") if side in stored_game]
@@ -1,7 +1,9 @@
 from pymongo import UpdateOne
 from src.interfaces.repositories import ITeamRepository
-from src.infra.persistence.database import teams_collection
+from src.infra.persistence import database
+from src.infra.persistence.bulk_writer import BulkWriter
 from src.domain.entities import TeamEntity
+from src.app.caching import team_registry
 
 class TeamRepository(ITeamRepository):
     """ 
@@ -9,7 +11,8 @@ class TeamRepository(ITeamRepository):
     """
 
     def __init__(self):
-        self._teams_collection = teams_collection
+        self._teams_collection = database.get_collection(database.TEAMS)
+        self._bulk_writer = BulkWriter()
 
     def upsert_many(self, teams: list[TeamEntity]) -> None:
         """
@@ -22,7 +25,7 @@ class TeamRepository(ITeamRepository):
         for team in teams:
             bulk_operations.append(UpdateOne({"teamId": team.teamId}, {"$set": dict(team)}, upsert=True))
 
-        self._teams_collection.bulk_write(bulk_operations)
+        self._bulk_writer.execute(self._teams_collection, bulk_operations)
 
     def get_team(self, team_id: int) -> TeamEntity:
         """ Get an NBA team
@@ -30,4 +33,4 @@ class TeamRepository(ITeamRepository):
         :param team_id: int
         """
 
-        return TeamEntity(**self._teams_collection.find_one({"teamId": team_id}))
+        return team_registry.intern(self._teams_collection.find_one({"teamId": team_id}))
@@ -0,0 +1,2 @@
+from src.infra.profiling.sampling_profiler import SamplingProfiler
+from src.infra.profiling.profile_store import ProfileStore
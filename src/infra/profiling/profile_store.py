@@ -0,0 +1,57 @@
+import os
+import re
+import orjson
+from pathlib import Path
+
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ProfileStore:
+    """
+    Stores captured job profiles on disk so that they can be retrieved by job id.
+
+    :param directory str: The directory the profiles are written to, PROFILES_DIRECTORY or ./profiles by default.
+    """
+
+    def __init__(self, directory: str = None):
+        self._directory = Path(directory or os.getenv("PROFILES_DIRECTORY", "profiles"))
+
+    def save(self, job_id: str, summary: dict, speedscope_profile: dict) -> None:
+        """
+        Saves a job's profile summary and its speedscope flamegraph.
+
+        :param job_id str: The id of the profiled job.
+        :param summary dict: The summary of the profile, i.e. duration and top functions.
+        :param speedscope_profile dict: The profile in speedscope's file format.
+        """
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self.speedscope_path(job_id).write_bytes(orjson.dumps(speedscope_profile))
+        self._summary_path(job_id).write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+
+    def get_summary(self, job_id: str) -> dict:
+        """
+        Gets a job's profile summary.
+
+        :param job_id str: The id of the profiled job.
+        :return: The summary, or None if there is no profile for the job.
+        :rtype: dict
+        """
+
+        if not JOB_ID_PATTERN.match(job_id) or not self._summary_path(job_id).exists():
+            return None
+        return orjson.loads(self._summary_path(job_id).read_bytes())
+
+    def speedscope_path(self, job_id: str) -> Path:
+        """
+        Gets the path of a job's speedscope profile.
+
+        :raises ValueError: If the job id is malformed.
+        """
+
+        if not JOB_ID_PATTERN.match(job_id):
+            raise ValueError(f"Invalid job id: {job_id}")
+        return self._directory / f"{job_id}.speedscope.json"
+
+    def _summary_path(self, job_id: str) -> Path:
+        return self._directory / f"{job_id}.summary.json"
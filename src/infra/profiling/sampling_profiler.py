@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    A low-overhead statistical profiler that periodically samples the call stack of one thread.
+
+    Instead of tracing every function call, a background thread wakes up every interval and records the
+    target thread's current stack, so the cost is bounded by the sampling rate rather than the job's workload.
+
+    :param interval float: The number of seconds between samples.
+    :param max_depth int: The maximum number of frames recorded per sample.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self._stacks: Counter = Counter()  # Maps stacks, root frame first, to the seconds they were sampled for
+        self.sample_count: int = 0
+        self._stop_event = threading.Event()
+        self._sampler_thread: threading.Thread = None
+        self._start_time: float = 0
+        self.duration: float = 0
+
+    def start(self, thread_id: int = None) -> None:
+        """
+        Starts sampling a thread.
+
+        :param thread_id int: The identifier of the thread to sample, the calling thread by default.
+        """
+
+        target_thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stop_event.clear()
+        self._start_time = time.perf_counter()
+        self._sampler_thread = threading.Thread(
+            target=self._sample, args=(target_thread_id,), name="sampling-profiler", daemon=True
+        )
+        self._sampler_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops sampling.
+        """
+
+        self._stop_event.set()
+        if self._sampler_thread is not None:
+            self._sampler_thread.join()
+        self.duration = time.perf_counter() - self._start_time
+
+    def _sample(self, target_thread_id: int) -> None:
+        # Each sample is weighted by the time since the previous one, since a busy thread holding the GIL
+        # delays the sampler beyond the interval.
+        last_sample_time = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(target_thread_id)
+            sample_time = time.perf_counter()
+            elapsed, last_sample_time = sample_time - last_sample_time, sample_time
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            self._stacks[tuple(stack)] += elapsed
+            self.sample_count += 1
+
+    def top_functions(self, limit: int = 25) -> list[dict]:
+        """
+        Gets the functions the sampled thread spent the most time in.
+
+        :param limit int: The number of functions to return.
+        :return: The hottest functions by self time, with their self and total time in seconds and percent.
+        :rtype: list[dict]
+        """
+
+        self_seconds: Counter = Counter()
+        total_seconds: Counter = Counter()
+        for stack, seconds in self._stacks.items():
+            self_seconds[stack[-1]] += seconds
+            for frame in set(stack):
+                total_seconds[frame] += seconds
+
+        sampled_seconds = sum(self._stacks.values()) or 1
+        return [
+            {
+                "function": name,
+                "file": filename,
+                "line": line,
+                "selfSeconds": round(seconds, 6),
+                "selfPercent": round(100 * seconds / sampled_seconds, 2),
+                "totalSeconds": round(total_seconds[(name, filename, line)], 6),
+                "totalPercent": round(100 * total_seconds[(name, filename, line)] / sampled_seconds, 2),
+            }
+            for (name, filename, line), seconds in self_seconds.most_common(limit)
+        ]
+
+    def to_speedscope(self, name: str) -> dict:
+        """
+        Exports the samples as a speedscope profile, https://www.speedscope.app, which renders them as a flamegraph.
+
+        :param name str: The name of the profile.
+        :return: The profile in speedscope's file format.
+        :rtype: dict
+        """
+
+        frame_indexes: dict[tuple, int] = {}
+        frames: list[dict] = []
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        for stack, seconds in self._stacks.items():
+            sample = []
+            for frame in stack:
+                if frame not in frame_indexes:
+                    frame_indexes[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                sample.append(frame_indexes[frame])
+            samples.append(sample)
+            weights.append(seconds)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "draftbash-nba-players-api",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
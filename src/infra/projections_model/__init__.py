@@ -1,3 +1,20 @@
-from src.infra.projections_model.player_weekly_projections_forecaster_service import (
-    PlayerWeeklyProjectionsForecasterService,
-)
+import importlib
+
+# These services import pandas and numpy, so they are only imported when first accessed.
+_LAZY_EXPORTS = {
+    "PlayerWeeklyProjectionsForecasterService": "src.infra.projections_model.player_weekly_projections_forecaster_service",
+    "ProjectionsBacktester": "src.infra.projections_model.projections_backtester",
+    "WeeklyScoringService": "src.infra.projections_model.weekly_scoring_service",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -1,15 +1,38 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+from contextlib import nullcontext
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from src.domain.entities import GamelogEntity, ScheduledMatchupEntity, PlayerEntity, TeamEntity, ProjectionEntity
 from src.interfaces.projections_model import IPlayerWeeklyProjectionsForecasterService
+from src.app.monitoring import trace_stage
+from src.app.caching import team_registry
+from src.infra.projections_model.projection_model import calculate_projections, load_model
+
+# The inputs shared by the shards of a parallel forecast. They are set before the pool forks, so the workers
+# inherit the gamelogs and defensive ratings instead of unpickling them for every shard.
+_shared_forecast_inputs: tuple = None
+_parallel_forecast_lock = threading.Lock()
 
 
 class PlayerWeeklyProjectionsForecasterService(IPlayerWeeklyProjectionsForecasterService):
     """
     Takes gamelog data, scheduled matchups, and player data and creates input data for the projections model
+
+    :param model_path str: The path of the model artifact to load, see projection_model.load_model.
+    :param workers int: The number of processes the players are forecasted on, sharded by team,
+        FORECASTER_WORKERS or 1 by default.
     """
 
+    def __init__(self, model_path: str = None, workers: int = None):
+        self.model_version, self._coefficients = load_model(model_path)
+        self._workers = max(workers or int(os.getenv("FORECASTER_WORKERS", "1")), 1)
+        self._last_input_signatures: dict[str, str] = {}  # Maps player ids to the inputs of their last projections
+        self._input_signatures_lock = threading.Lock()
+
     def execute(
         self,
         gamelogs: list[GamelogEntity],
@@ -17,165 +40,389 @@ class PlayerWeeklyProjectionsForecasterService(IPlayerWeeklyProjectionsForecaste
         players: list[PlayerEntity],
     ) -> list[ProjectionEntity]:
         """
-        Forecasts player statistics, i.e. rebounds, points, for each player's games in the current week.
+        Forecasts player statistics, i.e. rebounds, points, for each player's upcoming games in the given matchups.
 
-        :return: A dictionary of player weekly projections.
-        :rtype: dict
+        Player averages and defensive ratings are computed once, whatever the number of matchups, and every
+        player game is then scored in a single vectorized pass.
+
+        :return: A list of player game projections.
+        :rtype: list[ProjectionEntity]
         """
 
         active_players: list[PlayerEntity] = [player for player in players if player.team is not None]
+        gamelogs_df, defense_df = self._build_features(gamelogs)
+        return self._forecast(active_players, scheduled_matchups, gamelogs_df, defense_df)
 
-        gamelogs_df: pd.DataFrame = pd.json_normalize([dict(gamelog) for gamelog in gamelogs])[
-            [
-                "playerId",
-                "dateUTC",
-                "position",
-                "isStarter",
-                "isActive",
-                "playerTeam.teamId",
-                "opposingTeam.teamId",
-                "minutes",
-                "fieldGoalsAttempted",
-                "fieldGoalsMade",
-                "freeThrowsAttempted",
-                "freeThrowsMade",
-                "points",
-                "threesMade",
-                "steals",
-                "blocks",
-                "assists",
-                "reboundsTotal",
-                "turnovers",
+    def execute_incremental(
+        self,
+        gamelogs: list[GamelogEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        players: list[PlayerEntity],
+    ) -> tuple[list[ProjectionEntity], dict[str, str]]:
+        """
+        Forecasts only the players whose projections' inputs changed since the last committed incremental run.
+
+        Every player's inputs are reduced to a signature: their team, position, depth chart role and injury
+        status, a digest of their gamelogs (and of the gamelogs of their position and role when the projection
+        falls back to those), their team's matchups and the defensive ratings of each opponent against their
+        position and role. The signatures committed with commit_input_signatures, once the projections of a run
+        are saved, are kept by the service, so a new injury status or depth chart swap only recomputes that
+        player, and a rescheduled game only recomputes the two teams. Everything is recomputed on the first run
+        of the process, on a new day or with a new model, and after a run whose projections weren't saved.
+
+        :return: The projections of the players whose inputs changed, and the input signatures of every player.
+        :rtype: tuple[list[ProjectionEntity], dict[str, str]]
+        """
+
+        active_players: list[PlayerEntity] = [player for player in players if player.team is not None]
+        gamelogs_df, defense_df = self._build_features(gamelogs)
+        with trace_stage("weekly_projections_forecaster_service", "input_signatures"):
+            input_signatures: dict[str, str] = self._input_signatures(
+                active_players, scheduled_matchups, gamelogs_df, defense_df
+            )
+        with self._input_signatures_lock:
+            changed_players: list[PlayerEntity] = [
+                player
+                for player in active_players
+                if self._last_input_signatures.get(player.playerId) != input_signatures[player.playerId]
             ]
-        ]
-        gamelogs_df = gamelogs_df[gamelogs_df["isActive"]]  # Only include games where the player is active.
-        gamelogs_df["dateUTC"] = pd.to_datetime(gamelogs_df["dateUTC"])  # Convert column to datetime.
-        defense_df: pd.DataFrame = self._calculate_defensive_ratings(gamelogs_df)
-        player_averages_df: pd.DataFrame = self._calculate_player_averages(players, gamelogs_df)
-        current_datetime = pd.to_datetime(datetime.utcnow()).tz_localize("UTC")
 
-        player_projections: list[ProjectionEntity] = []
+        projections = self._forecast(changed_players, scheduled_matchups, gamelogs_df, defense_df)
+        return projections, input_signatures
+
+    def commit_input_signatures(self, input_signatures: dict[str, str]) -> None:
+        """
+        Records the input signatures of an incremental run once its projections are saved, so that the next
+        incremental run only forecasts the players whose inputs changed since.
+
+        :param input_signatures dict[str, str]: The input signatures returned by execute_incremental.
+        """
+
+        with self._input_signatures_lock:
+            self._last_input_signatures = input_signatures
+
+    def _build_features(self, gamelogs: list[GamelogEntity]) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Builds the active gamelogs' dataframe and the defensive ratings every projection is computed from.
+
+        :return: The active gamelogs and the defensive ratings.
+        :rtype: tuple[pd.DataFrame, pd.DataFrame]
+        """
+
+        with trace_stage("weekly_projections_forecaster_service", "dataframe_build"):
+            gamelogs_df: pd.DataFrame = pd.json_normalize([dict(gamelog) for gamelog in gamelogs])[
+                [
+                    "playerId",
+                    "dateUTC",
+                    "position",
+                    "isStarter",
+                    "isActive",
+                    "playerTeam.teamId",
+                    "opposingTeam.teamId",
+                    "minutes",
+                    "fieldGoalsAttempted",
+                    "fieldGoalsMade",
+                    "freeThrowsAttempted",
+                    "freeThrowsMade",
+                    "points",
+                    "threesMade",
+                    "steals",
+                    "blocks",
+                    "assists",
+                    "reboundsTotal",
+                    "turnovers",
+                ]
+            ]
+            gamelogs_df = gamelogs_df[gamelogs_df["isActive"]]  # Only include games where the player is active.
+            gamelogs_df["dateUTC"] = pd.to_datetime(gamelogs_df["dateUTC"])  # Convert column to datetime.
+        with trace_stage("weekly_projections_forecaster_service", "defensive_ratings"):
+            defense_df: pd.DataFrame = self._calculate_defensive_ratings(gamelogs_df)
+        return gamelogs_df, defense_df
+
+    def _forecast(
+        self,
+        active_players: list[PlayerEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        gamelogs_df: pd.DataFrame,
+        defense_df: pd.DataFrame,
+    ) -> list[ProjectionEntity]:
+        """
+        Forecasts the upcoming games of the given players, on a pool of forked processes with one shard per team
+        when more than one worker is configured.
+
+        Every player's projections only depend on their own averages and the shared defensive ratings, so the
+        shards' projections are the serial ones, and are put back in the serial order: by player, then game.
+
+        :param active_players list[PlayerEntity]: The players to forecast, all on a team.
+        :param scheduled_matchups list[ScheduledMatchupEntity]: The matchups to forecast.
+        :param gamelogs_df pd.DataFrame: The active gamelogs of every player.
+        :param defense_df pd.DataFrame: The defensive ratings of every team.
+        :return: A list of player game projections.
+        :rtype: list[ProjectionEntity]
+        """
+
+        team_shards: dict[str, list[PlayerEntity]] = {}
         for player in active_players:
+            team_shards.setdefault(player.team.teamId, []).append(player)
+        if self._workers == 1 or len(team_shards) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            return self._forecast_shard(active_players, scheduled_matchups, gamelogs_df, defense_df)
+
+        global _shared_forecast_inputs
+        with _parallel_forecast_lock, trace_stage("weekly_projections_forecaster_service", "parallel_forecast"):
+            _shared_forecast_inputs = (self, scheduled_matchups, gamelogs_df, defense_df)
             try:
-                player_scheduled_matchups: list[ScheduledMatchupEntity] = []
-                for matchup in scheduled_matchups:
-                    matchup_datetime = pd.to_datetime(matchup.dateTimeUTC)
-                    is_home_player_team: bool = matchup.homeTeam.teamId == player.team.teamId
-                    is_away_player_team: bool = matchup.awayTeam.teamId == player.team.teamId
-
-                    if (is_home_player_team or is_away_player_team) and matchup_datetime > current_datetime:
-                        player_scheduled_matchups.append(matchup)
-
-                for schedule in player_scheduled_matchups:
-                    player_team: TeamEntity = schedule.homeTeam
-                    opposing_team: TeamEntity = schedule.awayTeam
-                    if schedule.awayTeam.teamId == player.team.teamId:
-                        player_team = schedule.awayTeam
-                        opposing_team = schedule.homeTeam
-
-                    is_starter: bool = player.depthChartOrder == 1
-                    is_injured: bool = False
-                    if player.injuryStatus is not None:
-                        is_injured = player.injuryStatus.upper() == "OUT"
-
-                    player_game_projection: ProjectionEntity = None
-
-                    if not is_injured:
-                        player_averages: pd.Series = player_averages_df.loc[player.playerId]
-                        defense_ratings: pd.Series = defense_df.loc[(opposing_team.teamId, player.position, is_starter)]
-
-                        predictions: list[float] = self._calculate_projections(player_averages, defense_ratings)
-                        player_game_projection: ProjectionEntity = ProjectionEntity(
-                            gameId=schedule.gameId,
-                            dateUTC=schedule.dateTimeUTC,
-                            playerId=player.playerId,
-                            playerTeam=player_team,
-                            opposingTeam=opposing_team,
-                            fieldGoalsAttempted=predictions["fieldGoalsAttempted"],
-                            fieldGoalsMade=predictions["fieldGoalsMade"],
-                            threesMade=predictions["threesMade"],
-                            freeThrowsAttempted=predictions["freeThrowsAttempted"],
-                            freeThrowsMade=predictions["freeThrowsMade"],
-                            points=predictions["points"],
-                            assists=predictions["assists"],
-                            rebounds=predictions["reboundsTotal"],
-                            turnovers=predictions["turnovers"],
-                            steals=predictions["steals"],
-                            blocks=predictions["blocks"],
-                        )
-                    else:
-                        player_game_projection = ProjectionEntity(
-                            gameId=schedule.gameId,
-                            dateUTC=schedule.dateTimeUTC,
-                            playerId=player.playerId,
-                            playerTeam=player_team,
-                            opposingTeam=opposing_team,
-                            fieldGoalsAttempted=0,
-                            fieldGoalsMade=0,
-                            threesMade=0,
-                            freeThrowsAttempted=0,
-                            freeThrowsMade=0,
-                            points=0,
-                            assists=0,
-                            rebounds=0,
-                            turnovers=0,
-                            steals=0,
-                            blocks=0,
-                        )
-                    player_projections.append(player_game_projection)
-            except Exception as e:
-                print(f"Error forecasting player projections: {e}")
-                continue
+                with multiprocessing.get_context("fork").Pool(min(self._workers, len(team_shards))) as pool:
+                    shards_projections = pool.map(_forecast_team_shard, list(team_shards.values()), chunksize=1)
+            finally:
+                _shared_forecast_inputs = None
+
+        player_projections: dict[str, list[ProjectionEntity]] = {}
+        for shard_projections in shards_projections:
+            for projection in shard_projections:
+                # The projections were copied back from the workers, teams included
+                projection.playerTeam = team_registry.intern(projection.playerTeam)
+                projection.opposingTeam = team_registry.intern(projection.opposingTeam)
+                player_projections.setdefault(projection.playerId, []).append(projection)
+        return [
+            projection
+            for player_id in dict.fromkeys(player.playerId for player in active_players)
+            for projection in player_projections.get(player_id, [])
+        ]
+
+    def _forecast_shard(
+        self,
+        active_players: list[PlayerEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        gamelogs_df: pd.DataFrame,
+        defense_df: pd.DataFrame,
+        in_forked_worker: bool = False,
+    ) -> list[ProjectionEntity]:
+        """
+        Forecasts the upcoming games of the given players in this process.
+
+        A forked worker of the pool takes no lock: the parent may have forked while another of its threads held
+        one, i.e. the metrics' lock held by the MongoDB command listener, which the worker would wait on forever.
+        So its stages aren't traced, the parent times the whole parallel forecast, and its teams aren't
+        interned, the parent interns the projections' teams once they're copied back.
+
+        :param active_players list[PlayerEntity]: The players to forecast, all on a team.
+        :param scheduled_matchups list[ScheduledMatchupEntity]: The matchups to forecast.
+        :param gamelogs_df pd.DataFrame: The active gamelogs of every player.
+        :param defense_df pd.DataFrame: The defensive ratings of every team.
+        :param in_forked_worker bool: Whether this process is a forked worker of the pool.
+        :return: A list of player game projections.
+        :rtype: list[ProjectionEntity]
+        """
+
+        def stage(name: str):
+            return nullcontext() if in_forked_worker else trace_stage("weekly_projections_forecaster_service", name)
+
+        def intern(team: TeamEntity) -> TeamEntity:
+            return team if in_forked_worker else team_registry.intern(team)
+
+        with stage("player_averages"):
+            player_averages_df: pd.DataFrame = self._calculate_player_averages(active_players, gamelogs_df)
+        current_datetime = pd.to_datetime(datetime.utcnow()).tz_localize("UTC")
+
+        with stage("feature_build"):
+            games_df: pd.DataFrame = self._build_player_games(active_players, scheduled_matchups, current_datetime)
+            if len(games_df) == 0:
+                return []
+
+            # Feature tensor of every remaining player game: the player's averages and the opponent's defense
+            player_averages: pd.DataFrame = player_averages_df.reindex(games_df["playerId"]).reset_index(drop=True)
+            defense_ratings: pd.DataFrame = defense_df.reindex(
+                pd.MultiIndex.from_arrays([games_df["opposingTeamId"], games_df["position"], games_df["isStarter"]])
+            ).reset_index(drop=True)
+
+            # Games without a defensive rating against the player's position and role can't be forecasted
+            has_defense_ratings = defense_ratings.notna().any(axis=1) | games_df["isInjured"]
+            games_df = games_df[has_defense_ratings].reset_index(drop=True)
+            player_averages = player_averages[has_defense_ratings].reset_index(drop=True)
+            defense_ratings = defense_ratings[has_defense_ratings].reset_index(drop=True)
+
+        with stage("projections"):
+            # Score every game in one vectorized pass, injured players are projected to record nothing
+            predictions_df = pd.DataFrame(self._calculate_projections(player_averages, defense_ratings))
+            predictions_df[games_df["isInjured"].to_numpy()] = 0
+
+        with stage("entity_build"):
+            player_projections: list[ProjectionEntity] = []
+            for game, predictions in zip(games_df.itertuples(index=False), predictions_df.itertuples(index=False)):
+                matchup: ScheduledMatchupEntity = scheduled_matchups[game.matchupIndex]
+                home_team: TeamEntity = intern(matchup.homeTeam)
+                away_team: TeamEntity = intern(matchup.awayTeam)
+                player_team: TeamEntity = home_team if game.isHomeGame else away_team
+                opposing_team: TeamEntity = away_team if game.isHomeGame else home_team
+                player_projections.append(
+                    ProjectionEntity(
+                        gameId=matchup.gameId,
+                        dateUTC=matchup.dateTimeUTC,
+                        playerId=game.playerId,
+                        playerTeam=player_team,
+                        opposingTeam=opposing_team,
+                        fieldGoalsAttempted=predictions.fieldGoalsAttempted,
+                        fieldGoalsMade=predictions.fieldGoalsMade,
+                        threesMade=predictions.threesMade,
+                        freeThrowsAttempted=predictions.freeThrowsAttempted,
+                        freeThrowsMade=predictions.freeThrowsMade,
+                        points=predictions.points,
+                        assists=predictions.assists,
+                        rebounds=predictions.reboundsTotal,
+                        turnovers=predictions.turnovers,
+                        steals=predictions.steals,
+                        blocks=predictions.blocks,
+                    )
+                )
 
         return player_projections
 
-    def _calculate_projections(self, player_averages: pd.Series, defense_ratings: pd.Series) -> dict[float]:
+    def _input_signatures(
+        self,
+        active_players: list[PlayerEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        gamelogs_df: pd.DataFrame,
+        defense_df: pd.DataFrame,
+    ) -> dict[str, str]:
+        """
+        Reduces the inputs of every player's projections to a signature, which changes whenever they do.
+
+        :param active_players list[PlayerEntity]: The players that are on a team.
+        :param scheduled_matchups list[ScheduledMatchupEntity]: The matchups to forecast.
+        :param gamelogs_df pd.DataFrame: The active gamelogs of every player.
+        :param defense_df pd.DataFrame: The defensive ratings of every team.
+        :return: The signatures, by player id.
+        :rtype: dict[str, str]
         """
-        Calculate predicted player game stats based on player averages and defensive ratings.
 
-        The formulas are multivariate linear regressions trained with machine learning.
+        # The sum of the rows' hashes is a digest of a group of gamelogs that doesn't depend on their order
+        row_hashes = pd.Series(pd.util.hash_pandas_object(gamelogs_df, index=False).to_numpy(), index=gamelogs_df.index)
+        player_digests: dict = row_hashes.groupby(gamelogs_df["playerId"]).sum().to_dict()
+        pool_digests: dict = row_hashes.groupby([gamelogs_df["position"], gamelogs_df["isStarter"]]).sum().to_dict()
+        role_games: dict = gamelogs_df.groupby(["playerId", "playerTeam.teamId", "isStarter"]).size().to_dict()
+        defense_digests: dict = dict(zip(defense_df.index, pd.util.hash_pandas_object(defense_df, index=False)))
+
+        team_matchups: dict[str, list[tuple]] = {}
+        for matchup in scheduled_matchups:
+            for team, opposing_team, is_home_game in (
+                (matchup.homeTeam, matchup.awayTeam, True),
+                (matchup.awayTeam, matchup.homeTeam, False),
+            ):
+                team_matchups.setdefault(team.teamId, []).append(
+                    (matchup.gameId, matchup.dateTimeUTC, opposing_team.teamId, is_home_game)
+                )
+
+        # Averages are decayed by the days since each game and the defensive ratings' window moves daily
+        run_inputs = (self.model_version, datetime.utcnow().date().isoformat())
+        input_signatures: dict[str, str] = {}
+        for player in active_players:
+            is_starter: bool = player.depthChartOrder == 1
+            is_injured: bool = player.injuryStatus is not None and player.injuryStatus.upper() == "OUT"
+            # Bench players with fewer than 3 games in their role are projected from their position's average
+            uses_pool = not is_starter and role_games.get((player.playerId, player.team.teamId, False), 0) < 3
+            games = tuple(
+                game + (defense_digests.get((game[2], player.position, is_starter)),)  # The opponent's defense
+                for game in team_matchups.get(player.team.teamId, [])
+            )
+            player_inputs = (
+                run_inputs,
+                player.team.teamId,
+                player.position,
+                is_starter,
+                is_injured,
+                player_digests.get(player.playerId),
+                pool_digests.get((player.position, False)) if uses_pool else None,
+                games,
+            )
+            input_signatures[player.playerId] = hashlib.sha1(repr(player_inputs).encode()).hexdigest()
+
+        return input_signatures
+
+    def _build_player_games(
+        self,
+        active_players: list[PlayerEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        current_datetime: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """
+        Pairs every player with each of their team's upcoming scheduled matchups.
 
-        :param player_averages pd.Series: The player's statistical averages.
-        :param defense_ratings pd.Series: The opposing team's defensive ratings,
-            i.e. per-minute stats against the player's position.
-        :return: A dictionary of predicted player game stats.
-        :rtype: dict
+        :param active_players list[PlayerEntity]: The players that are on a team.
+        :param scheduled_matchups list[ScheduledMatchupEntity]: The matchups to forecast.
+        :param current_datetime pd.Timestamp: Only matchups after this time are forecasted.
+        :return: One row per player game, ordered by player and then by matchup.
+        :rtype: pd.DataFrame
         """
 
-        field_goals_attempted: float = (
-            -0.604 + 0.949 * player_averages["fieldGoalsAttempted"] + 2.956 * defense_ratings["fieldGoalsAttempted"]
-        )
-        field_goals_made: float = (
-            -0.367 + 0.925 * player_averages["fieldGoalsMade"] + 3.902 * defense_ratings["fieldGoalsMade"]
+        if len(active_players) == 0 or len(scheduled_matchups) == 0:
+            return pd.DataFrame()
+
+        matchups_df = pd.DataFrame(
+            {
+                "matchupIndex": range(len(scheduled_matchups)),
+                "dateUTC": pd.to_datetime([matchup.dateTimeUTC for matchup in scheduled_matchups]),
+                "homeTeamId": [matchup.homeTeam.teamId for matchup in scheduled_matchups],
+                "awayTeamId": [matchup.awayTeam.teamId for matchup in scheduled_matchups],
+            }
         )
-        threes_made: float = -0.02 + 0.856 * player_averages["threesMade"] + 3.39 * defense_ratings["threesMade"]
-        free_throws_attempted: float = (
-            -0.08 + 0.874 * player_averages["freeThrowsAttempted"] + 3.212 * defense_ratings["freeThrowsAttempted"]
+        matchups_df = matchups_df[matchups_df["dateUTC"] > current_datetime]
+
+        # Each matchup is played by both teams
+        team_games_df = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "matchupIndex": matchups_df["matchupIndex"],
+                        "teamId": matchups_df["homeTeamId"],
+                        "opposingTeamId": matchups_df["awayTeamId"],
+                        "isHomeGame": True,
+                    }
+                ),
+                pd.DataFrame(
+                    {
+                        "matchupIndex": matchups_df["matchupIndex"],
+                        "teamId": matchups_df["awayTeamId"],
+                        "opposingTeamId": matchups_df["homeTeamId"],
+                        "isHomeGame": False,
+                    }
+                ),
+            ]
         )
-        free_throws_made: float = (
-            -0.046 + 0.864 * player_averages["freeThrowsMade"] + 3.219 * defense_ratings["freeThrowsMade"]
+
+        players_df = pd.DataFrame(
+            {
+                "playerIndex": range(len(active_players)),
+                "playerId": [player.playerId for player in active_players],
+                "teamId": [player.team.teamId for player in active_players],
+                "position": [player.position for player in active_players],
+                "isStarter": [player.depthChartOrder == 1 for player in active_players],
+                "isInjured": [
+                    player.injuryStatus is not None and player.injuryStatus.upper() == "OUT"
+                    for player in active_players
+                ],
+            }
         )
-        points: float = -0.778 + 0.928 * player_averages["points"] + 3.307 * defense_ratings["points"]
-        assists: float = -0.004 + 0.931 * player_averages["assists"] + 1.789 * defense_ratings["assists"]
-        rebounds_total: float = (
-            0.059 + 0.931 * player_averages["reboundsTotal"] + 1.392 * defense_ratings["reboundsTotal"]
+
+        return (
+            players_df.merge(team_games_df, on="teamId")
+            .sort_values(["playerIndex", "matchupIndex"])
+            .reset_index(drop=True)
         )
-        turnovers: float = -0.018 + 0.846 * player_averages["turnovers"] + 3.354 * defense_ratings["turnovers"]
-        steals: float = 0.171 + 0.714 * player_averages["steals"]
-        blocks: float = 0.027 + 0.747 * player_averages["blocks"] + 3.439 * defense_ratings["blocks"]
-        return {
-            "fieldGoalsAttempted": field_goals_attempted,
-            "fieldGoalsMade": field_goals_made,
-            "threesMade": threes_made,
-            "freeThrowsAttempted": free_throws_attempted,
-            "freeThrowsMade": free_throws_made,
-            "points": points,
-            "assists": assists,
-            "reboundsTotal": rebounds_total,
-            "turnovers": turnovers,
-            "steals": steals,
-            "blocks": blocks,
-        }
+
+    def _calculate_projections(self, player_averages: pd.DataFrame, defense_ratings: pd.DataFrame) -> dict:
+        """
+        Calculate predicted player game stats based on player averages and defensive ratings.
+
+        The formulas are multivariate linear regressions whose coefficients are refitted by projection_model_trainer.
+
+        :param player_averages pd.DataFrame: The players' statistical averages, one row per game.
+        :param defense_ratings pd.DataFrame: The opposing teams' defensive ratings,
+            i.e. per-minute stats against the player's position, one row per game.
+        :return: A dictionary of predicted player game stats.
+        :rtype: dict
+        """
+
+        return calculate_projections(player_averages, defense_ratings, self._coefficients)
 
     def _calculate_player_averages(self, players: list[PlayerEntity], gamelogs_df: pd.DataFrame) -> dict:
         """
@@ -274,4 +521,13 @@ class PlayerWeeklyProjectionsForecasterService(IPlayerWeeklyProjectionsForecaste
 
         defense_df = gamelogs_aggregate_df.sum().div(gamelogs_aggregate_df["minutes"].sum(), axis=0)
 
-        return defense_df
\ No newline at end of file
+        return defense_df
+
+
+def _forecast_team_shard(players: list[PlayerEntity]) -> list[ProjectionEntity]:
+    """
+    Forecasts a team's players in a worker of the pool, from the inputs inherited from the parent process.
+    """
+
+    service, scheduled_matchups, gamelogs_df, defense_df = _shared_forecast_inputs
+    return service._forecast_shard(players, scheduled_matchups, gamelogs_df, defense_df, in_forked_worker=True)
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from src.domain.entities import GamelogEntity
+from src.infra.projections_model.projection_model import PROJECTED_STATS
+
+DECAY_PER_DAY: float = 0.98  # Weight of a game decays by 2% per day, as in the weekly forecaster
+DEFENSE_WINDOW_DAYS: int = 50
+MIN_DEFENSE_WINDOW_DATES: int = 20  # Below this many game dates in the window, all earlier games are used
+MIN_WEIGHTED_GAMES: int = 3  # Below this many games, a player's average falls back to a wider population
+_DAYS_PER_GROUP: int = 1 << 20  # Spacing of groups in the combined (group, day) search keys
+
+
+def gamelogs_to_dataframe(gamelogs: list[GamelogEntity]) -> pd.DataFrame:
+    """
+    Converts gamelogs into the dataframe the point-in-time features are computed from.
+
+    :param gamelogs list[GamelogEntity]: The gamelogs.
+    :return: One row per gamelog, with the game date as a whole day number in the day column.
+    :rtype: pd.DataFrame
+    """
+
+    gamelogs_df = pd.DataFrame(
+        {
+            "gameId": [gamelog.gameId for gamelog in gamelogs],
+            "playerId": [gamelog.playerId for gamelog in gamelogs],
+            "dateUTC": pd.to_datetime([gamelog.dateUTC for gamelog in gamelogs], utc=True),
+            "season": [gamelog.season for gamelog in gamelogs],
+            "isRegularSeasonGame": [gamelog.isRegularSeasonGame for gamelog in gamelogs],
+            "isActive": [gamelog.isActive for gamelog in gamelogs],
+            "isStarter": [gamelog.isStarter for gamelog in gamelogs],
+            "position": [gamelog.position for gamelog in gamelogs],
+            "playerTeamId": [gamelog.playerTeam.teamId for gamelog in gamelogs],
+            "opposingTeamId": [gamelog.opposingTeam.teamId for gamelog in gamelogs],
+            "minutes": [gamelog.minutes for gamelog in gamelogs],
+            **{stat: [getattr(gamelog, stat) for gamelog in gamelogs] for stat in PROJECTED_STATS},
+        }
+    )
+    if len(gamelogs_df) > 0:
+        first_date = gamelogs_df["dateUTC"].min().normalize()
+        gamelogs_df["day"] = (gamelogs_df["dateUTC"].dt.normalize() - first_date).dt.days.astype(np.int64)
+    else:
+        gamelogs_df["day"] = pd.Series(dtype=np.int64)
+    return gamelogs_df
+
+
+def build_point_in_time_features(gamelogs_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Rebuilds, for every gamelog, the player averages and opposing defensive ratings as they were known
+    on the morning of that game, using only earlier games so that no result leaks into its own features.
+
+    The weekly forecaster's rules are replayed: a player's average is weighted by 0.98 per day of age over
+    their games with the same team and starter role, falling back to their unweighted role average as a
+    starter, or the league average of their position as a bench player, with fewer than 3 such games.
+    Defensive ratings are the per-minute stats allowed to a position and role over the last 50 days, or over
+    every earlier game when fewer than 20 game dates fall in that window.
+
+    Every feature is read off cumulative sums with a bisection, so the whole history is processed in one pass
+    instead of re-running the pipeline for each date.
+
+    :param gamelogs_df pd.DataFrame: Active gamelogs, as returned by gamelogs_to_dataframe.
+    :return: The player averages and the defensive ratings, both aligned with the rows of gamelogs_df.
+    :rtype: tuple[pd.DataFrame, pd.DataFrame]
+    """
+
+    days: np.ndarray = gamelogs_df["day"].to_numpy()
+    stats: np.ndarray = gamelogs_df[PROJECTED_STATS].to_numpy(dtype=np.float64)
+    ones: np.ndarray = np.ones((len(gamelogs_df), 1))
+
+    # Decayed averages over the player's games with the same team and role.
+    # 0.98 ** (today - day) / sum(0.98 ** (today - day)) == 0.98 ** -day / sum(0.98 ** -day), so the
+    # weights don't depend on the date the average is taken at and can be accumulated once.
+    weights = (DECAY_PER_DAY ** -(days - days.min(initial=0)).astype(np.float64))[:, None]
+    team_role_groups = _group_ids(gamelogs_df, ["playerId", "playerTeamId", "isStarter"])
+    team_role_sums = _prior_sums(team_role_groups, days, np.hstack([ones, weights, weights * stats]), days)
+    team_role_counts = team_role_sums[:, 0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weighted_averages = team_role_sums[:, 2:] / team_role_sums[:, 1:2]
+
+    # Starter fallback: the player's unweighted average over their games in the same role
+    role_groups = _group_ids(gamelogs_df, ["playerId", "isStarter"])
+    role_sums = _prior_sums(role_groups, days, np.hstack([ones, stats]), days)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        role_averages = role_sums[:, 1:] / role_sums[:, :1]
+
+    # Bench fallback: the league's average for the position in the same role
+    position_groups = _group_ids(gamelogs_df, ["position", "isStarter"])
+    position_sums = _prior_sums(position_groups, days, np.hstack([ones, stats]), days)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        position_averages = position_sums[:, 1:] / position_sums[:, :1]
+
+    is_starter = gamelogs_df["isStarter"].to_numpy(dtype=bool)[:, None]
+    fallback_averages = np.where(is_starter, role_averages, position_averages)
+    player_averages = np.where((team_role_counts >= MIN_WEIGHTED_GAMES)[:, None], weighted_averages, fallback_averages)
+
+    # Defensive ratings against the position and role, over a trailing window
+    minutes_and_stats = np.hstack([gamelogs_df[["minutes"]].to_numpy(dtype=np.float64), stats])
+    defense_groups = _group_ids(gamelogs_df, ["opposingTeamId", "position", "isStarter"])
+    prior_defense_sums = _prior_sums(defense_groups, days, minutes_and_stats, days)
+    window_defense_sums = prior_defense_sums - _prior_sums(
+        defense_groups, days, minutes_and_stats, days - DEFENSE_WINDOW_DAYS
+    )
+    game_days = np.unique(days)
+    window_dates = np.searchsorted(game_days, days, side="left") - np.searchsorted(
+        game_days, days - DEFENSE_WINDOW_DAYS, side="left"
+    )
+    defense_sums = np.where(
+        (window_dates >= MIN_DEFENSE_WINDOW_DATES)[:, None], window_defense_sums, prior_defense_sums
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        defense_ratings = defense_sums[:, 1:] / defense_sums[:, :1]
+
+    return (
+        pd.DataFrame(player_averages, columns=PROJECTED_STATS, index=gamelogs_df.index),
+        pd.DataFrame(defense_ratings, columns=PROJECTED_STATS, index=gamelogs_df.index),
+    )
+
+
+def to_utc_timestamp(date: datetime) -> pd.Timestamp:
+    """
+    Converts a date, naive dates being UTC, to a timestamp comparable with the dateUTC column.
+    """
+
+    return pd.Timestamp(date if date.tzinfo else date.replace(tzinfo=timezone.utc))
+
+
+def _group_ids(gamelogs_df: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    return gamelogs_df.groupby(columns, sort=False, dropna=False).ngroup().to_numpy(dtype=np.int64)
+
+
+def _prior_sums(group_ids: np.ndarray, days: np.ndarray, values: np.ndarray, query_days: np.ndarray) -> np.ndarray:
+    """
+    Sums, for every row, the values of the rows in its group that fall strictly before its query day.
+
+    :param group_ids np.ndarray: The group of each row.
+    :param days np.ndarray: The day number of each row.
+    :param values np.ndarray: The values to sum, one row per row.
+    :param query_days np.ndarray: The exclusive upper bound day of each row's sum.
+    :return: The sums, one row per row.
+    :rtype: np.ndarray
+    """
+
+    keys = group_ids * _DAYS_PER_GROUP + days
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    cumulative_sums = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values[order], axis=0)])
+
+    group_starts = np.searchsorted(sorted_keys, group_ids * _DAYS_PER_GROUP, side="left")
+    query_ends = np.searchsorted(sorted_keys, group_ids * _DAYS_PER_GROUP + np.clip(query_days, 0, None), side="left")
+    return cumulative_sums[query_ends] - cumulative_sums[group_starts]
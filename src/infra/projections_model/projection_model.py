@@ -0,0 +1,94 @@
+import json
+import os
+from pathlib import Path
+import pandas as pd
+
+DEFAULT_MODEL_PATH: str = os.path.join("models", "projection_model.json")
+DEFAULT_MODEL_VERSION: str = "default"
+
+# The stats the model projects, named after the gamelog columns they are fitted on
+PROJECTED_STATS: list[str] = [
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "threesMade",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+    "points",
+    "assists",
+    "reboundsTotal",
+    "turnovers",
+    "steals",
+    "blocks",
+]
+
+# Multivariate linear regressions trained with machine learning, mapping each stat to
+# (intercept, player average coefficient, defensive rating coefficient).
+DEFAULT_COEFFICIENTS: dict[str, tuple[float, float, float]] = {
+    "fieldGoalsAttempted": (-0.604, 0.949, 2.956),
+    "fieldGoalsMade": (-0.367, 0.925, 3.902),
+    "threesMade": (-0.02, 0.856, 3.39),
+    "freeThrowsAttempted": (-0.08, 0.874, 3.212),
+    "freeThrowsMade": (-0.046, 0.864, 3.219),
+    "points": (-0.778, 0.928, 3.307),
+    "assists": (-0.004, 0.931, 1.789),
+    "reboundsTotal": (0.059, 0.931, 1.392),
+    "turnovers": (-0.018, 0.846, 3.354),
+    "steals": (0.171, 0.714, 0.0),
+    "blocks": (0.027, 0.747, 3.439),
+}
+
+
+def calculate_projections(
+    player_averages: pd.DataFrame,
+    defense_ratings: pd.DataFrame,
+    coefficients: dict[str, tuple[float, float, float]] = DEFAULT_COEFFICIENTS,
+) -> dict:
+    """
+    Calculate predicted player game stats based on player averages and defensive ratings.
+
+    The formulas are applied column-wise, so a single game (Series) or every game at once (DataFrame rows)
+    can be scored.
+
+    :param player_averages pd.DataFrame: The players' statistical averages, one row per game.
+    :param defense_ratings pd.DataFrame: The opposing teams' defensive ratings,
+        i.e. per-minute stats against the player's position, one row per game.
+    :param coefficients dict: The regression coefficients of each stat.
+    :return: A dictionary of predicted player game stats.
+    :rtype: dict
+    """
+
+    projections: dict = {}
+    for stat, (intercept, average_coefficient, defense_coefficient) in coefficients.items():
+        projection = intercept + average_coefficient * player_averages[stat]
+        if defense_coefficient != 0:  # Stats without a defensive term don't need a defensive rating
+            projection = projection + defense_coefficient * defense_ratings[stat]
+        projections[stat] = projection
+    return projections
+
+
+def load_model(path: str = None) -> tuple[str, dict[str, tuple[float, float, float]]]:
+    """
+    Loads the regression coefficients from the model artifact written by projection_model_trainer.
+
+    The artifact is read from the PROJECTION_MODEL_PATH environment variable, or models/projection_model.json,
+    and the built-in coefficients are used when there is no artifact.
+
+    :param path str: The path of the artifact to load.
+    :return: The version of the model and the coefficients of each stat.
+    :rtype: tuple[str, dict[str, tuple[float, float, float]]]
+    """
+
+    artifact_path = Path(path or os.getenv("PROJECTION_MODEL_PATH", DEFAULT_MODEL_PATH))
+    if not artifact_path.is_file():
+        return DEFAULT_MODEL_VERSION, DEFAULT_COEFFICIENTS
+
+    artifact: dict = json.loads(artifact_path.read_text())
+    coefficients = {
+        stat: (
+            float(artifact["coefficients"][stat]["intercept"]),
+            float(artifact["coefficients"][stat]["playerAverage"]),
+            float(artifact["coefficients"][stat]["defenseRating"]),
+        )
+        for stat in PROJECTED_STATS
+    }
+    return artifact["version"], coefficients
@@ -0,0 +1,167 @@
+"""
+Refits the projection model's regression coefficients on the stored gamelogs and writes a versioned artifact
+that the forecaster loads at startup.
+
+Usage:
+    python -m src.infra.projections_model.projection_model_trainer --start-date 2023-10-24 --end-date 2024-04-15
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+import numpy as np
+from src.infra.files import atomic_write_bytes
+from src.domain.entities import GamelogEntity
+from src.infra.projections_model.projection_model import DEFAULT_COEFFICIENTS, DEFAULT_MODEL_PATH, PROJECTED_STATS
+from src.infra.projections_model.point_in_time_features import (
+    gamelogs_to_dataframe,
+    build_point_in_time_features,
+    to_utc_timestamp,
+)
+
+# Stats whose built-in model has no defensive term are refitted without one
+WITHOUT_DEFENSE_TERM: frozenset[str] = frozenset(
+    stat for stat, (_, _, defense_coefficient) in DEFAULT_COEFFICIENTS.items() if defense_coefficient == 0
+)
+
+
+def fit_coefficients(
+    player_averages: np.ndarray, defense_ratings: np.ndarray, actuals: np.ndarray
+) -> dict[str, tuple[float, float, float]]:
+    """
+    Fits every stat's linear model, actual ~ intercept + player average + defensive rating, by least squares.
+
+    A stat whose model can't be identified from the games, i.e. a constant or collinear feature or fewer games
+    than terms, keeps its built-in coefficients rather than failing the whole training run.
+
+    :param player_averages np.ndarray: The point-in-time player averages, one row per game and column per stat.
+    :param defense_ratings np.ndarray: The point-in-time defensive ratings, one row per game and column per stat.
+    :param actuals np.ndarray: The actual stats, one row per game and column per stat.
+    :return: The intercept, player average coefficient and defensive rating coefficient of each stat.
+    :rtype: dict[str, tuple[float, float, float]]
+    """
+
+    coefficients: dict[str, tuple[float, float, float]] = {}
+    for index, stat in enumerate(PROJECTED_STATS):
+        # Design matrix of the stat: (games, [1, player average, defensive rating]), without the defensive
+        # rating for stats whose model has no defensive term
+        columns = [np.ones_like(player_averages[:, index]), player_averages[:, index]]
+        if stat not in WITHOUT_DEFENSE_TERM:
+            columns.append(defense_ratings[:, index])
+        design = np.stack(columns, axis=-1)
+        try:
+            solution, _, rank, _ = np.linalg.lstsq(design, actuals[:, index], rcond=None)
+        except np.linalg.LinAlgError:
+            rank, solution = 0, None
+        if rank < design.shape[1] or not np.isfinite(solution).all():
+            print(f"Can't fit the {stat} model on these games, keeping its built-in coefficients")
+            coefficients[stat] = DEFAULT_COEFFICIENTS[stat]
+            continue
+        coefficients[stat] = (float(solution[0]), float(solution[1]), float(solution[2]) if len(solution) > 2 else 0.0)
+    return coefficients
+
+
+def train(gamelogs: list[GamelogEntity], start_date: datetime, end_date: datetime) -> dict:
+    """
+    Refits the projection model on the games played within a date range.
+
+    :param gamelogs list[GamelogEntity]: The gamelogs of the range and of the history before it, which
+        the point-in-time player averages and defensive ratings are built from.
+    :param start_date datetime: The start of the training range (inclusive).
+    :param end_date datetime: The end of the training range (exclusive).
+    :return: The model artifact, i.e. its version, coefficients and training fit.
+    :rtype: dict
+    """
+
+    gamelogs_df = gamelogs_to_dataframe([gamelog for gamelog in gamelogs if gamelog.isActive])
+    player_averages_df, defense_df = build_point_in_time_features(gamelogs_df)
+    in_range = (gamelogs_df["dateUTC"] >= to_utc_timestamp(start_date)) & (
+        gamelogs_df["dateUTC"] < to_utc_timestamp(end_date)
+    )
+    has_features = player_averages_df.notna().all(axis=1) & defense_df.notna().all(axis=1)
+    rows = in_range & has_features
+    if rows.sum() < 3:
+        raise ValueError("Not enough games with point-in-time features to fit the projection model")
+
+    player_averages = player_averages_df[rows].to_numpy(dtype=np.float64)
+    defense_ratings = defense_df[rows].to_numpy(dtype=np.float64)
+    actuals = gamelogs_df.loc[rows, PROJECTED_STATS].to_numpy(dtype=np.float64)
+    coefficients = fit_coefficients(player_averages, defense_ratings, actuals)
+
+    intercepts, average_coefficients, defense_coefficients = (
+        np.array([coefficients[stat][term] for stat in PROJECTED_STATS]) for term in range(3)
+    )
+    residuals = actuals - (intercepts + average_coefficients * player_averages + defense_coefficients * defense_ratings)
+    root_mean_squared_errors = np.sqrt(np.square(residuals).mean(axis=0))
+
+    trained_at = datetime.utcnow()
+    coefficients_hash = hashlib.sha256(json.dumps(coefficients, sort_keys=True).encode()).hexdigest()[:8]
+    return {
+        "version": f"{trained_at.strftime('%Y%m%dT%H%M%SZ')}-{coefficients_hash}",
+        "trainedAt": trained_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "trainingStartDate": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "trainingEndDate": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "games": int(rows.sum()),
+        "coefficients": {
+            stat: {"intercept": intercept, "playerAverage": average_coefficient, "defenseRating": defense_coefficient}
+            for stat, (intercept, average_coefficient, defense_coefficient) in coefficients.items()
+        },
+        "trainingRmse": {stat: round(float(rmse), 4) for stat, rmse in zip(PROJECTED_STATS, root_mean_squared_errors)},
+    }
+
+
+def write_artifact(artifact: dict, path: str = DEFAULT_MODEL_PATH) -> Path:
+    """
+    Writes a model artifact next to the current model and makes it the current model.
+
+    The artifact is kept as <name>_<version>.json, so previous models can be restored by copying them back.
+
+    :param artifact dict: The model artifact.
+    :param path str: The path of the current model, which the forecaster loads.
+    :return: The path of the versioned artifact.
+    :rtype: Path
+    """
+
+    current_path = Path(path)
+    current_path.parent.mkdir(parents=True, exist_ok=True)
+    versioned_path = current_path.with_name(f"{current_path.stem}_{artifact['version']}{current_path.suffix}")
+    content = json.dumps(artifact, indent=2)
+    versioned_path.write_text(content)
+
+    # Swapped in atomically, so a forecaster starting up never reads a partially written model
+    atomic_write_bytes(current_path, content.encode())
+    return versioned_path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start-date", type=datetime.fromisoformat, default=None, help="By default a year ago.")
+    parser.add_argument("--end-date", type=datetime.fromisoformat, default=None, help="By default now.")
+    parser.add_argument("--output", default=os.getenv("PROJECTION_MODEL_PATH", DEFAULT_MODEL_PATH))
+    args = parser.parse_args()
+
+    from src.infra.persistence.gamelog_storage import create_gamelog_repository
+
+    end_date: datetime = args.end_date or datetime.utcnow()
+    start_date: datetime = args.start_date or end_date - timedelta(days=365)
+    # The year before the training range is read too, so its first games have averages to be fitted on
+    gamelogs = create_gamelog_repository().get_all_between_dates(start_date - timedelta(days=365), end_date, limit=None)
+
+    artifact = train(gamelogs, start_date, end_date)
+    versioned_path = write_artifact(artifact, args.output)
+    print(f"Trained model {artifact['version']} on {artifact['games']} games, wrote {versioned_path}")
+    for stat in PROJECTED_STATS:
+        intercept, average_coefficient, defense_coefficient = artifact["coefficients"][stat].values()
+        print(
+            f"{stat:<20} {intercept:>8.3f} {average_coefficient:>8.3f} {defense_coefficient:>8.3f}"
+            + f"   rmse {artifact['trainingRmse'][stat]:.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
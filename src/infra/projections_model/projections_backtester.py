@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from src.domain.entities import GamelogEntity
+from src.interfaces.projections_model import IProjectionsBacktester
+from src.app.monitoring import trace_stage
+from src.infra.projections_model.projection_model import PROJECTED_STATS, calculate_projections, load_model
+from src.infra.projections_model.point_in_time_features import (
+    gamelogs_to_dataframe,
+    build_point_in_time_features,
+    to_utc_timestamp,
+)
+
+
+class ProjectionsBacktester(IProjectionsBacktester):
+    """
+    Replays past games through the projection model and scores its projections against the actual results.
+
+    :param model_path str: The path of the model artifact to backtest, see projection_model.load_model.
+    """
+
+    def __init__(self, model_path: str = None):
+        self.model_version, self._coefficients = load_model(model_path)
+
+    def execute(self, gamelogs: list[GamelogEntity], start_date: datetime, end_date: datetime) -> dict:
+        """
+        Projects every active game played within a date range from the features known before it was played,
+        and measures the error of the projections overall and per fantasy week.
+
+        :param gamelogs list[GamelogEntity]: The gamelogs of the range and of the history before it, which
+            the player averages and defensive ratings are built from.
+        :param start_date datetime: The start of the backtested range (inclusive).
+        :param end_date datetime: The end of the backtested range (exclusive).
+        :return: The model version, the number of games scored and skipped, and the MAE, RMSE and bias of
+            every stat, overall and per week starting on Monday.
+        :rtype: dict
+        """
+
+        with trace_stage("projections_backtest", "features"):
+            gamelogs_df = gamelogs_to_dataframe([gamelog for gamelog in gamelogs if gamelog.isActive])
+            player_averages_df, defense_df = build_point_in_time_features(gamelogs_df)
+
+        with trace_stage("projections_backtest", "scoring"):
+            in_range = (gamelogs_df["dateUTC"] >= to_utc_timestamp(start_date)) & (
+                gamelogs_df["dateUTC"] < to_utc_timestamp(end_date)
+            )
+            # Games without any earlier history for the player or the defense can't be projected
+            has_features = player_averages_df.notna().all(axis=1) & defense_df.notna().all(axis=1)
+            scored = in_range & has_features
+
+            projections_df = pd.DataFrame(
+                calculate_projections(player_averages_df[scored], defense_df[scored], self._coefficients),
+                columns=PROJECTED_STATS,
+            )
+            errors_df = projections_df - gamelogs_df.loc[scored, PROJECTED_STATS].astype(np.float64)
+            dates = gamelogs_df.loc[scored, "dateUTC"].dt.tz_localize(None).dt.normalize()
+            week_starts = dates - pd.to_timedelta(dates.dt.weekday, unit="D")
+
+            weeks = [
+                {
+                    "weekStart": week_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "games": len(week_errors_df),
+                    "stats": self._summarize_errors(week_errors_df),
+                }
+                for week_start, week_errors_df in errors_df.groupby(week_starts, sort=True)
+            ]
+
+        return {
+            "modelVersion": self.model_version,
+            "startDate": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "endDate": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "games": int(scored.sum()),
+            "skippedGames": int((in_range & ~has_features).sum()),
+            "stats": self._summarize_errors(errors_df),
+            "weeks": weeks,
+        }
+
+    def _summarize_errors(self, errors_df: pd.DataFrame) -> dict:
+        """
+        Summarizes projection errors, i.e. projected minus actual stats.
+
+        :param errors_df pd.DataFrame: The errors, one row per game and one column per stat.
+        :return: The mean absolute error, root mean squared error and mean error of every stat.
+        :rtype: dict
+        """
+
+        if len(errors_df) == 0:
+            return {}
+
+        errors: np.ndarray = errors_df.to_numpy()
+        mean_absolute_errors = np.abs(errors).mean(axis=0)
+        root_mean_squared_errors = np.sqrt(np.square(errors).mean(axis=0))
+        biases = errors.mean(axis=0)
+        return {
+            stat: {
+                "mae": round(float(mean_absolute_errors[index]), 4),
+                "rmse": round(float(root_mean_squared_errors[index]), 4),
+                "bias": round(float(biases[index]), 4),
+            }
+            for index, stat in enumerate(errors_df.columns)
+        }
@@ -0,0 +1,139 @@
+import numpy as np
+from src.domain.value_objects import PlayerWeeklyProjectionTotals, PlayerWeeklyScore, ScoringConfig
+from src.interfaces.projections_model import IWeeklyScoringService
+
+# The projected stats, in the column order of the totals matrix
+SCORED_STATS: tuple[str, ...] = (
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "threesMade",
+    "points",
+    "steals",
+    "blocks",
+    "assists",
+    "rebounds",
+    "turnovers",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+)
+# Maps percentage categories to their (made, attempted) stats
+PERCENTAGE_CATEGORIES: dict[str, tuple[str, str]] = {
+    "fieldGoalPercentage": ("fieldGoalsMade", "fieldGoalsAttempted"),
+    "freeThrowPercentage": ("freeThrowsMade", "freeThrowsAttempted"),
+}
+NEGATIVE_CATEGORIES: frozenset[str] = frozenset({"turnovers"})  # Categories won by the lower total
+
+
+class WeeklyScoringService(IWeeklyScoringService):
+    """
+    Scores the players' projected weeks under a league's scoring, as matrix operations over every player at once.
+    """
+
+    def execute(
+        self, players_totals: list[PlayerWeeklyProjectionTotals], scoring_config: ScoringConfig
+    ) -> list[PlayerWeeklyScore]:
+        """
+        Scores the players' projected weeks, either as fantasy points or as head-to-head categories.
+
+        Points leagues score the weighted sum of the totals. Category leagues score the sum of the category
+        z-scores, where percentages are weighted by volume, i.e. made shots above the league rate, and
+        turnovers count against the player.
+
+        :param players_totals list[PlayerWeeklyProjectionTotals]: The players' projected totals of the week.
+        :param scoring_config ScoringConfig: The league's scoring.
+        :return: The players' scores, ranked from best to worst.
+        :rtype: list[PlayerWeeklyScore]
+        :raises ValueError: If the scoring uses an unknown stat or category.
+        """
+
+        if not players_totals:
+            return []
+
+        totals = np.array(
+            [[getattr(player_totals, stat) for stat in SCORED_STATS] for player_totals in players_totals],
+            dtype=np.float64,
+        )
+        if scoring_config.pointsWeights is not None:
+            columns, shown_totals, values, scores = self._score_points(totals, scoring_config.pointsWeights)
+        else:
+            columns, shown_totals, values, scores = self._score_categories(totals, scoring_config.categories)
+        z_scores = self._z_scores(values)
+        if scoring_config.categories is not None:
+            z_scores[:, [column in NEGATIVE_CATEGORIES for column in columns]] *= -1
+            scores = z_scores.sum(axis=1)
+
+        order = np.argsort(-scores, kind="stable")
+        return [
+            PlayerWeeklyScore(
+                playerId=players_totals[index].playerId,
+                firstName=players_totals[index].firstName,
+                lastName=players_totals[index].lastName,
+                teamAbbreviation=players_totals[index].teamAbbreviation,
+                fantasyPositions=players_totals[index].fantasyPositions,
+                games=players_totals[index].games,
+                totals=dict(zip(columns, np.round(shown_totals[index], 3).tolist())),
+                zScores=dict(zip(columns, np.round(z_scores[index], 3).tolist())),
+                score=round(float(scores[index]), 3),
+                rank=rank,
+            )
+            for rank, index in enumerate(order, start=1)
+        ]
+
+    def _score_points(self, totals: np.ndarray, points_weights: dict[str, float]) -> tuple:
+        """
+        Scores a points league, where each unit of a stat is worth a fixed number of fantasy points.
+
+        :param totals np.ndarray: The players' totals, one row per player and column per stat.
+        :param points_weights dict[str, float]: The fantasy points of each stat.
+        :return: The score's columns, the totals and values to z-score in those columns, and the scores.
+        :rtype: tuple
+        """
+
+        unknown_stats = set(points_weights) - set(SCORED_STATS)
+        if unknown_stats:
+            raise ValueError(f"Unknown stats {sorted(unknown_stats)}, expected any of {list(SCORED_STATS)}")
+
+        weights = np.array([points_weights.get(stat, 0.0) for stat in SCORED_STATS])
+        fantasy_points = totals @ weights
+        scored_columns = [index for index, stat in enumerate(SCORED_STATS) if stat in points_weights]
+        columns = [SCORED_STATS[index] for index in scored_columns] + ["fantasyPoints"]
+        shown_totals = np.column_stack([totals[:, scored_columns], fantasy_points])
+        return columns, shown_totals, shown_totals, fantasy_points
+
+    def _score_categories(self, totals: np.ndarray, categories: list[str]) -> tuple:
+        """
+        Scores a category league, where each category is compared to the other players'.
+
+        :param totals np.ndarray: The players' totals, one row per player and column per stat.
+        :param categories list[str]: The league's categories.
+        :return: The score's columns, the totals and values to z-score in those columns, and no scores yet.
+        :rtype: tuple
+        """
+
+        unknown_categories = set(categories) - set(SCORED_STATS) - set(PERCENTAGE_CATEGORIES)
+        if unknown_categories:
+            raise ValueError(
+                f"Unknown categories {sorted(unknown_categories)}, "
+                + f"expected any of {list(SCORED_STATS) + list(PERCENTAGE_CATEGORIES)}"
+            )
+
+        columns = list(dict.fromkeys(categories))
+        shown_totals = np.empty((len(totals), len(columns)))
+        values = np.empty((len(totals), len(columns)))
+        for column_index, category in enumerate(columns):
+            if category in PERCENTAGE_CATEGORIES:
+                made_stat, attempted_stat = PERCENTAGE_CATEGORIES[category]
+                made = totals[:, SCORED_STATS.index(made_stat)]
+                attempted = totals[:, SCORED_STATS.index(attempted_stat)]
+                league_rate = made.sum() / attempted.sum() if attempted.sum() > 0 else 0.0
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    shown_totals[:, column_index] = np.where(attempted > 0, made / attempted, 0.0)
+                values[:, column_index] = made - league_rate * attempted  # Impact on the team's percentage
+            else:
+                shown_totals[:, column_index] = values[:, column_index] = totals[:, SCORED_STATS.index(category)]
+        return columns, shown_totals, values, None
+
+    def _z_scores(self, values: np.ndarray) -> np.ndarray:
+        standard_deviations = values.std(axis=0)
+        standard_deviations[standard_deviations == 0] = 1  # A column with no spread scores 0 for everyone
+        return (values - values.mean(axis=0)) / standard_deviations
@@ -0,0 +1 @@
+from src.infra.shared_cache.mapped_file_cache import MappedFileCache, shared_cache_enabled
@@ -0,0 +1,159 @@
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+import numpy as np
+import orjson
+from src.interfaces.caching import ISharedCache, SharedSnapshot
+from src.infra.environment import env_flag
+from src.infra.files import atomic_write_bytes
+
+ARRAY_ALIGNMENT = 64  # Arrays start on cache line boundaries, which also satisfies every dtype's alignment
+HEADER_LENGTH = struct.Struct("<Q")
+
+
+class MappedFileCache(ISharedCache):
+    """
+    A cache shared by the processes of a host through memory-mapped files, so that data every worker uses,
+    i.e. the splits index, is held once in the page cache instead of once per worker.
+
+    Each version of an entry is a file holding a JSON header and the raw bytes of its arrays, written once and
+    never modified. Publishing writes the new version's file, then swaps the entry's name.current pointer to it
+    with an atomic rename, so readers see either the previous or the new version and never a partial one. The
+    previous version is kept for readers still mapping it, older ones are removed, which leaves the mappings of
+    readers still holding them intact.
+
+    Readers check the pointer with a stat per lookup, map a new version once, and get its arrays as read-only
+    views of the mapping, without copying or deserializing them.
+
+    :param directory str: The directory of the cache files, SHARED_CACHE_DIRECTORY by default, or a directory
+        in /dev/shm, which is memory-backed, or in the temporary directory if there is no /dev/shm.
+    """
+
+    def __init__(self, directory: str = None):
+        self._directory = Path(directory or os.getenv("SHARED_CACHE_DIRECTORY") or _default_directory())
+        self._mapped: dict[str, tuple[tuple, SharedSnapshot]] = {}  # Maps names to (pointer stat, snapshot)
+        self._lock = threading.Lock()
+
+    def publish(self, name: str, arrays: dict[str, np.ndarray], metadata: dict) -> int:
+        """
+        Publishes a new version of an entry.
+
+        :param name str: The name of the entry, i.e. splits.
+        :param arrays dict[str, np.ndarray]: The arrays of the entry, by name.
+        :param metadata dict: The JSON serializable details of the entry, i.e. when it was built.
+        :return: The version published.
+        :rtype: int
+        """
+
+        version = time.time_ns()
+        arrays = {array_name: np.ascontiguousarray(array) for array_name, array in arrays.items()}
+        layout: dict[str, dict] = {}
+        offset = 0
+        for array_name, array in arrays.items():
+            layout[array_name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset = _align(offset + array.nbytes)
+        header = orjson.dumps({"version": version, "metadata": metadata, "arrays": layout})
+        data_start = _align(HEADER_LENGTH.size + len(header))
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        previous_version = self._read_pointer(name)
+        temporary_path = self._directory / f".{name}.{uuid.uuid4().hex}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER_LENGTH.pack(len(header)) + header)
+            for array_name, array in arrays.items():
+                file.seek(data_start + layout[array_name]["offset"])
+                file.write(array.tobytes())
+            file.truncate(data_start + offset)
+        temporary_path.replace(self._path(name, version))
+
+        atomic_write_bytes(self._pointer_path(name), str(version).encode())
+
+        kept_versions = {version, previous_version}
+        for path in self._directory.glob(f"{name}.*.bin"):
+            if int(path.name.split(".")[-2]) not in kept_versions:
+                path.unlink(missing_ok=True)
+        return version
+
+    def get(self, name: str) -> Optional[SharedSnapshot]:
+        """
+        Gets the latest version of an entry, mapping it if it is new to the process.
+
+        :param name str: The name of the entry.
+        :return: The entry, or None if it was never published.
+        :rtype: Optional[SharedSnapshot]
+        """
+
+        try:
+            pointer_stat = self._pointer_path(name).stat()
+        except FileNotFoundError:
+            return None
+        pointer_key = (pointer_stat.st_ino, pointer_stat.st_mtime_ns)
+        with self._lock:
+            mapped = self._mapped.get(name)
+            if mapped is not None and mapped[0] == pointer_key:
+                return mapped[1]
+
+            version = self._read_pointer(name)
+            try:
+                snapshot = _map(self._path(name, version))
+            except FileNotFoundError:  # Removed by two publishes since the pointer was read
+                return mapped[1] if mapped is not None else None
+            # The previous version stays mapped until its arrays are no longer referenced
+            self._mapped[name] = (pointer_key, snapshot)
+            return snapshot
+
+    def _read_pointer(self, name: str) -> Optional[int]:
+        try:
+            return int(self._pointer_path(name).read_text())
+        except FileNotFoundError:
+            return None
+
+    def _path(self, name: str, version: int) -> Path:
+        return self._directory / f"{name}.{version}.bin"
+
+    def _pointer_path(self, name: str) -> Path:
+        return self._directory / f"{name}.current"
+
+
+def _map(path: Path) -> SharedSnapshot:
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    (header_length,) = HEADER_LENGTH.unpack_from(mapping, 0)
+    header: dict = orjson.loads(mapping[HEADER_LENGTH.size : HEADER_LENGTH.size + header_length])
+    data_start = _align(HEADER_LENGTH.size + header_length)
+    arrays: dict[str, np.ndarray] = {}
+    for array_name, array_layout in header["arrays"].items():
+        shape = tuple(array_layout["shape"])
+        array = np.frombuffer(
+            mapping,
+            dtype=np.dtype(array_layout["dtype"]),
+            count=math.prod(shape),
+            offset=data_start + array_layout["offset"],
+        )
+        arrays[array_name] = array.reshape(shape)
+    return SharedSnapshot(header["version"], header["metadata"], arrays)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+def _default_directory() -> str:
+    parent = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(parent, "nba-players-api")
+
+
+def shared_cache_enabled() -> bool:
+    """
+    Whether the workers share their caches through memory-mapped files, set by the SHARED_CACHE_ENABLED
+    environment variable.
+    """
+
+    return env_flag("SHARED_CACHE_ENABLED")
@@ -0,0 +1 @@
+from src.infra.snapshots.snapshot_store import SnapshotStore, ENCODING_SUFFIXES
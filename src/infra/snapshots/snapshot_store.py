@@ -0,0 +1,120 @@
+import fcntl
+import gzip
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+import brotli
+import orjson
+from src.infra.files import atomic_write_bytes
+
+# The content encodings every snapshot is published in, in order of preference, and their file suffixes
+ENCODING_SUFFIXES: dict[str, str] = {"br": ".br", "gzip": ".gz", "identity": ""}
+
+
+class SnapshotStore:
+    """
+    Publishes pre-serialized snapshots of read endpoints to a directory, as is and pre-compressed with brotli and
+    gzip, so they can be served as files by the API or by a static file server or CDN pointed at the directory.
+
+    Every version of a snapshot is written once under its content hash, i.e. players.<hash>.json.br, and never
+    modified, so a file being served can't change under the response. The latest version is also copied to
+    players.json, players.json.br and players.json.gz for static file servers, and players.meta.json, written
+    last, tells which version is the latest along with its ETag. The previous version is kept for the responses
+    still reading it, older ones are removed. Publishing a snapshot holds a lock on its players.lock file, so
+    that workers publishing at the same time don't remove the version the other's players.meta.json points to.
+
+    :param directory str: The directory the snapshots are written to, SNAPSHOTS_DIRECTORY or ./snapshots by default.
+    """
+
+    def __init__(self, directory: str = None):
+        self._directory = Path(directory or os.getenv("SNAPSHOTS_DIRECTORY", "snapshots"))
+
+    def publish(self, name: str, content: bytes) -> dict:
+        """
+        Publishes a new version of a snapshot.
+
+        :param name str: The name of the snapshot, i.e. players.
+        :param content bytes: The serialized response body.
+        :return: The metadata of the snapshot: its content hash, ETag, publication time and size per encoding.
+        :rtype: dict
+        """
+
+        content_hash = hashlib.sha256(content).hexdigest()[:32]
+        variants = self._compress(content)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with self._lock(name):
+            previous_metadata: Optional[dict] = self.get(name)
+
+            sizes: dict[str, int] = {}
+            for encoding, variant in variants.items():
+                sizes[encoding] = len(variant)
+                if not self.path(name, encoding, content_hash).exists():
+                    atomic_write_bytes(self.path(name, encoding, content_hash), variant)
+                atomic_write_bytes(self.path(name, encoding), variant)
+
+            metadata = {
+                "name": name,
+                "hash": content_hash,
+                "etag": f'"{content_hash}"',
+                "publishedAt": time.time(),
+                "sizes": sizes,
+            }
+            atomic_write_bytes(self._metadata_path(name), orjson.dumps(metadata))
+
+            kept_hashes = {content_hash, previous_metadata["hash"] if previous_metadata else None}
+            for path in self._directory.glob(f"{name}.*.json*"):
+                if path != self._metadata_path(name) and path.name.split(".")[1] not in kept_hashes:
+                    path.unlink(missing_ok=True)
+            return metadata
+
+    def get(self, name: str) -> Optional[dict]:
+        """
+        Gets the metadata of the latest version of a snapshot.
+
+        :param name str: The name of the snapshot.
+        :return: The metadata, or None if the snapshot was never published.
+        :rtype: Optional[dict]
+        """
+
+        try:
+            return orjson.loads(self._metadata_path(name).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def path(self, name: str, encoding: str = "identity", content_hash: str = None) -> Path:
+        """
+        Gets the path of a snapshot's file.
+
+        :param name str: The name of the snapshot.
+        :param encoding str: The content encoding of the file, one of ENCODING_SUFFIXES.
+        :param content_hash str: The version of the snapshot, or None for the copy of the latest version.
+        :return: The path of the file.
+        :rtype: Path
+        """
+
+        version = f".{content_hash}" if content_hash else ""
+        return self._directory / f"{name}{version}.json{ENCODING_SUFFIXES[encoding]}"
+
+    @staticmethod
+    def _compress(content: bytes) -> dict[str, bytes]:
+        return {
+            # Quality 11 compresses a few percent smaller at many times the CPU, SNAPSHOTS_BROTLI_QUALITY opts into it
+            "br": brotli.compress(content, quality=int(os.getenv("SNAPSHOTS_BROTLI_QUALITY", "7"))),
+            "gzip": gzip.compress(content, compresslevel=9, mtime=0),
+            "identity": content,
+        }
+
+    @contextmanager
+    def _lock(self, name: str) -> Iterator[None]:
+        with open(self._directory / f"{name}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _metadata_path(self, name: str) -> Path:
+        return self._directory / f"{name}.meta.json"
@@ -0,0 +1 @@
+from src.interfaces.caching.shared_cache_interface import ISharedCache, SharedSnapshot
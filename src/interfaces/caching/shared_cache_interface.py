@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SharedSnapshot(NamedTuple):
+    """
+    A published version of a shared cache entry, whose arrays are read-only views of the shared memory.
+    """
+
+    version: int
+    metadata: dict
+    arrays: dict[str, "np.ndarray"]
+
+
+class ISharedCache(ABC):
+    """
+    Interface for a cache shared by the processes of a host, i.e. the workers of the API.
+    """
+
+    @abstractmethod
+    def publish(self, name: str, arrays: dict[str, "np.ndarray"], metadata: dict) -> int:
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[SharedSnapshot]:
+        pass
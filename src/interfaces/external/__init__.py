@@ -1,4 +1,5 @@
 from src.interfaces.external.gamelogs_fetcher_service_interface import IGamelogsFetcher
 from src.interfaces.external.players_fetcher_service_interface import IPlayersFetcher
 from src.interfaces.external.scheduled_matchups_fetcher_service_interface import IScheduledMatchupsFetcherService
-from src.interfaces.external.teams_fetcher_service_interface import ITeamsFetcherService
\ No newline at end of file
+from src.interfaces.external.teams_fetcher_service_interface import ITeamsFetcherService
+from src.interfaces.external.live_boxscores_fetcher_interface import ILiveBoxscoresFetcher
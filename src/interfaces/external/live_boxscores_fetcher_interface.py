@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from src.domain.value_objects import LivePlayerStats
+
+
+class ILiveBoxscoresFetcher(ABC):
+    """
+    Polls the live boxscores of in-progress games.
+    """
+
+    @abstractmethod
+    def get_changed_player_stats(self, game_id: str) -> list[LivePlayerStats]:
+        """
+        Gets the stats of the players whose line changed since the game was last polled.
+
+        :param game_id str: The id of the game to poll.
+        :return: The current stats of the players whose line changed.
+        :rtype: list[LivePlayerStats]
+        """
+
+        pass
+
+    @abstractmethod
+    def forget_game(self, game_id: str) -> None:
+        """
+        Drops what is remembered about a game, i.e. once it is final.
+
+        :param game_id str: The id of the game.
+        """
+
+        pass
@@ -1,3 +1,5 @@
 from src.interfaces.projections_model.player_weekly_projections_forecaster_service_interface import (
     IPlayerWeeklyProjectionsForecasterService,
 )
+from src.interfaces.projections_model.projections_backtester_interface import IProjectionsBacktester
+from src.interfaces.projections_model.weekly_scoring_service_interface import IWeeklyScoringService
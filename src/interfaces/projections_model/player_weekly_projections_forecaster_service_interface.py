@@ -15,3 +15,26 @@ class IPlayerWeeklyProjectionsForecasterService(ABC):
         players: list[PlayerEntity],
     ) -> list[ProjectionEntity]:
         pass
+
+    @abstractmethod
+    def execute_incremental(
+        self,
+        gamelogs: list[GamelogEntity],
+        scheduled_matchups: list[ScheduledMatchupEntity],
+        players: list[PlayerEntity],
+    ) -> tuple[list[ProjectionEntity], dict[str, str]]:
+        """
+        Forecasts only the players whose projections' inputs, i.e. gamelogs, injury status, depth chart,
+        matchups or opponents' defensive ratings, changed since the last committed incremental run.
+
+        :return: The projections of the players whose inputs changed, and the input signatures of every player,
+            to commit once the projections are saved.
+        """
+        pass
+
+    @abstractmethod
+    def commit_input_signatures(self, input_signatures: dict[str, str]) -> None:
+        """
+        Records the input signatures of an incremental run whose projections were saved.
+        """
+        pass
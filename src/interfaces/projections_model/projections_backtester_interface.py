@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from src.domain.entities import GamelogEntity
+
+
+class IProjectionsBacktester(ABC):
+    """
+    Interface for projections backtester
+    """
+
+    @abstractmethod
+    def execute(self, gamelogs: list[GamelogEntity], start_date: datetime, end_date: datetime) -> dict:
+        pass
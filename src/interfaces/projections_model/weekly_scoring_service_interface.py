@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from src.domain.value_objects import PlayerWeeklyProjectionTotals, PlayerWeeklyScore, ScoringConfig
+
+
+class IWeeklyScoringService(ABC):
+    """
+    Interface for weekly scoring service
+    """
+
+    @abstractmethod
+    def execute(
+        self, players_totals: list[PlayerWeeklyProjectionTotals], scoring_config: ScoringConfig
+    ) -> list[PlayerWeeklyScore]:
+        pass
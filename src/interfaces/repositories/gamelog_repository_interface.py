@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Iterator, Optional
 from src.domain.entities.gamelog_entity import GamelogEntity
+from src.domain.value_objects import GamelogsBatchQuery
 
 
 class IGamelogRepository(ABC):
@@ -13,7 +15,9 @@ class IGamelogRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all_between_dates(self, start_date: datetime, end_date: datetime) -> list[GamelogEntity]:
+    def get_all_between_dates(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = 7500
+    ) -> list[GamelogEntity]:
         pass
 
     @abstractmethod
@@ -23,3 +27,7 @@ class IGamelogRepository(ABC):
     @abstractmethod
     def get_all_by_player_id_and_season(self, player_id: str, season: int) -> list[GamelogEntity]:
         pass
+
+    @abstractmethod
+    def get_batch(self, gamelogs_query: GamelogsBatchQuery) -> Iterator[tuple[str, list[dict]]]:
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from src.domain.entities import PlayerEntity, ProjectionEntity
+from src.domain.value_objects import PlayerQuery, PlayerWeeklyProjectionTotals
 
 
 class IPlayerRepository(ABC):
@@ -11,10 +12,26 @@ class IPlayerRepository(ABC):
     def upsert_many_projections(self, projections: list[ProjectionEntity]) -> None:
         pass
 
+    @abstractmethod
+    def update_live_projections(self, projections: list[ProjectionEntity]) -> None:
+        pass
+
     @abstractmethod
     def get_all(self) -> list[PlayerEntity]:
         pass
 
+    @abstractmethod
+    def query(self, player_query: PlayerQuery) -> list[PlayerEntity]:
+        pass
+
+    @abstractmethod
+    def get_current_week_projection_totals(self) -> list[PlayerWeeklyProjectionTotals]:
+        pass
+
+    @abstractmethod
+    def get_projections_version(self) -> str:
+        pass
+
     @abstractmethod
     def upsert_many(self, player: list[PlayerEntity]) -> None:
         pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.domain.entities import ProjectionEntity
 
 
@@ -9,4 +10,10 @@ class IProjectionRepository(ABC):
 
     @abstractmethod
     def upsert_many(self, projections: list[ProjectionEntity]) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_between_dates(
+        self, start_date: datetime, end_date: datetime, player_id: str = None
+    ) -> list[ProjectionEntity]:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from src.domain.entities import ScheduledMatchupEntity
+from src.domain.value_objects import ScheduleDiff
 
 class IScheduledMatchupRepository(ABC):
     """
@@ -14,6 +15,17 @@ class IScheduledMatchupRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def sync_many(self, scheduled_matchups: list[ScheduledMatchupEntity]) -> ScheduleDiff:
+        """
+        Makes the stored schedule match the given one, writing only the games that were added, changed or removed.
+
+        :param scheduled_matchups list[ScheduledMatchupEntity]: Every scheduled matchup of the season.
+        :return: The games that were inserted, updated and removed, and the teams they involve.
+        :rtype: ScheduleDiff
+        """
+        pass
+
     @abstractmethod 
     def get_scheduled_matchups(self) -> list[ScheduledMatchupEntity]:
         """
@@ -0,0 +1,71 @@
+from src.domain.value_objects import CacheInvalidation, PLAYERS_DATA, GAMELOGS_DATA, SCHEDULED_MATCHUPS_DATA
+from src.app.caching import InvalidationBus, invalidation_bus
+from src.infra.environment import env_flag
+from src.presentation import dependencies
+from src.presentation.snapshots import snapshot_publisher, PLAYERS_SNAPSHOT, SCHEDULES_SNAPSHOT
+
+
+def invalidate_caches(invalidation: CacheInvalidation) -> None:
+    """
+    Invalidates the process's caches derived from changed data. The player gamelogs are invalidated by player,
+    the indexes and snapshots built from a whole collection are expired and rebuilt on their next read.
+
+    :param invalidation CacheInvalidation: The data that changed.
+    """
+
+    if GAMELOGS_DATA in invalidation.changedData:
+        gamelogs_cache = dependencies.get_player_gamelogs_cache()
+        if invalidation.is_whole(GAMELOGS_DATA):
+            gamelogs_cache.clear()
+        else:
+            # Keyed by (playerId, season)
+            gamelogs_cache.delete_matching(lambda key: key[0] in invalidation.playerIds)
+        dependencies.get_splits_index().expire()
+    if PLAYERS_DATA in invalidation.changedData:
+        dependencies.get_weekly_scores_cache().clear()
+        snapshot_publisher.expire(PLAYERS_SNAPSHOT)
+    if SCHEDULED_MATCHUPS_DATA in invalidation.changedData:
+        dependencies.get_schedule_index().expire()
+        snapshot_publisher.expire(SCHEDULES_SNAPSHOT)
+
+
+class CacheInvalidationWorker:
+    """
+    Watches the database's change streams and invalidates the process's caches derived from the changed data,
+    so that changes written by another instance or worker are seen without waiting for the caches to expire.
+
+    Every worker process runs its own watcher, since its caches are its own.
+
+    :param invalidation_bus InvalidationBus: Where the watcher publishes the changes and the caches subscribe.
+    """
+
+    def __init__(self, invalidation_bus: InvalidationBus):
+        self._invalidation_bus = invalidation_bus
+        self._watcher = None
+
+    def start(self) -> None:
+        if self._watcher is None:
+            # Imported here so that instances without change streams don't load the watcher
+            from src.infra.persistence.change_stream_watcher import ChangeStreamWatcher
+
+            self._invalidation_bus.subscribe(invalidate_caches)
+            self._watcher = ChangeStreamWatcher(self._invalidation_bus)
+            self._watcher.start()
+
+    def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._invalidation_bus.unsubscribe(invalidate_caches)
+            self._watcher = None
+
+
+def change_streams_enabled() -> bool:
+    """
+    Whether the caches are invalidated from the database's change streams, set by the CHANGE_STREAMS_ENABLED
+    environment variable. Change streams need MongoDB to run as a replica set.
+    """
+
+    return env_flag("CHANGE_STREAMS_ENABLED")
+
+
+cache_invalidation_worker = CacheInvalidationWorker(invalidation_bus)
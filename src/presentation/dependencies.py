@@ -0,0 +1,174 @@
+"""
+Providers of the repositories, fetchers and services the routes depend on.
+
+Each component is built on first use through FastAPI's Depends and reused afterwards, so a worker only
+connects to MongoDB and imports heavy libraries, i.e. pandas or nba_api, once a route needs them.
+Tests and benchmarks can replace any of them with app.dependency_overrides.
+"""
+
+import os
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
+from src.interfaces.repositories import (
+    IPlayerRepository,
+    ITeamRepository,
+    IGamelogRepository,
+    IScheduledMatchupRepository,
+    IProjectionRepository,
+)
+from src.interfaces.external import (
+    IPlayersFetcher,
+    IGamelogsFetcher,
+    IScheduledMatchupsFetcherService,
+    ITeamsFetcherService,
+    ILiveBoxscoresFetcher,
+)
+from src.interfaces.projections_model import (
+    IPlayerWeeklyProjectionsForecasterService,
+    IProjectionsBacktester,
+    IWeeklyScoringService,
+)
+from src.interfaces.caching import ISharedCache
+from src.app.caching import BoundedCache, ScheduleIndex
+
+if TYPE_CHECKING:
+    from src.app.caching.splits_index import SplitsIndex
+
+
+@lru_cache(maxsize=None)
+def get_player_repository() -> IPlayerRepository:
+    from src.infra.persistence.repositories import PlayerRepository
+
+    return PlayerRepository()
+
+
+@lru_cache(maxsize=None)
+def get_team_repository() -> ITeamRepository:
+    from src.infra.persistence.repositories import TeamRepository
+
+    return TeamRepository()
+
+
+@lru_cache(maxsize=None)
+def get_gamelog_repository() -> IGamelogRepository:
+    from src.infra.persistence.gamelog_storage import create_gamelog_repository
+
+    return create_gamelog_repository()
+
+
+@lru_cache(maxsize=None)
+def get_scheduled_matchup_repository() -> IScheduledMatchupRepository:
+    from src.infra.persistence.repositories import ScheduledMatchupRepository
+
+    return ScheduledMatchupRepository()
+
+
+@lru_cache(maxsize=None)
+def get_projection_repository() -> IProjectionRepository:
+    from src.infra.persistence.repositories import ProjectionRepository
+
+    return ProjectionRepository()
+
+
+@lru_cache(maxsize=None)
+def get_players_fetcher() -> IPlayersFetcher:
+    from src.infra.external.players_fetcher import PlayersFetcher
+
+    return PlayersFetcher()
+
+
+@lru_cache(maxsize=None)
+def get_gamelogs_fetcher() -> IGamelogsFetcher:
+    from src.infra.external.gamelogs_fetcher import GamelogsFetcher
+
+    return GamelogsFetcher()
+
+
+@lru_cache(maxsize=None)
+def get_scheduled_matchups_fetcher() -> IScheduledMatchupsFetcherService:
+    from src.infra.external.scheduled_matchups_fetcher_service import ScheduledMatchupsFetcherService
+
+    return ScheduledMatchupsFetcherService()
+
+
+@lru_cache(maxsize=None)
+def get_teams_fetcher() -> ITeamsFetcherService:
+    from src.infra.external.teams_fetcher import TeamsFetcher
+
+    return TeamsFetcher()
+
+
+@lru_cache(maxsize=None)
+def get_live_boxscores_fetcher() -> ILiveBoxscoresFetcher:
+    from src.infra.external.live_boxscores_fetcher import LiveBoxscoresFetcher
+
+    return LiveBoxscoresFetcher()
+
+
+@lru_cache(maxsize=None)
+def get_player_weekly_projections_forecaster_service() -> IPlayerWeeklyProjectionsForecasterService:
+    from src.infra.projections_model.player_weekly_projections_forecaster_service import (
+        PlayerWeeklyProjectionsForecasterService,
+    )
+
+    return PlayerWeeklyProjectionsForecasterService()
+
+
+@lru_cache(maxsize=None)
+def get_projections_backtester() -> IProjectionsBacktester:
+    from src.infra.projections_model.projections_backtester import ProjectionsBacktester
+
+    return ProjectionsBacktester()
+
+
+@lru_cache(maxsize=None)
+def get_weekly_scoring_service() -> IWeeklyScoringService:
+    from src.infra.projections_model.weekly_scoring_service import WeeklyScoringService
+
+    return WeeklyScoringService()
+
+
+@lru_cache(maxsize=None)
+def get_weekly_scores_cache() -> BoundedCache:
+    return BoundedCache(max_entries=64)
+
+
+@lru_cache(maxsize=None)
+def get_player_gamelogs_cache() -> BoundedCache:
+    from src.presentation.cache_invalidation import change_streams_enabled
+
+    # Bounded by size rather than count, and expired so workers that didn't run the ingest see its games, which
+    # the change streams tell them about when enabled, so the gamelogs are then only expired as a safety net
+    default_max_age_seconds = "86400" if change_streams_enabled() else "900"
+    return BoundedCache(
+        max_entries=100_000,
+        max_bytes=int(os.getenv("GAMELOGS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        max_age_seconds=float(os.getenv("GAMELOGS_CACHE_MAX_AGE_SECONDS", default_max_age_seconds)),
+        name="player_gamelogs",
+    )
+
+
+@lru_cache(maxsize=None)
+def get_schedule_index() -> ScheduleIndex:
+    return ScheduleIndex(lambda: get_scheduled_matchup_repository().get_scheduled_matchups())
+
+
+@lru_cache(maxsize=None)
+def get_splits_index() -> "SplitsIndex":
+    # Imported here so that only the workers serving splits load numpy
+    from src.app.caching.splits_index import SplitsIndex
+
+    return SplitsIndex(
+        lambda: get_gamelog_repository().get_all_between_dates(
+            datetime.utcnow() - timedelta(days=365), datetime.utcnow(), limit=None
+        ),
+        shared_cache=get_shared_cache(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_cache() -> Optional[ISharedCache]:
+    from src.infra.shared_cache import MappedFileCache, shared_cache_enabled
+
+    return MappedFileCache() if shared_cache_enabled() else None
@@ -0,0 +1,102 @@
+import hmac
+import os
+import uuid
+from datetime import datetime
+from fastapi import Request
+from src.infra.profiling import SamplingProfiler, ProfileStore
+from src.infra.environment import is_truthy
+
+
+class JobProfile:
+    """
+    Wraps a job in a sampling profiler when profiling was requested, and does nothing otherwise.
+
+    Usage:
+        with job_profile:
+            use_case.execute()
+        return Response(status_code=200, headers=job_profile.headers)
+
+    :param job_name str: The name of the profiled job.
+    :param enabled bool: Whether the job should be profiled.
+    :param profile_store ProfileStore: Where the captured profile is saved.
+    :param top_functions int: The number of hot functions listed in the profile summary.
+    """
+
+    def __init__(self, job_name: str, enabled: bool, profile_store: ProfileStore = None, top_functions: int = 25):
+        self.job_name = job_name
+        self.enabled = enabled
+        self.job_id: str = uuid.uuid4().hex if enabled else None
+        self._profile_store = profile_store or ProfileStore()
+        self._top_functions = top_functions
+        self._profiler: SamplingProfiler = None
+        self._started_at: datetime = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        The response headers telling the caller where to retrieve the profile.
+        """
+
+        if not self.enabled:
+            return {}
+        return {"X-Profile-Id": self.job_id, "X-Profile-Url": f"/api/v1/profiles/{self.job_id}"}
+
+    def __enter__(self):
+        if self.enabled:
+            self._started_at = datetime.utcnow()
+            self._profiler = SamplingProfiler(interval=float(os.getenv("PROFILING_INTERVAL_SECONDS", "0.005")))
+            self._profiler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self.enabled:
+            return False
+
+        self._profiler.stop()
+        summary = {
+            "jobId": self.job_id,
+            "jobName": self.job_name,
+            "startedAtUTC": self._started_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "durationSeconds": round(self._profiler.duration, 6),
+            "samplingIntervalSeconds": self._profiler.interval,
+            "samples": self._profiler.sample_count,
+            "succeeded": exc_type is None,
+            "topFunctions": self._profiler.top_functions(self._top_functions),
+        }
+        try:
+            self._profile_store.save(
+                self.job_id, summary, self._profiler.to_speedscope(f"{self.job_name} {self.job_id}")
+            )
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+        return False
+
+
+def profiling_requested(request: Request) -> bool:
+    """
+    Checks whether a request opted in to profiling with the X-Profile header or the profile query parameter.
+
+    If PROFILING_TOKEN is set, the request must also carry it in the X-Profile-Token header.
+    """
+
+    flag = request.headers.get("X-Profile") or request.query_params.get("profile") or ""
+    if not is_truthy(flag):
+        return False
+
+    token = os.getenv("PROFILING_TOKEN")
+    if token:
+        return hmac.compare_digest(request.headers.get("X-Profile-Token", ""), token)
+    return True
+
+
+def job_profile(job_name: str):
+    """
+    Creates a FastAPI dependency providing a JobProfile for the given job.
+
+    :param job_name str: The name of the job, i.e. weekly_projections_forecaster.
+    """
+
+    def _job_profile_dependency(request: Request) -> JobProfile:
+        return JobProfile(job_name, profiling_requested(request))
+
+    return _job_profile_dependency
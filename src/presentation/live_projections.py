@@ -0,0 +1,196 @@
+import asyncio
+import fcntl
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+import orjson
+from src.domain.entities import ProjectionEntity
+from src.app.use_cases.projections import LiveProjectionsUpdaterUseCase
+from src.infra.environment import env_flag
+from src.infra.files import atomic_write_bytes
+from src.presentation import dependencies
+from src.presentation.snapshots import snapshot_publisher, PLAYERS_SNAPSHOT
+
+SHARED_TICKS = 8  # The ticks of updates the polling worker shares with the other workers
+
+
+class LiveProjectionsBroadcaster:
+    """
+    Fans live projection updates out to the connected Server-Sent Events clients.
+
+    Every update is serialized once, however many clients are connected. A client that falls behind loses
+    its oldest updates rather than holding up the others or growing its queue without bound.
+
+    :param queue_size int: The number of updates buffered for each client.
+    """
+
+    def __init__(self, queue_size: int = 1024):
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Registers a client.
+
+        :return: The queue the client's updates are put on, as (playerId, Server-Sent Event) tuples.
+        :rtype: asyncio.Queue
+        """
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, projections: list[ProjectionEntity]) -> None:
+        """
+        Sends updated projections to every client.
+
+        :param projections list[ProjectionEntity]: The updated projections.
+        """
+
+        if not self._subscribers:
+            return
+
+        events = [
+            (projection.playerId, f"event: projection\ndata: {json.dumps(dict(projection))}\n\n")
+            for projection in projections
+        ]
+        for queue in self._subscribers:
+            for event in events:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(event)
+
+
+class LiveProjectionsWorker:
+    """
+    Polls the in-progress games on an interval and broadcasts the projections that changed.
+
+    Only one worker process of the host polls the boxscores and writes the projections, the one holding the lock
+    on live_projections.lock in the directory. It also appends every tick's updates to live_projections.json,
+    which the other workers read on the same interval to broadcast the updates to their own clients. If the
+    polling worker stops, the next worker to take the lock polls instead. Every worker expires its snapshot of
+    the players after a tick that updated projections, since the snapshot holds their current week projections.
+
+    :param broadcaster LiveProjectionsBroadcaster: Where the updated projections are published.
+    :param interval float: The seconds between two polls.
+    :param directory str: The directory of the lock and of the updates shared with the other workers,
+        LIVE_PROJECTIONS_DIRECTORY or ./cache by default.
+    """
+
+    def __init__(self, broadcaster: LiveProjectionsBroadcaster, interval: float = 15, directory: str = None):
+        self._broadcaster = broadcaster
+        self._interval = interval
+        self._directory = Path(directory or os.getenv("LIVE_PROJECTIONS_DIRECTORY", "cache"))
+        self._task: asyncio.Task = None
+        self._lock_file = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_file is not None:
+            self._lock_file.close()  # Releases the lock for the other workers
+            self._lock_file = None
+
+    async def _run(self) -> None:
+        live_projections_updater: LiveProjectionsUpdaterUseCase = None
+        last_sequence: Optional[int] = None
+        while True:
+            try:
+                if self._acquire_polling_lock():
+                    if live_projections_updater is None:
+                        live_projections_updater = LiveProjectionsUpdaterUseCase(
+                            dependencies.get_player_repository(),
+                            dependencies.get_scheduled_matchup_repository(),
+                            dependencies.get_projection_repository(),
+                            dependencies.get_live_boxscores_fetcher(),
+                        )
+                    # Polling and writing are blocking, so they run off the event loop
+                    updated_projections = await asyncio.to_thread(live_projections_updater.execute)
+                    if updated_projections:
+                        await asyncio.to_thread(self._share_updates, updated_projections)
+                        # The players' snapshot holds their current week projections, which the tick rewrote
+                        snapshot_publisher.expire(PLAYERS_SNAPSHOT)
+                    self._broadcaster.publish(updated_projections)
+                else:
+                    last_sequence = self._relay_shared_updates(last_sequence)
+            except Exception as e:
+                print(f"Error updating live projections: {e}")
+            await asyncio.sleep(self._interval)
+
+    def _acquire_polling_lock(self) -> bool:
+        """
+        Takes the lock of the polling worker unless another worker holds it, and keeps it until stopped.
+        """
+
+        if self._lock_file is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self._directory / "live_projections.lock", "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+        return True
+
+    def _share_updates(self, projections: list[ProjectionEntity]) -> None:
+        """
+        Appends a tick's updates to the shared updates, which keep the last SHARED_TICKS ticks so that a worker
+        reading them a little late doesn't miss one.
+        """
+
+        ticks = self._read_shared_updates()[-(SHARED_TICKS - 1) :]
+        ticks.append({"sequence": time.time_ns(), "projections": [dict(projection) for projection in projections]})
+        atomic_write_bytes(self._directory / "live_projections.json", orjson.dumps(ticks))
+
+    def _relay_shared_updates(self, last_sequence: Optional[int]) -> Optional[int]:
+        """
+        Broadcasts the updates the polling worker shared since the last relayed tick.
+
+        :param last_sequence int: The sequence of the last relayed tick, None before the first read, which only
+            skips the ticks already shared.
+        :return: The sequence of the last relayed tick.
+        :rtype: Optional[int]
+        """
+
+        ticks = self._read_shared_updates()
+        if last_sequence is not None:
+            for tick in ticks:
+                if tick["sequence"] > last_sequence:
+                    self._broadcaster.publish([ProjectionEntity(**projection) for projection in tick["projections"]])
+                    snapshot_publisher.expire(PLAYERS_SNAPSHOT)
+        return ticks[-1]["sequence"] if ticks else last_sequence
+
+    def _read_shared_updates(self) -> list[dict]:
+        try:
+            return orjson.loads((self._directory / "live_projections.json").read_bytes())
+        except FileNotFoundError:
+            return []
+
+
+def live_projections_enabled() -> bool:
+    """
+    Whether the live projections worker should run, set by the LIVE_PROJECTIONS_ENABLED environment variable.
+    """
+
+    return env_flag("LIVE_PROJECTIONS_ENABLED")
+
+
+live_projections_broadcaster = LiveProjectionsBroadcaster()
+live_projections_worker = LiveProjectionsWorker(
+    live_projections_broadcaster, interval=float(os.getenv("LIVE_PROJECTIONS_POLL_SECONDS", "15"))
+)
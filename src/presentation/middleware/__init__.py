@@ -0,0 +1 @@
+from src.presentation.middleware.request_timing_middleware import RequestTimingMiddleware
@@ -0,0 +1,43 @@
+import time
+from src.app.monitoring import metrics_registry
+
+http_request_duration_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests by route template.",
+    ("method", "route", "status_code"),
+)
+
+
+class RequestTimingMiddleware:
+    """
+    ASGI middleware recording the latency of every HTTP request by method, route template and status code.
+
+    The route template, i.e. /api/v1/players/{player_id}/gamelogs, is used instead of the raw path
+    so that the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_template = route.path if route is not None else "unmatched"
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start, scope["method"], route_template, str(status_code)
+            )
@@ -1,3 +1,5 @@
 from src.presentation.routes.players_router import players_router
 from src.presentation.routes.teams_router import teams_router
-from src.presentation.routes.scheduled_matchups_router import scheduled_matchups_router
\ No newline at end of file
+from src.presentation.routes.scheduled_matchups_router import scheduled_matchups_router
+from src.presentation.routes.metrics_router import metrics_router
+from src.presentation.routes.profiles_router import profiles_router
\ No newline at end of file
@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Response
+from src.app.monitoring import metrics_registry
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
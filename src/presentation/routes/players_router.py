@@ -1,41 +1,62 @@
 import asyncio
+import orjson
 from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import APIRouter, Query, Response, Path
-import pandas as pd
-import requests
-from src.domain.entities.team_entity import TeamEntity
-from src.infra.external.players_season_projections_fetcher import PlayersSeasonProjectionsFetcher
-from src.infra.persistence.repositories import (
-    PlayerRepository,
-    TeamRepository,
-    GamelogRepository,
-    ScheduledMatchupRepository,
+from typing import Optional, TYPE_CHECKING
+from fastapi import APIRouter, BackgroundTasks, Query, Request, Response, Path, Depends
+from fastapi.responses import StreamingResponse
+from src.interfaces.repositories import (
+    IPlayerRepository,
+    IGamelogRepository,
+    IScheduledMatchupRepository,
+    IProjectionRepository,
+)
+from src.interfaces.external import IPlayersFetcher, IGamelogsFetcher
+from src.domain.value_objects import PlayerQuery, ScoringConfig, GamelogsBatchQuery
+from src.app.caching import BoundedCache
+from src.interfaces.projections_model import (
+    IPlayerWeeklyProjectionsForecasterService,
+    IProjectionsBacktester,
+    IWeeklyScoringService,
+)
+from src.app.use_cases.players import PlayersUpserterUseCase, QueryPlayersUseCase
+from src.app.use_cases.projections import (
+    PlayerWeeklyProjectionsForecasterUseCase,
+    GetProjectionsUseCase,
+    BacktestProjectionsUseCase,
+    GetWeeklyScoresUseCase,
+)
+from src.app.use_cases.gamelogs import (
+    GamelogsUpserterUseCase,
+    GetPlayerGamelogsUseCase,
+    GetPlayersGamelogsUseCase,
+    GetPlayerSplitsUseCase,
+)
+from src.presentation.job_profiling import JobProfile, job_profile
+from src.presentation.live_projections import live_projections_broadcaster
+from src.presentation.snapshots import PLAYERS_SNAPSHOT, snapshot_publisher, snapshots_enabled
+from src.presentation.dependencies import (
+    get_player_repository,
+    get_gamelog_repository,
+    get_scheduled_matchup_repository,
+    get_projection_repository,
+    get_players_fetcher,
+    get_gamelogs_fetcher,
+    get_player_weekly_projections_forecaster_service,
+    get_projections_backtester,
+    get_weekly_scoring_service,
+    get_weekly_scores_cache,
+    get_splits_index,
+    get_player_gamelogs_cache,
 )
-from src.infra.external import PlayersFetcher, GamelogsFetcher
-from src.infra.projections_model import PlayerWeeklyProjectionsForecasterService
-from src.app.use_cases.players import PlayersUpserterUseCase
-from src.app.use_cases.projections import PlayerWeeklyProjectionsForecasterUseCase
-from src.app.use_cases.gamelogs import GamelogsUpserterUseCase
-from nba_api.stats.static import teams as teams_fetcher, players as nba_api_players_fetcher
-from src.infra.external.testing import Testing
 
-players_router = APIRouter()
+if TYPE_CHECKING:
+    from src.app.caching.splits_index import SplitsIndex
 
-# Dependencies for dependency injection
-player_repository = PlayerRepository()
-team_repository = TeamRepository()
-players_fetcher = PlayersFetcher()
-projection_repository = PlayerRepository()
-gamelog_repository = GamelogRepository()
-scheduled_matchup_repository = ScheduledMatchupRepository()
-gamelogs_repository = GamelogRepository()
-gamelogs_fetcher = GamelogsFetcher()
-player_weekly_projections_forecaster_service = PlayerWeeklyProjectionsForecasterService()
+players_router = APIRouter()
 
 
 @players_router.get("/api/v1/testing1")
-async def upsert_players():
+async def upsert_players(gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository)):
     try:
         gamelogs = gamelogs_repository.get_all_between_dates(datetime.utcnow() - timedelta(days=365), datetime.utcnow())
         return len(gamelogs)
@@ -44,7 +65,7 @@ async def upsert_players():
 
 
 @players_router.get("/api/v1/testing2")
-async def upsert_players():
+async def upsert_players(gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository)):
     try:
         gamelogs = gamelogs_repository.get_all_between_dates(datetime.utcnow() - timedelta(days=60), datetime.utcnow())
         return len(gamelogs)
@@ -53,44 +74,240 @@ async def upsert_players():
 
 
 @players_router.post("/api/v1/players")
-async def upsert_players():
+async def upsert_players(
+    player_repository: IPlayerRepository = Depends(get_player_repository),
+    players_fetcher: IPlayersFetcher = Depends(get_players_fetcher),
+    profile: JobProfile = Depends(job_profile("players_upserter")),
+):
     try:
-        await PlayersUpserterUseCase(player_repository, players_fetcher).execute()
-        return Response(status_code=200)
+        with profile:
+            await PlayersUpserterUseCase(player_repository, players_fetcher).execute()
+        if snapshots_enabled():
+            _publish_players_snapshot(player_repository)
+        return Response(status_code=200, headers=profile.headers)
     except Exception as e:
-        return Response(status_code=500, content=str(e))
+        return Response(status_code=500, content=str(e), headers=profile.headers)
 
 
 @players_router.get("/api/v1/players")
-async def get_players():
-    return [dict(player) for player in player_repository.get_all()]
+async def get_players(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    position: Optional[list[str]] = Query(None, title="Fantasy positions to include, i.e. PG,SG"),
+    team: Optional[list[str]] = Query(None, title="Team ids or abbreviations to include"),
+    injury_status: Optional[list[str]] = Query(None, title="Injury statuses to include, Healthy for none"),
+    available: Optional[bool] = Query(None, title="Only players on a team and not ruled out, or only the others"),
+    sort_by: str = Query(
+        "seasonProjections.pointsLeagueRanking",
+        title="The field to sort by, a seasonProjections, seasonTotals or weeklyProjections stat",
+    ),
+    descending: bool = Query(False, title="Whether to sort in descending order"),
+    limit: Optional[int] = Query(None, title="The maximum number of players to return"),
+    offset: int = Query(0, title="The number of players to skip"),
+    player_repository: IPlayerRepository = Depends(get_player_repository),
+):
+    player_query = PlayerQuery(
+        positions=_split_values(position),
+        teams=_split_values(team),
+        injuryStatuses=_split_values(injury_status),
+        isAvailable=available,
+        sortBy=sort_by,
+        descending=descending,
+        limit=limit,
+        offset=offset,
+    )
+    # The unfiltered players are served from the snapshot published by the players and projections jobs
+    is_snapshot_query = snapshots_enabled() and player_query == PlayerQuery()
+    if is_snapshot_query:
+        snapshot_response = snapshot_publisher.respond(request, PLAYERS_SNAPSHOT)
+        if snapshot_response is not None:
+            return snapshot_response
+
+    try:
+        players = QueryPlayersUseCase(player_repository).execute(player_query)
+    except ValueError as e:
+        return Response(status_code=400, content=str(e))
+    content = [dict(player) for player in players]
+    if is_snapshot_query:
+        background_tasks.add_task(snapshot_publisher.publish, PLAYERS_SNAPSHOT, content)
+    return content
+
+
+def _publish_players_snapshot(player_repository: IPlayerRepository) -> None:
+    """
+    Publishes the unfiltered players, once a job changed them.
+    """
+
+    players = QueryPlayersUseCase(player_repository).execute(PlayerQuery())
+    snapshot_publisher.publish(PLAYERS_SNAPSHOT, [dict(player) for player in players])
+
+
+def _split_values(values: Optional[list[str]]) -> Optional[list[str]]:
+    """
+    Flattens a repeated query parameter whose values may also be comma separated, i.e. ?position=PG,SG&position=C.
+    """
+
+    if not values:
+        return None
+    return [value.strip() for joined_values in values for value in joined_values.split(",") if value.strip()]
 
 
 @players_router.post("/api/v1/players/gamelogs")
-async def upsert_gamelogs(season: Optional[int] = Query(None)):
-    GamelogsUpserterUseCase(gamelogs_repository, gamelogs_fetcher).execute(season)
-    return Response(status_code=200)
+async def upsert_gamelogs(
+    season: Optional[int] = Query(None),
+    gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository),
+    gamelogs_fetcher: IGamelogsFetcher = Depends(get_gamelogs_fetcher),
+    splits_index: "SplitsIndex" = Depends(get_splits_index),
+    gamelogs_cache: BoundedCache = Depends(get_player_gamelogs_cache),
+    profile: JobProfile = Depends(job_profile("gamelogs_upserter")),
+):
+    with profile:
+        GamelogsUpserterUseCase(gamelogs_repository, gamelogs_fetcher, splits_index, gamelogs_cache).execute(season)
+    return Response(status_code=200, headers=profile.headers)
 
 
 @players_router.get("/api/v1/players/gamelogs")
-async def get_gamelogs():
+async def get_gamelogs(gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository)):
     return [dict(gamelog) for gamelog in gamelogs_repository.get_all()]
 
 
+@players_router.get("/api/v1/players/gamelogs/batch")
+async def get_players_gamelogs(
+    player_id: list[str] = Query(..., title="The player IDs, repeated or comma separated"),
+    season: int = Query(..., title="The season"),
+    last_n: Optional[int] = Query(None, title="Only each player's most recent games"),
+    fields: Optional[list[str]] = Query(None, title="The gamelog fields to return besides gameId and dateUTC"),
+    gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository),
+):
+    gamelogs_query = GamelogsBatchQuery(
+        playerIds=_split_values(player_id) or [], season=season, lastN=last_n, fields=_split_values(fields)
+    )
+    try:
+        players_games = GetPlayersGamelogsUseCase(gamelogs_repository).execute(gamelogs_query)
+    except ValueError as e:
+        return Response(status_code=400, content=str(e))
+
+    # Streamed as a JSON object of each player's games, one player at a time as they are read
+    def players_games_stream():
+        yield b"{"
+        for index, (games_player_id, games) in enumerate(players_games):
+            yield (b"," if index > 0 else b"") + orjson.dumps(games_player_id) + b":" + orjson.dumps(games)
+        yield b"}"
+
+    return StreamingResponse(players_games_stream(), media_type="application/json")
+
+
+@players_router.get("/api/v1/players/splits")
+async def get_player_splits(
+    player_id: Optional[list[str]] = Query(None, title="The player IDs, repeated or comma separated, all by default"),
+    last_games: Optional[int] = Query(None, title="Average each player's most recent games"),
+    last_days: Optional[int] = Query(None, title="Average the games of the last days, i.e. 7, 14 or 30"),
+    start_date: Optional[datetime] = Query(None, title="The start of the date range to average (inclusive)"),
+    end_date: Optional[datetime] = Query(None, title="The end of the date range to average (exclusive)"),
+    splits_index: "SplitsIndex" = Depends(get_splits_index),
+):
+    try:
+        splits = GetPlayerSplitsUseCase(splits_index).execute(
+            _split_values(player_id), last_games, last_days, start_date, end_date
+        )
+    except ValueError as e:
+        return Response(status_code=400, content=str(e))
+    return [split.model_dump() for split in splits]
+
+
 @players_router.get("/api/v1/players/{player_id}/gamelogs")
 async def get_gamelogs(
-    player_id: str = Path(..., title="The player ID"), season: int = Query(None, title="The season")
+    player_id: str = Path(..., title="The player ID"),
+    season: int = Query(None, title="The season"),
+    gamelogs_repository: IGamelogRepository = Depends(get_gamelog_repository),
+    gamelogs_cache: BoundedCache = Depends(get_player_gamelogs_cache),
 ):
-    return [dict(gamelog) for gamelog in gamelogs_repository.get_all_by_player_id_and_season(player_id, season)]
+    content = GetPlayerGamelogsUseCase(gamelogs_repository, gamelogs_cache).execute(player_id, season)
+    return Response(content=content, media_type="application/json")
 
 
 @players_router.post("/api/v1/players/projections")
-async def upsert_players():
-    PlayerWeeklyProjectionsForecasterUseCase(
-        player_repository,
-        gamelog_repository,
-        scheduled_matchup_repository,
-        projection_repository,
-        player_weekly_projections_forecaster_service,
-    ).execute()
-    return Response(status_code=200)
+async def upsert_players(
+    weeks: int = Query(1, ge=1, title="The number of weeks to forecast, starting with the current week"),
+    rest_of_season: bool = Query(False, title="Whether to forecast every remaining game of the season"),
+    incremental: bool = Query(False, title="Whether to only forecast the players whose inputs changed"),
+    player_repository: IPlayerRepository = Depends(get_player_repository),
+    gamelog_repository: IGamelogRepository = Depends(get_gamelog_repository),
+    scheduled_matchup_repository: IScheduledMatchupRepository = Depends(get_scheduled_matchup_repository),
+    projection_repository: IProjectionRepository = Depends(get_projection_repository),
+    player_weekly_projections_forecaster_service: IPlayerWeeklyProjectionsForecasterService = Depends(
+        get_player_weekly_projections_forecaster_service
+    ),
+    profile: JobProfile = Depends(job_profile("weekly_projections_forecaster")),
+):
+    with profile:
+        PlayerWeeklyProjectionsForecasterUseCase(
+            player_repository,
+            gamelog_repository,
+            scheduled_matchup_repository,
+            projection_repository,
+            player_weekly_projections_forecaster_service,
+        ).execute(weeks, rest_of_season, incremental)
+    if snapshots_enabled():
+        _publish_players_snapshot(player_repository)
+    return Response(status_code=200, headers=profile.headers)
+
+
+@players_router.get("/api/v1/players/projections")
+async def get_projections(
+    start_date: Optional[datetime] = Query(None, title="The start of the date range (inclusive), now by default"),
+    end_date: Optional[datetime] = Query(None, title="The end of the date range (exclusive)"),
+    player_id: Optional[str] = Query(None, title="The player ID"),
+    projection_repository: IProjectionRepository = Depends(get_projection_repository),
+):
+    projections = GetProjectionsUseCase(projection_repository).execute(start_date, end_date, player_id)
+    return [dict(projection) for projection in projections]
+
+
+@players_router.post("/api/v1/players/projections/weekly-scores")
+async def get_weekly_scores(
+    scoring_config: ScoringConfig,
+    limit: Optional[int] = Query(None, ge=1, title="The number of top ranked players to return"),
+    player_repository: IPlayerRepository = Depends(get_player_repository),
+    weekly_scoring_service: IWeeklyScoringService = Depends(get_weekly_scoring_service),
+    scores_cache: BoundedCache = Depends(get_weekly_scores_cache),
+):
+    try:
+        scores = GetWeeklyScoresUseCase(player_repository, weekly_scoring_service, scores_cache).execute(
+            scoring_config, limit
+        )
+    except ValueError as e:
+        return Response(status_code=400, content=str(e))
+    return [score.model_dump() for score in scores]
+
+
+@players_router.get("/api/v1/players/projections/live")
+async def stream_live_projections(player_id: Optional[str] = Query(None, title="Only stream this player's updates")):
+    async def event_stream():
+        queue = live_projections_broadcaster.subscribe()
+        try:
+            yield "retry: 15000\n\n"
+            while True:
+                try:
+                    event_player_id, event = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"  # Keeps proxies from closing an idle stream
+                    continue
+                if player_id is None or event_player_id == player_id:
+                    yield event
+        finally:
+            live_projections_broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@players_router.get("/api/v1/players/projections/backtest")
+async def backtest_projections(
+    start_date: Optional[datetime] = Query(None, title="The start of the backtested range (inclusive)"),
+    end_date: Optional[datetime] = Query(None, title="The end of the backtested range (exclusive), now by default"),
+    gamelog_repository: IGamelogRepository = Depends(get_gamelog_repository),
+    projections_backtester: IProjectionsBacktester = Depends(get_projections_backtester),
+):
+    return BacktestProjectionsUseCase(gamelog_repository, projections_backtester).execute(start_date, end_date)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Response, Path
+from fastapi.responses import FileResponse
+from src.infra.profiling import ProfileStore
+
+profiles_router = APIRouter()
+profile_store = ProfileStore()
+
+
+@profiles_router.get("/api/v1/profiles/{job_id}")
+async def get_profile(job_id: str = Path(..., title="The id of the profiled job")):
+    summary = profile_store.get_summary(job_id)
+    if summary is None:
+        return Response(status_code=404)
+    return summary
+
+
+@profiles_router.get("/api/v1/profiles/{job_id}/speedscope")
+async def get_profile_speedscope(job_id: str = Path(..., title="The id of the profiled job")):
+    if profile_store.get_summary(job_id) is None:
+        return Response(status_code=404)
+    return FileResponse(
+        profile_store.speedscope_path(job_id),
+        media_type="application/json",
+        filename=f"{job_id}.speedscope.json",
+    )
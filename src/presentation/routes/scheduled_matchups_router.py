@@ -1,31 +1,86 @@
-from fastapi import APIRouter, Response, Query
-from src.infra.persistence.repositories import ScheduledMatchupRepository
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Request, Response, Query, Depends
+from src.interfaces.repositories import IScheduledMatchupRepository
+from src.interfaces.external import IScheduledMatchupsFetcherService
 from src.app.use_cases.scheduled_matchups.queries.get_scheduled_matchups_use_case import GetScheduledMatchupsUseCase
 from src.domain.entities.scheduled_matchup_entity import ScheduledMatchupEntity
-from src.infra.external import ScheduledMatchupsFetcherService
 from src.app.use_cases.scheduled_matchups import ScheduledMatchupsUpserterUseCase
+from src.app.caching import ScheduleIndex
+from src.presentation.job_profiling import JobProfile, job_profile
+from src.presentation.snapshots import SCHEDULES_SNAPSHOT, snapshot_publisher, snapshots_enabled
+from src.presentation.dependencies import (
+    get_scheduled_matchup_repository,
+    get_scheduled_matchups_fetcher,
+    get_schedule_index,
+)
 
 scheduled_matchups_router = APIRouter()
-scheduled_matchup_repository = ScheduledMatchupRepository()
-weekly_matchups_fetcher = ScheduledMatchupsFetcherService()
 
 
 @scheduled_matchups_router.get("/api/v1/matchups/schedules")
-async def get_scheduled_matchups(is_current_week: str = Query(None)):
-    get_scheduled_matchups_use_case = GetScheduledMatchupsUseCase(scheduled_matchup_repository)
+async def get_scheduled_matchups(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    is_current_week: str = Query(None),
+    scheduled_matchup_repository: IScheduledMatchupRepository = Depends(get_scheduled_matchup_repository),
+    schedule_index: ScheduleIndex = Depends(get_schedule_index),
+):
+    # The whole season's schedule is served from the snapshot published by the scheduled matchups job
+    is_snapshot_query = snapshots_enabled() and not bool(is_current_week)
+    if is_snapshot_query:
+        snapshot_response = snapshot_publisher.respond(request, SCHEDULES_SNAPSHOT)
+        if snapshot_response is not None:
+            return snapshot_response
+
+    get_scheduled_matchups_use_case = GetScheduledMatchupsUseCase(scheduled_matchup_repository, schedule_index)
     scheduled_matchups = []
     if bool(is_current_week):
         scheduled_matchups: list[ScheduledMatchupEntity] = get_scheduled_matchups_use_case.get_current_week()
     else:
         scheduled_matchups: list[ScheduledMatchupEntity] = get_scheduled_matchups_use_case.get_all()
-    return [dict(scheduled_matchup) for scheduled_matchup in scheduled_matchups]
+    content = [dict(scheduled_matchup) for scheduled_matchup in scheduled_matchups]
+    if is_snapshot_query:
+        background_tasks.add_task(snapshot_publisher.publish, SCHEDULES_SNAPSHOT, content)
+    return content
+
+
+@scheduled_matchups_router.get("/api/v1/matchups/schedules/team-weeks")
+async def get_team_week_schedules(
+    start_date: Optional[date] = Query(None, title="A day of the first week, today by default"),
+    weeks: int = Query(1, ge=1, le=30, title="The number of weeks"),
+    scheduled_matchup_repository: IScheduledMatchupRepository = Depends(get_scheduled_matchup_repository),
+    schedule_index: ScheduleIndex = Depends(get_schedule_index),
+):
+    team_week_schedules = GetScheduledMatchupsUseCase(scheduled_matchup_repository, schedule_index).get_team_weeks(
+        start_date, weeks
+    )
+    return [team_week_schedule.model_dump() for team_week_schedule in team_week_schedules]
 
 
 @scheduled_matchups_router.post("/api/v1/matchups/schedules")
-async def upsert_scheduled_matchups():
+async def upsert_scheduled_matchups(
+    scheduled_matchup_repository: IScheduledMatchupRepository = Depends(get_scheduled_matchup_repository),
+    weekly_matchups_fetcher: IScheduledMatchupsFetcherService = Depends(get_scheduled_matchups_fetcher),
+    schedule_index: ScheduleIndex = Depends(get_schedule_index),
+    profile: JobProfile = Depends(job_profile("scheduled_matchups_upserter")),
+):
     try:
-        scheduled_matchups_upserter_use_case = ScheduledMatchupsUpserterUseCase(scheduled_matchup_repository, weekly_matchups_fetcher)
-        scheduled_matchups_upserter_use_case.execute()
-        return Response(status_code=200)
+        scheduled_matchups_upserter_use_case = ScheduledMatchupsUpserterUseCase(
+            scheduled_matchup_repository, weekly_matchups_fetcher, schedule_index
+        )
+        with profile:
+            schedule_diff = scheduled_matchups_upserter_use_case.execute()
+        if snapshots_enabled():
+            scheduled_matchups = GetScheduledMatchupsUseCase(scheduled_matchup_repository, schedule_index).get_all()
+            snapshot_publisher.publish(
+                SCHEDULES_SNAPSHOT, [dict(scheduled_matchup) for scheduled_matchup in scheduled_matchups]
+            )
+        return Response(
+            status_code=200,
+            content=schedule_diff.model_dump_json(),
+            media_type="application/json",
+            headers=profile.headers,
+        )
     except Exception as e:
-        return Response(status_code=500, content=str(e))
+        return Response(status_code=500, content=str(e), headers=profile.headers)
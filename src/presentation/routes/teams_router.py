@@ -1,16 +1,17 @@
-from fastapi import APIRouter, Response
-from src.infra.persistence.repositories import TeamRepository
-from src.infra.external import TeamsFetcher
+from fastapi import APIRouter, Response, Depends
+from src.interfaces.repositories import ITeamRepository
+from src.interfaces.external import ITeamsFetcherService
 from src.app.use_cases.teams.commands.upsert_teams_use_case import UpsertTeamsUseCase
+from src.presentation.dependencies import get_team_repository, get_teams_fetcher
 
 teams_router = APIRouter()
 
-teams_repository = TeamRepository()
-teams_fetcher = TeamsFetcher()
-
 
 @teams_router.post("/api/v1/teams")
-async def upsert_scheduled_matchups():
+async def upsert_scheduled_matchups(
+    teams_repository: ITeamRepository = Depends(get_team_repository),
+    teams_fetcher: ITeamsFetcherService = Depends(get_teams_fetcher),
+):
     use_case = UpsertTeamsUseCase(teams_repository, teams_fetcher)
     use_case.execute()
     return Response(status_code=200)
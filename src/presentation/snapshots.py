@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+from typing import Any, Optional
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse
+from src.infra.snapshots import SnapshotStore, ENCODING_SUFFIXES
+from src.infra.environment import env_flag
+
+# The snapshots of the read endpoints whose data only changes when a write job runs
+PLAYERS_SNAPSHOT = "players"  # GET /api/v1/players, without filters
+SCHEDULES_SNAPSHOT = "schedules"  # GET /api/v1/matchups/schedules, the whole season
+
+
+class SnapshotPublisher:
+    """
+    Serves hot read endpoints from snapshots of their responses, published by the write jobs that change them.
+
+    A snapshot is served as a file in the best content encoding the client accepts, with its content hash as
+    ETag, so that clients revalidating an unchanged response get a 304 without a body. Reading a snapshot never
+    touches MongoDB or builds an entity.
+
+    A snapshot is only served for max_age_seconds after it was published. Past that, or before the first job
+    ran, the route reads the database as usual and the snapshot is published again, which also bounds how long
+    instances that don't share the snapshots directory serve the data from before another instance's job.
+
+    :param snapshot_store SnapshotStore: Where the snapshots are published.
+    :param max_age_seconds float: How long a snapshot is served, SNAPSHOTS_MAX_AGE_SECONDS or 15 minutes by default.
+    """
+
+    def __init__(self, snapshot_store: SnapshotStore = None, max_age_seconds: float = None):
+        self._snapshot_store = snapshot_store or SnapshotStore()
+        self._max_age_seconds = max_age_seconds or float(os.getenv("SNAPSHOTS_MAX_AGE_SECONDS", "900"))
+        self._publishing: set[str] = set()
+        self._expired_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, name: str, content: Any) -> None:
+        """
+        Serializes a response body and publishes it as a snapshot, unless the snapshot is already being
+        published, i.e. by a concurrent request.
+
+        :param name str: The name of the snapshot, i.e. PLAYERS_SNAPSHOT.
+        :param content Any: The response body, as returned by the route.
+        """
+
+        with self._lock:
+            if name in self._publishing:
+                return
+            self._publishing.add(name)
+        try:
+            self._snapshot_store.publish(name, orjson.dumps(jsonable_encoder(content)))
+        except Exception as e:
+            print(f"Error publishing the {name} snapshot: {e}")
+        finally:
+            with self._lock:
+                self._publishing.discard(name)
+
+    def expire(self, name: str) -> None:
+        """
+        Stops serving a snapshot until it is published again, i.e. after another instance changed its data.
+
+        :param name str: The name of the snapshot.
+        """
+
+        self._expired_at[name] = time.time()
+
+    def respond(self, request: Request, name: str) -> Optional[Response]:
+        """
+        Responds to a request with a snapshot.
+
+        :param request Request: The request, whose If-None-Match and Accept-Encoding headers are honored.
+        :param name str: The name of the snapshot.
+        :return: A 304 if the client has the snapshot, the snapshot's file otherwise, or None if there is no
+            fresh snapshot to serve.
+        :rtype: Optional[Response]
+        """
+
+        metadata: Optional[dict] = self._snapshot_store.get(name)
+        if metadata is None or time.time() - metadata["publishedAt"] > self._max_age_seconds:
+            return None
+        if metadata["publishedAt"] < self._expired_at.get(name, 0.0):
+            return None
+
+        headers = {"ETag": metadata["etag"], "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if _matches_etag(request.headers.get("if-none-match"), metadata["etag"]):
+            return Response(status_code=304, headers=headers)
+
+        encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return FileResponse(
+            self._snapshot_store.path(name, encoding, metadata["hash"]), media_type="application/json", headers=headers
+        )
+
+
+def _matches_etag(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _negotiate_encoding(accept_encoding: str) -> str:
+    """
+    Picks the preferred encoding of ENCODING_SUFFIXES the client accepts, i.e. br for "gzip, deflate, br".
+    """
+
+    accepted: dict[str, float] = {}
+    for coding in accept_encoding.lower().split(","):
+        token, _, parameters = coding.strip().partition(";")
+        quality = 1.0
+        if parameters.strip().startswith("q="):
+            try:
+                quality = float(parameters.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip()] = quality
+
+    for encoding in ENCODING_SUFFIXES:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0 and encoding != "identity":
+            return encoding
+    return "identity"
+
+
+def snapshots_enabled() -> bool:
+    """
+    Whether the hot read endpoints are served from snapshots, set by the SNAPSHOTS_ENABLED environment variable.
+    """
+
+    return env_flag("SNAPSHOTS_ENABLED")
+
+
+snapshot_publisher = SnapshotPublisher()
@@ -0,0 +1,42 @@
+import threading
+from datetime import datetime
+from benchmarks.run_benchmarks import SCALES, build_league
+from src.app.monitoring import trace_stage
+from src.infra.projections_model import PlayerWeeklyProjectionsForecasterService
+
+
+def test_parallel_forecast_while_other_threads_record_metrics():
+    # The pool forks while other threads hold the metrics' lock, as the live projections worker and the MongoDB
+    # command listener do, so a forked worker taking that lock would never return
+    league = build_league(SCALES["small"])
+    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    week_matchups = [matchup for matchup in league["matchups"] if matchup.dateTimeUTC >= now]
+    forecaster_service = PlayerWeeklyProjectionsForecasterService(workers=4)
+    stopped = threading.Event()
+
+    def record_metrics():
+        while not stopped.is_set():
+            with trace_stage("live_projections_updater", "mongo_write"):
+                pass
+
+    def forecast():
+        results.append(forecaster_service.execute(league["gamelogs"], week_matchups, league["players"]))
+
+    recording_threads = [threading.Thread(target=record_metrics, daemon=True) for _ in range(2)]
+    for thread in recording_threads:
+        thread.start()
+    results: list = []
+    try:
+        for _ in range(3):
+            forecasting_thread = threading.Thread(target=forecast, daemon=True)
+            forecasting_thread.start()
+            forecasting_thread.join(timeout=60)
+            assert not forecasting_thread.is_alive(), "The parallel forecast hung in a forked worker"
+    finally:
+        stopped.set()
+
+    serial = PlayerWeeklyProjectionsForecasterService(workers=1).execute(
+        league["gamelogs"], week_matchups, league["players"]
+    )
+    for parallel in results:
+        assert [dict(projection) for projection in parallel] == [dict(projection) for projection in serial]
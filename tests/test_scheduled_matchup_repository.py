@@ -0,0 +1,51 @@
+import mongomock
+from src.domain.entities import ScheduledMatchupEntity, TeamEntity
+from src.infra.persistence.repositories import ScheduledMatchupRepository
+
+CELTICS = TeamEntity(teamId="1610612738", abbreviation="BOS", location="Boston", name="Celtics")
+LAKERS = TeamEntity(teamId="1610612747", abbreviation="LAL", location="Los Angeles", name="Lakers")
+
+
+def _matchup(game_id: str, date_time_utc: str) -> ScheduledMatchupEntity:
+    return ScheduledMatchupEntity(gameId=game_id, dateTimeUTC=date_time_utc, homeTeam=CELTICS, awayTeam=LAKERS)
+
+
+def _repository() -> ScheduledMatchupRepository:
+    repository = ScheduledMatchupRepository()
+    repository._scheduled_matchups_collection = mongomock.MongoClient().db.scheduled_matchups
+    return repository
+
+
+def test_sync_many_keeps_the_games_of_previous_seasons():
+    repository = _repository()
+    repository.sync_many(
+        [_matchup("0022300001", "2023-10-24T23:30:00Z"), _matchup("0022300002", "2024-04-14T23:30:00Z")]
+    )
+
+    diff = repository.sync_many(
+        [_matchup("0022400001", "2024-10-22T23:30:00Z"), _matchup("0022400002", "2025-04-13T23:30:00Z")]
+    )
+
+    assert diff.removedGameIds == []
+    stored_game_ids = {matchup.gameId for matchup in repository.get_scheduled_matchups()}
+    assert stored_game_ids == {"0022300001", "0022300002", "0022400001", "0022400002"}
+
+
+def test_sync_many_removes_the_games_dropped_from_the_fetched_season():
+    repository = _repository()
+    repository.sync_many(
+        [
+            _matchup("0022400001", "2024-10-22T23:30:00Z"),
+            _matchup("0022400002", "2024-12-25T17:00:00Z"),
+            _matchup("0022400003", "2025-04-13T23:30:00Z"),
+        ]
+    )
+
+    diff = repository.sync_many(
+        [_matchup("0022400001", "2024-10-22T23:30:00Z"), _matchup("0022400003", "2025-04-13T23:30:00Z")]
+    )
+
+    assert diff.removedGameIds == ["0022400002"]
+    assert diff.affectedTeamIds == sorted([CELTICS.teamId, LAKERS.teamId])
+    stored_game_ids = {matchup.gameId for matchup in repository.get_scheduled_matchups()}
+    assert stored_game_ids == {"0022400001", "0022400003"}